@@ -1,221 +1,167 @@
+import os
 import pygame
 import sys
-from collections import deque
-import random
 
-# --- 초기화 ---
-pygame.init()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 공용 모듈(common) 경로
 
-# --- 상수 정의 ---
-# 화면 크기
-SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 700
-HEADER_HEIGHT = 100
+from rolling_engine import board_geometry, DEFAULT_GEOMETRY
+from ttt_core import GameSession
+from tablebase import TablebaseLoader
+from mcts import MCTSPlayer
+from renderer import BoardRenderer, BG_COLOR, CELL_SIZE, FPS, HEADER_HEIGHT, screen_layout
+from common.display import ResizeDebouncer, apply_window_size, open_window
+from common.loop import FrameScheduler
+from common.profiler import FrameProfiler
+from common.profiler_overlay import ProfilerOverlay
 
-# 보드 크기 및 셀 크기
+# --- 상수 정의 ---
+# 보드 크기와 규칙 (N×N 보드, K목, 플레이어별 최대 말 개수)
 BOARD_ROWS = 3
 BOARD_COLS = 3
-CELL_SIZE = SCREEN_WIDTH // BOARD_COLS
-
-# 색상 (깔끔한 테마로 변경)
-BG_COLOR = (28, 170, 156)
-LINE_COLOR = (23, 145, 135)
-WHITE = (255, 255, 255)
-X_COLOR = (84, 84, 84)
-O_COLOR = (242, 235, 211)
-BUTTON_COLOR = (220, 220, 220)
-BUTTON_TEXT_COLOR = (50, 50, 50)
-
+WIN_LENGTH = 3
+MAX_PIECES = 3
 
-# 선 두께
-LINE_WIDTH = 15
-MARKER_WIDTH = 15
-WIN_LINE_WIDTH = 10
+# 기준 화면 크기 (셀 크기와 상단 영역 높이는 renderer 의 기준 값, 창 크기가 다르면 screen_layout 이 맞춤)
+SCREEN_WIDTH = CELL_SIZE * BOARD_COLS
+SCREEN_HEIGHT = HEADER_HEIGHT + CELL_SIZE * BOARD_ROWS
 
-# --- 화면 설정 ---
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption('Pygame 순환 틱택토')
+# 컴퓨터 플레이어 설정
+AI_PLAYER = -1        # 컴퓨터가 맡을 플레이어 (O)
+AI_THINK_TIME = 1.0   # 한 수에 생각할 시간 (초)
 
-# --- 폰트 설정 ---
-font = pygame.font.SysFont("malgun gothic", 50, bold=True)
-button_font = pygame.font.SysFont("malgun gothic", 40)
-small_font = pygame.font.SysFont("malgun gothic", 30)
+# 테이블베이스를 처음 만드는 동안 상단에 표시할 문구
+HINT_PENDING_MESSAGE = '힌트 준비 중...'
 
-# --- 게임 변수 ---
-board = [[0] * BOARD_COLS for _ in range(BOARD_ROWS)] # 0: 빈 칸, 1: 플레이어 1(X), -1: 플레이어 2(O)
-player = random.choice([1, -1])  # 시작 플레이어를 랜덤으로 설정
-winner = 0  # 0: 게임 중, 1: 플레이어 1 승, -1: 플레이어 2 승
-game_over = False
-win_line_info = None
-
-# 새로운 규칙: 각 플레이어의 말 위치를 순서대로 저장 (최대 3개)
-player_moves = {1: deque(), -1: deque()} # 1: X, -1: O
-
-# '다시 시작' 버튼 Rect
-button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 - 25, 250, 60)
+# 게임 기록을 저장할 폴더
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'replays')
 
 
 # --- 함수 정의 ---
 
-def draw_grid():
-    """격자무늬를 그리는 함수"""
-    screen.fill(BG_COLOR)
-    pygame.draw.rect(screen, LINE_COLOR, (0, 0, SCREEN_WIDTH, HEADER_HEIGHT))
-    for i in range(1, BOARD_ROWS):
-        pygame.draw.line(screen, LINE_COLOR, (0, i * CELL_SIZE + HEADER_HEIGHT), (SCREEN_WIDTH, i * CELL_SIZE + HEADER_HEIGHT), LINE_WIDTH)
-    for i in range(1, BOARD_COLS):
-        pygame.draw.line(screen, LINE_COLOR, (i * CELL_SIZE, HEADER_HEIGHT), (i * CELL_SIZE, SCREEN_HEIGHT), LINE_WIDTH)
-
-def draw_markers():
-    """보드 상태에 따라 'O'와 'X'를 그리고, 사라질 말을 깜빡이는 함수"""
-    
-    # 현재 턴인 플레이어의 말이 3개일 경우, 가장 오래된 말을 찾음
-    oldest_move = None
-    if len(player_moves[player]) == 3 and not game_over:
-        oldest_move = player_moves[player][0]
-
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            is_oldest = (oldest_move is not None and oldest_move == (row, col))
-
-            # 깜빡임 효과: is_oldest가 True일 때, 시간에 따라 그릴지 말지 결정
-            if is_oldest and (pygame.time.get_ticks() // 400) % 2 == 0:
-                continue # 이번 프레임에서는 그리지 않고 건너뜀
-
-            y_pos = row * CELL_SIZE + HEADER_HEIGHT
-            x_pos = col * CELL_SIZE
-
-            if board[row][col] == 1: # 플레이어 1 (X)
-                pygame.draw.line(screen, X_COLOR, (x_pos + 40, y_pos + 40), 
-                                 (x_pos + CELL_SIZE - 40, y_pos + CELL_SIZE - 40), MARKER_WIDTH)
-                pygame.draw.line(screen, X_COLOR, (x_pos + 40, y_pos + CELL_SIZE - 40), 
-                                 (x_pos + CELL_SIZE - 40, y_pos + 40), MARKER_WIDTH)
-            elif board[row][col] == -1: # 플레이어 2 (O)
-                pygame.draw.circle(screen, O_COLOR, (x_pos + CELL_SIZE // 2, y_pos + CELL_SIZE // 2), CELL_SIZE // 2 - 40, MARKER_WIDTH)
-
-def check_winner():
-    """승리 조건을 확인하고 게임 상태를 업데이트하는 함수"""
-    global winner, game_over, win_line_info
-    
-    # 가로 확인
-    for i in range(BOARD_ROWS):
-        if board[i][0] == board[i][1] == board[i][2] and board[i][0] != 0:
-            winner = board[i][0]
-            win_line_info = ('row', i)
-            game_over = True
-            return
-
-    # 세로 확인
-    for i in range(BOARD_COLS):
-        if board[0][i] == board[1][i] == board[2][i] and board[0][i] != 0:
-            winner = board[0][i]
-            win_line_info = ('col', i)
-            game_over = True
-            return
-
-    # 대각선 확인 (왼쪽 위 -> 오른쪽 아래)
-    if board[0][0] == board[1][1] == board[2][2] and board[0][0] != 0:
-        winner = board[0][0]
-        win_line_info = ('diag', 1)
-        game_over = True
-        return
-
-    # 대각선 확인 (오른쪽 위 -> 왼쪽 아래)
-    if board[0][2] == board[1][1] == board[2][0] and board[0][2] != 0:
-        winner = board[0][2]
-        win_line_info = ('diag', 2)
-        game_over = True
-        return
-
-def draw_win_line(win_info):
-    """승리 라인을 그리는 함수"""
-    line_type, index = win_info
-    win_color = X_COLOR if winner == 1 else O_COLOR
-    
-    if line_type == 'row':
-        y_pos = index * CELL_SIZE + CELL_SIZE // 2 + HEADER_HEIGHT
-        pygame.draw.line(screen, win_color, (15, y_pos), (SCREEN_WIDTH - 15, y_pos), WIN_LINE_WIDTH)
-    elif line_type == 'col':
-        x_pos = index * CELL_SIZE + CELL_SIZE // 2
-        pygame.draw.line(screen, win_color, (x_pos, HEADER_HEIGHT + 15), (x_pos, SCREEN_HEIGHT - 15), WIN_LINE_WIDTH)
-    elif line_type == 'diag':
-        if index == 1:
-            pygame.draw.line(screen, win_color, (15, HEADER_HEIGHT + 15), (SCREEN_WIDTH - 15, SCREEN_HEIGHT - 15), WIN_LINE_WIDTH)
-        else:
-            pygame.draw.line(screen, win_color, (SCREEN_WIDTH - 15, HEADER_HEIGHT + 15), (15, SCREEN_HEIGHT - 15), WIN_LINE_WIDTH)
-
-def draw_ui_elements():
-    """상태 메시지와 UI 요소를 그리는 함수"""
-    if game_over:
-        message = f'플레이어 {"1 (X)" if winner == 1 else "2 (O)"} 승리!'
-    else:
-        current_player_marker = "X" if player == 1 else "O"
-        message = f"플레이어 {current_player_marker} 턴 (말 {len(player_moves[player])}/3개)"
-
-    text = font.render(message, True, WHITE)
-    text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, HEADER_HEIGHT // 2))
-    screen.blit(text, text_rect)
-
-    if game_over:
-        pygame.draw.rect(screen, BUTTON_COLOR, button_rect, border_radius=10)
-        btn_text = button_font.render('다시 시작', True, BUTTON_TEXT_COLOR)
-        btn_text_rect = btn_text.get_rect(center=button_rect.center)
-        screen.blit(btn_text, btn_text_rect)
-
-def reset_game():
-    """게임을 초기 상태로 리셋하는 함수"""
-    global board, player, winner, game_over, win_line_info
-    board = [[0] * BOARD_COLS for _ in range(BOARD_ROWS)]
-    player = random.choice([1, -1]) # 재시작 시 플레이어를 랜덤으로 설정
-    winner = 0
-    game_over = False
-    win_line_info = None
-    player_moves[1].clear()
-    player_moves[-1].clear()
-
-# --- 메인 게임 루프 ---
-running = True
-while running:
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouseX, mouseY = event.pos
-            
-            if game_over:
-                if button_rect.collidepoint(event.pos):
-                    reset_game()
-            else:
-                if mouseY > HEADER_HEIGHT:
-                    clicked_row = (mouseY - HEADER_HEIGHT) // CELL_SIZE
-                    clicked_col = mouseX // CELL_SIZE
-
-                    if board[clicked_row][clicked_col] == 0:
-                        # 새로운 규칙 적용
-                        current_player_moves = player_moves[player]
-
-                        if len(current_player_moves) == 3:
-                            oldest_move = current_player_moves.popleft()
-                            old_row, old_col = oldest_move
-                            board[old_row][old_col] = 0
-
-                        board[clicked_row][clicked_col] = player
-                        current_player_moves.append((clicked_row, clicked_col))
-                        
-                        check_winner()
-
-                        if not game_over:
-                            player *= -1
-
-    draw_grid()
-    draw_markers()
-    if game_over and win_line_info:
-        draw_win_line(win_line_info)
-    draw_ui_elements()
-    pygame.display.update()
-
-pygame.quit()
-sys.exit()
-
+def main():
+    """창을 열고 게임 루프를 실행하는 함수"""
+    # --- 초기화 ---
+    pygame.init()
+
+    # --- 화면 설정 (화면 배율에 맞춘 크기로 열고, 크기를 바꿀 수 있음) ---
+    screen = open_window((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption('Pygame 순환 틱택토')
+
+    # --- 게임 변수 ---
+    # 보드 상태와 각 플레이어의 말 순서(최대 MAX_PIECES개), 게임 기록은 세션이 관리
+    geometry = board_geometry(BOARD_ROWS, BOARD_COLS, WIN_LENGTH, MAX_PIECES)
+    session = GameSession(geometry, replay_dir=REPLAY_DIR)
+
+    # 프레임 구간별 시간 측정 ('F3' 키로 표시, GAME_PROFILE 환경 변수에 파일 경로를 주면 주기적으로 내보냄)
+    profiler = FrameProfiler.from_env()
+    overlay = ProfilerOverlay(profiler, target_fps=FPS)
+
+    # 입력, 깜빡임, 컴퓨터의 수가 있을 때만 깨어나 한 프레임을 처리하는 루프 스케줄러
+    scheduler = FrameScheduler(FPS, profiler)
+
+    # MCTS 컴퓨터 플레이어 ('A' 키로 켜고 끔). 탐색은 백그라운드 스레드에서 진행하고 끝나면 루프를 깨움
+    ai = MCTSPlayer(AI_THINK_TIME, on_done=scheduler.notify)
+    ai_enabled = True
+
+    # 완전 분석된 테이블베이스 (기본 3×3 규칙 전용). 첫 'H' 힌트 때 열고, 파일이 없으면 백그라운드에서
+    # 한 번 만들어 저장한 뒤 루프를 깨워 기다리던 힌트를 표시함 (미리 만들려면 python tablebase.py)
+    tables = TablebaseLoader(on_done=scheduler.notify) if geometry is DEFAULT_GEOMETRY else None
+    hint_pending = False
+
+    # 격자와 말을 미리 그려 두고 바뀐 영역만 다시 그리는 렌더러 (창 크기가 멈추면 새 크기에 맞춰 다시 만듦)
+    renderer = BoardRenderer(screen, geometry, *screen_layout(screen.get_size(), geometry), profiler=profiler)
+    overlay.topleft = (8, renderer.header_height + 8)
+    resizer = ResizeDebouncer(BG_COLOR)
+
+    # --- 메인 게임 루프 ---
+    running = True
+    while running:
+        events = scheduler.wait()
+
+        with profiler.phase('events'):
+            for event in events:
+                if overlay.handle_event(event) or resizer.handle_event(event):
+                    continue
+
+                if event.type == pygame.WINDOWEXPOSED:
+                    # 매 프레임 그리지 않으므로 창이 다시 드러나면 전체를 다시 그림
+                    renderer.invalidate()
+
+                if event.type == pygame.QUIT:
+                    running = False
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_h and tables is not None:
+                    table = tables.get()
+                    if table is not None:
+                        session.request_hint(table)
+                    else:
+                        hint_pending = tables.loading
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+                    ai_enabled = not ai_enabled
+                    ai.cancel()
+
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if session.game_over:
+                        if renderer.button_rect.collidepoint(event.pos):
+                            ai.cancel()
+                            session.reset()
+                    elif not (ai_enabled and session.player == AI_PLAYER):
+                        clicked_cell = renderer.cell_at(event.pos)
+
+                        if clicked_cell is not None and session.engine.cell_owner(clicked_cell) == 0:
+                            session.apply_move(clicked_cell)
+
+        # 창 크기가 잠깐 멈췄으면 새 크기에 맞춰 격자, 말, 글자를 다시 만듦
+        size = resizer.poll()
+        if size is not None:
+            with profiler.phase('resize'):
+                screen = apply_window_size(size)
+                renderer.resize(screen, *screen_layout(screen.get_size(), geometry))
+                overlay.topleft = (8, renderer.header_height + 8)
+
+        # 테이블베이스를 다 만들었으면 기다리던 힌트를 표시
+        if hint_pending and not tables.loading:
+            hint_pending = False
+            session.request_hint(tables.table)
+
+        # 컴퓨터 차례: 백그라운드 탐색을 시작하고, 끝났으면 고른 수를 둠
+        with profiler.phase('ai'):
+            if ai_enabled and not session.game_over and session.player == AI_PLAYER:
+                if not ai.thinking:
+                    ai.start(session.engine)
+                else:
+                    ai_move = ai.poll()
+                    if ai_move is not None:
+                        session.apply_move(ai_move)
+
+        # 바뀐 칸과 문구 영역만 다시 그려서 화면에 반영 (측정 오버레이가 가렸던 영역은 먼저 되돌림)
+        # 창 크기가 바뀌는 중에는 새 배치를 만들 때까지 그리지 않음
+        if not resizer.pending:
+            restored = overlay.restore(screen)
+            message = session.status_message(AI_PLAYER if ai_enabled else None)
+            if hint_pending:
+                message = HINT_PENDING_MESSAGE
+            dirty_rects = renderer.render(session.engine, message, session.hint_cell)
+            for rect in (restored, overlay.draw(screen)):
+                if rect is not None:
+                    dirty_rects.append(rect)
+            if dirty_rects:
+                with profiler.phase('display'):
+                    pygame.display.update(dirty_rects)
+
+        # 다음에 화면이 바뀔 때(가장 오래된 말의 깜빡임, 측정 표 갱신, 창 크기 반영) 깨어나도록 예약
+        scheduler.wake_in(renderer.next_change(session.engine))
+        scheduler.wake_in(overlay.next_refresh())
+        scheduler.wake_in(resizer.remaining())
+        profiler.end_frame()
+
+    ai.cancel()
+    session.close()
+    profiler.close()
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""순환 틱택토 AI 플레이어(에이전트) 모음.
+
+모든 에이전트는 select_move(board, rng) 하나만 구현하면 됩니다. board 는 RollingBoard 이며,
+에이전트는 play()/undo() 로 탐색할 수 있지만 돌려줄 때는 원래 상태로 되돌려 놓아야 합니다.
+"""
+import math
+
+from mcts import MCTS
+
+
+class Agent:
+    """모든 에이전트의 기본 클래스"""
+    name = 'agent'
+
+    def select_move(self, board, rng):
+        """board 에서 둘 칸의 인덱스를 반환합니다."""
+        raise NotImplementedError
+
+    def reset(self):
+        """새 게임을 시작할 때 호출됩니다. 내부 상태가 있는 에이전트만 재정의합니다."""
+
+
+class RandomAgent(Agent):
+    """빈 칸 중 하나를 무작위로 고르는 에이전트"""
+    name = 'random'
+
+    def select_move(self, board, rng):
+        return rng.choice(board.legal_moves())
+
+
+class GreedyAgent(Agent):
+    """바로 이기는 수를 두고, 없으면 상대의 즉시 승리를 허용하지 않는 수 중에서 고르는 에이전트"""
+    name = 'greedy'
+
+    def select_move(self, board, rng):
+        safe_moves = []
+        moves = board.legal_moves()
+        for cell in moves:
+            board.play(cell)
+            if board.winner:
+                board.undo()
+                return cell
+            if not _has_winning_move(board):
+                safe_moves.append(cell)
+            board.undo()
+        return rng.choice(safe_moves or moves)
+
+
+def _has_winning_move(board):
+    """차례인 플레이어에게 바로 이기는 수가 있는지 확인합니다."""
+    for cell in board.legal_moves():
+        board.play(cell)
+        won = board.winner != 0
+        board.undo()
+        if won:
+            return True
+    return False
+
+
+class MinimaxAgent(Agent):
+    """깊이 제한 알파-베타(네가맥스) 탐색 에이전트"""
+    name = 'minimax'
+    WIN_SCORE = 1000
+
+    def __init__(self, depth=4):
+        """탐색할 최대 수(깊이)를 받아 초기화합니다."""
+        self.depth = depth
+
+    def select_move(self, board, rng):
+        moves = list(board.legal_moves())
+        rng.shuffle(moves)  # 같은 점수의 수 중에서는 무작위로 고르기 위해 섞음
+        best_cell, alpha = moves[0], -math.inf
+        for cell in moves:
+            board.play(cell)
+            score = -self._negamax(board, self.depth - 1, -math.inf, -alpha, 1)
+            board.undo()
+            if score > alpha:
+                best_cell, alpha = cell, score
+        return best_cell
+
+    def _negamax(self, board, depth, alpha, beta, ply):
+        """차례인 플레이어 기준 점수를 반환합니다. 빨리 이길수록, 늦게 질수록 점수가 큽니다."""
+        if board.winner:
+            return -(self.WIN_SCORE - ply)  # 직전 수로 상대가 이긴 상태
+        if depth <= 0:
+            return _evaluate(board)
+        best = -math.inf
+        for cell in board.legal_moves():
+            board.play(cell)
+            score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.undo()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
+
+
+def _evaluate(board):
+    """한 칸만 비고 나머지가 모두 채워진 라인 수의 차이로 차례인 플레이어 기준 점수를 매깁니다."""
+    mine, theirs = board.mask(board.player), board.mask(-board.player)
+    needed = board.geometry.win_length - 1
+    score = 0
+    for line in board.geometry.line_masks:
+        if not line & theirs and bin(line & mine).count('1') == needed:
+            score += 1
+        elif not line & mine and bin(line & theirs).count('1') == needed:
+            score -= 1
+    return score
+
+
+class MCTSAgent(Agent):
+    """전치표를 쓰는 UCT 몬테카를로 트리 탐색 에이전트 (수마다 정해진 횟수만큼 시뮬레이션)"""
+    name = 'mcts'
+
+    def __init__(self, iterations=200, **search_options):
+        """수마다 시뮬레이션 횟수와 MCTS 설정을 받아 초기화합니다."""
+        self.iterations = iterations
+        self.search = MCTS(**search_options)
+
+    def reset(self):
+        # 경기 결과가 이전 경기에 좌우되지 않도록 전치표를 비움
+        self.search.clear()
+
+    def select_move(self, board, rng):
+        self.search.rng = rng
+        return self.search.search(board, iterations=self.iterations)
+
+
+AGENT_TYPES = {
+    RandomAgent.name: RandomAgent,
+    GreedyAgent.name: GreedyAgent,
+    MinimaxAgent.name: MinimaxAgent,
+    MCTSAgent.name: MCTSAgent,
+}
+
+
+def make_agent(spec):
+    """'minimax:3', 'mcts:500' 처럼 '이름:인자' 형식의 문자열로 에이전트를 만듭니다."""
+    name, _, arg = spec.partition(':')
+    if name not in AGENT_TYPES:
+        raise ValueError(f"unknown agent: {name}")
+    return AGENT_TYPES[name](int(arg)) if arg else AGENT_TYPES[name]()
@@ -0,0 +1,232 @@
+"""순환 틱택토 대량 자가 대국 시뮬레이터.
+
+수천~수만 개의 독립된 게임을 NumPy 배열로 묶어 한 수씩 동시에 진행합니다.
+끝난 게임은 그 자리에서 새 게임으로 바뀌므로 모든 레인이 항상 일을 합니다. 레인마다 양쪽의 말 순서 큐 값만
+두고 나머지(말 위치, 승리 여부, 테이블베이스 최선의 수)는 미리 만든 표에서 읽습니다.
+
+사용법: python batch_sim.py --games 1000000 --x-policy random --o-policy table
+"""
+import argparse
+import time
+
+import numpy as np
+
+from rolling_engine import CELL_COUNT, FULL_MASK, LINE_MASKS, MAX_PIECES, SLOT_BITS, SLOT_MASK
+from tablebase import QUEUE_RANKS, QUEUE_COUNT, load_tablebase
+
+POLICIES = ('random', 'table')
+
+# 9비트 마스크 -> 승리 라인 포함 여부, 켜진 비트 수, k 번째 빈 칸 (평탄화: 마스크 * CELL_COUNT + k)
+_ALL_MASKS = np.arange(1 << CELL_COUNT)
+WIN_TABLE = np.zeros(1 << CELL_COUNT, dtype=bool)
+for _line in LINE_MASKS:
+    WIN_TABLE[_ALL_MASKS & _line == _line] = True
+POPCOUNT = np.array([bin(m).count('1') for m in _ALL_MASKS], dtype=np.int16)
+KTH_EMPTY = np.zeros((1 << CELL_COUNT, CELL_COUNT), dtype=np.int16)
+for _mask in _ALL_MASKS:
+    _empty = [cell for cell in range(CELL_COUNT) if not _mask >> cell & 1]
+    KTH_EMPTY[_mask, :len(_empty)] = _empty
+KTH_EMPTY = KTH_EMPTY.ravel()
+
+# 말 순서 큐 값(rolling_engine 과 같은 형식: SLOT_BITS 비트 슬롯마다 칸 + 1, 가장 오래된 말이 최하위 슬롯)
+# -> 말 위치 마스크, 승리 여부, 칸 c 에 새 말을 둔 뒤의 큐 값 (평탄화: 큐 값 * CELL_COUNT + c)
+CODE_COUNT = 1 << (SLOT_BITS * MAX_PIECES)
+SLOT_SHIFTS = SLOT_BITS * np.arange(MAX_PIECES)
+_codes = np.arange(CODE_COUNT)
+_slots = _codes[:, None] >> SLOT_SHIFTS & SLOT_MASK
+_pieces = (_slots > 0).sum(axis=1)
+MASK_OF_CODE = (np.where(_slots > 0, 1 << np.maximum(_slots - 1, 0), 0).sum(axis=1) & FULL_MASK).astype(np.int16)
+WIN_OF_CODE = WIN_TABLE[MASK_OF_CODE]
+_full = _pieces == MAX_PIECES
+_base = np.where(_full, _codes >> SLOT_BITS, _codes)   # 말이 가득 찼으면 가장 오래된 말을 뺌
+_shift = np.where(_full, MAX_PIECES - 1, _pieces) * SLOT_BITS
+PLACE = (_base[:, None] | (np.arange(1, CELL_COUNT + 1) << _shift[:, None]) & (CODE_COUNT - 1))
+PLACE = PLACE.astype(np.int16).ravel()
+
+RANKS = np.asarray(QUEUE_RANKS, dtype=np.int32)
+CODE_OF_RANK = np.empty(QUEUE_COUNT, dtype=np.int32)
+CODE_OF_RANK[RANKS[RANKS >= 0]] = np.flatnonzero(RANKS >= 0)
+
+
+def best_move_table(values):
+    """(차례인 쪽 O 여부, 차례인 쪽 큐 순위, 상대 큐 순위) 마다 테이블베이스 기준 최선의 수를 담은 표를 만듭니다.
+
+    평탄화한 인덱스는 (O 여부 * QUEUE_COUNT + 차례인 쪽 순위) * QUEUE_COUNT + 상대 순위 입니다. 이긴 수가
+    가장 좋고, 그다음은 상대 기준 값으로 상대가 빨리 지는 수, 무승부, 상대가 늦게 이기는 수 순서이며
+    점수가 같으면 번호가 작은 칸을 고릅니다. 도달할 수 없는 조합의 값은 의미가 없습니다.
+    """
+    values = np.asarray(values, dtype=np.int32)
+    mover = CODE_OF_RANK[:, None]
+    other = CODE_OF_RANK[None, :]
+    other_rank = np.arange(QUEUE_COUNT)[None, :]
+    occupied = MASK_OF_CODE[mover] | MASK_OF_CODE[other]
+
+    best = np.empty((2, QUEUE_COUNT, QUEUE_COUNT), dtype=np.int16)
+    for mover_is_o in (0, 1):
+        scores = np.empty((CELL_COUNT, QUEUE_COUNT, QUEUE_COUNT), dtype=np.int32)
+        for cell in range(CELL_COUNT):
+            child = PLACE[mover * CELL_COUNT + cell]
+            child_rank = np.maximum(RANKS[child], 0)   # 놓을 수 없는 칸이면 아래에서 -1 점
+            if mover_is_o:
+                index = (other_rank * QUEUE_COUNT + child_rank) * 2
+            else:
+                index = (child_rank * QUEUE_COUNT + other_rank) * 2 + 1
+            value = values[index]
+            # 상대 기준 값: 0 무승부, 홀수 상대 승, 짝수 상대 패 -> 큰 점수가 좋은 수
+            score = np.where(value == 0, 256, np.where(value & 1, value >> 1, 1024 - (value >> 1)))
+            score = np.where(WIN_OF_CODE[child], 2048, score)
+            scores[cell] = np.where(occupied >> cell & 1, -1, score)
+        best[mover_is_o] = scores.argmax(axis=0)
+    return best.ravel()
+
+
+class BatchSimulator:
+    """N 개의 게임을 (N,) 큐 값 배열 두 개(차례인 쪽, 기다리는 쪽)로 함께 진행하는 클래스.
+
+    한 수를 두면 두 배열의 역할만 바꾸므로 플레이어별 인덱싱 없이 모든 레인이 같은 연산을 합니다.
+    말 위치, 승리 여부, 새 큐 값은 모두 큐 값으로 찾는 표에서 읽습니다.
+    """
+
+    def __init__(self, lanes, policies=('random', 'random'), max_plies=200, seed=None, table=None):
+        """레인 수, 양쪽(X, O) 정책, 순환으로 간주할 최대 수, 난수 시드를 받아 초기화합니다."""
+        for policy in policies:
+            if policy not in POLICIES:
+                raise ValueError(f"unknown policy: {policy}")
+        self.lanes = lanes
+        self.policies = policies
+        self.max_plies = max_plies
+        self.rng = np.random.default_rng(seed)
+
+        if 'table' in policies:
+            table = table or load_tablebase(build_if_missing=True)
+            buffer, offset = table.buffer()
+            self.best = best_move_table(np.frombuffer(buffer, dtype=np.uint8, offset=offset))
+        else:
+            self.best = None
+
+        self.mover = np.zeros(lanes, dtype=np.int16)    # 차례인 쪽의 큐 값
+        self.waiting = np.zeros(lanes, dtype=np.int16)  # 기다리는 쪽의 큐 값
+        self.plies = np.zeros(lanes, dtype=np.int16)
+        self.o_starts = np.zeros(lanes, dtype=bool)     # O 가 선공인 레인
+        self._uniform = np.empty(lanes, dtype=np.float32)
+        self._reset_lanes(np.arange(lanes))
+
+        # 통계: [시작 플레이어 X/O][선공 승, 후공 승, 순환]
+        self.outcomes = np.zeros((2, 3), dtype=np.int64)
+        self.total_plies = 0
+        self.finished_plies = 0
+        self.length_hist = np.zeros(max_plies + 1, dtype=np.int64)
+
+    def _reset_lanes(self, lanes):
+        """지정한 레인들을 빈 보드와 무작위 선공으로 되돌립니다."""
+        self.mover[lanes] = 0
+        self.waiting[lanes] = 0
+        self.plies[lanes] = 0
+        self.o_starts[lanes] = self.rng.random(len(lanes)) >= 0.5
+
+    # --- 정책 ---
+    def _random_moves(self):
+        """빈 칸 중 하나를 균등하게 고릅니다."""
+        occupied = MASK_OF_CODE[self.mover] | MASK_OF_CODE[self.waiting]
+        empties = CELL_COUNT - POPCOUNT[occupied]
+        k = self.rng.random(out=self._uniform, dtype=np.float32) * empties
+        k = np.minimum(k.astype(np.int16), empties - 1)
+        return KTH_EMPTY[occupied.astype(np.intp) * CELL_COUNT + k]
+
+    def _table_moves(self, mover_is_o):
+        """미리 만든 최선의 수 표에서 모든 레인의 수를 한 번에 읽습니다."""
+        index = (mover_is_o * QUEUE_COUNT + RANKS[self.mover]) * QUEUE_COUNT + RANKS[self.waiting]
+        return self.best[index]
+
+    # --- 진행 ---
+    def _mover_is_o(self):
+        """차례인 쪽이 O 인 레인 (선공이 O 이고 짝수 수째이거나, 선공이 X 이고 홀수 수째)"""
+        return self.o_starts ^ (self.plies & 1).astype(bool)
+
+    def _choose_moves(self):
+        """양쪽 정책에 따라 모든 레인의 다음 수를 고릅니다."""
+        x_policy, o_policy = self.policies
+        if x_policy == o_policy == 'random':
+            return self._random_moves()
+        mover_is_o = self._mover_is_o()
+        if x_policy == o_policy:
+            return self._table_moves(mover_is_o)
+        table_moves = self._table_moves(mover_is_o)
+        random_moves = self._random_moves()
+        if x_policy == 'table':
+            return np.where(mover_is_o, random_moves, table_moves)
+        return np.where(mover_is_o, table_moves, random_moves)
+
+    def step(self):
+        """모든 레인에서 한 수씩 진행하고, 끝난 게임을 집계한 뒤 새 게임으로 바꿉니다."""
+        cells = self._choose_moves()
+        placed = PLACE[self.mover.astype(np.intp) * CELL_COUNT + cells]
+        self.mover, self.waiting = self.waiting, placed   # 차례를 넘김
+        self.plies += 1
+        self.total_plies += self.lanes
+
+        # 방금 둔 쪽의 새 큐 값으로 승리 여부를 한 번에 검사
+        won = WIN_OF_CODE[placed]
+        done = won | (self.plies >= self.max_plies)
+        if not done.any():
+            return 0
+        done_lanes = np.flatnonzero(done)
+        plies = self.plies[done_lanes]
+        # 선공은 홀수 수째를 두므로, 홀수 수째에 이겼으면 선공 승
+        result = np.where(won[done_lanes], 1 - (plies & 1), 2)
+        start_idx = self.o_starts[done_lanes].astype(np.intp)
+        self.outcomes += np.bincount(start_idx * 3 + result, minlength=6).reshape(2, 3)
+        self.length_hist += np.bincount(plies, minlength=self.max_plies + 1)
+        self.finished_plies += int(plies.sum())
+        self._reset_lanes(done_lanes)
+        return len(done_lanes)
+
+    def run(self, games):
+        """지정한 수의 게임이 끝날 때까지 진행합니다."""
+        finished = 0
+        while finished < games:
+            finished += self.step()
+        return finished
+
+    def summary(self):
+        """집계한 통계를 사전으로 반환합니다."""
+        games = int(self.outcomes.sum())
+        by_start = {}
+        for idx, name in enumerate(('X', 'O')):
+            starter, other, cycled = (int(v) for v in self.outcomes[idx])
+            by_start[name] = {'games': starter + other + cycled, 'starter_wins': starter,
+                              'other_wins': other, 'cycles': cycled}
+        starter_wins = int(self.outcomes[:, 0].sum())
+        return {
+            'games': games,
+            'plies': self.total_plies,
+            'starter_win_rate': starter_wins / games if games else 0.0,
+            'cycle_rate': int(self.outcomes[:, 2].sum()) / games if games else 0.0,
+            'mean_length': self.finished_plies / games if games else 0.0,
+            'median_length': int(np.searchsorted(np.cumsum(self.length_hist), games / 2)) if games else 0,
+            'by_start_player': by_start,
+        }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Batch self-play simulator for rolling Tic-Tac-Toe")
+    parser.add_argument('--games', type=int, default=1_000_000)
+    parser.add_argument('--lanes', type=int, default=65536)
+    parser.add_argument('--x-policy', choices=POLICIES, default='random')
+    parser.add_argument('--o-policy', choices=POLICIES, default='random')
+    parser.add_argument('--max-plies', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    sim = BatchSimulator(args.lanes, (args.x_policy, args.o_policy), args.max_plies, args.seed)
+    started = time.perf_counter()
+    sim.run(args.games)
+    elapsed = time.perf_counter() - started
+
+    stats = sim.summary()
+    print(f"games={stats['games']} plies={stats['plies']} "
+          f"({stats['plies'] / elapsed / 1e6:.1f}M plies/s, {elapsed:.2f}s)")
+    print(f"starter win rate={stats['starter_win_rate']:.4f} cycle rate={stats['cycle_rate']:.4f} "
+          f"mean length={stats['mean_length']:.2f} median length={stats['median_length']}")
+    for name, row in stats['by_start_player'].items():
+        print(f"  {name} first: {row}")
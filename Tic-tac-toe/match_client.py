@@ -0,0 +1,197 @@
+"""match_server 에 접속해 사람끼리 두는 순환 틱택토 온라인 대전 클라이언트.
+
+화면 구성과 그리기는 로컬 게임(Tic-Tac-Toe.py)과 같은 BoardRenderer 를 쓰고, 보드 상태는 서버가
+보내는 state 메시지로 매번 다시 만듭니다. 소켓은 논블로킹으로 열고, 게임 루프는 입력이 없어도
+NETWORK_POLL_INTERVAL 마다 깨어나 받은 메시지를 처리하므로 네트워크를 기다리느라 화면이 멈추지 않습니다.
+
+사용법: python match_client.py --host 127.0.0.1 --port 8765
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 공용 모듈(common) 경로
+
+import pygame
+
+from match_server import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, encode
+from rolling_engine import RollingBoard, board_geometry
+from renderer import BoardRenderer, BG_COLOR, CELL_SIZE, FPS, HEADER_HEIGHT, screen_layout
+from common.display import ResizeDebouncer, apply_window_size, open_window
+from common.loop import FrameScheduler
+
+CONNECT_TIMEOUT = 5.0
+NETWORK_POLL_INTERVAL = 50  # 입력이 없을 때 서버 메시지를 확인하는 간격 (ms)
+END_REASONS = {'line': '', 'forfeit': ' (기권)', 'max_plies': ' (수 제한)', 'timeout': ' (시간 초과)'}
+
+
+class MatchClient:
+    """서버와 줄 단위 JSON 을 주고받는 논블로킹 연결"""
+
+    def __init__(self, host, port):
+        """서버에 접속하고 hello 메시지를 받을 때까지 기다립니다."""
+        self.sock = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)
+        self._buffer = b''
+        self.closed = False
+        self.hello = self._read_hello()
+        self.sock.setblocking(False)
+
+    def _read_hello(self):
+        while b'\n' not in self._buffer:
+            data = self.sock.recv(MAX_LINE)
+            if not data:
+                raise ConnectionError("server closed the connection")
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        hello = json.loads(line)
+        if hello.get('type') != 'hello':
+            raise ConnectionError(f"unexpected greeting: {hello}")
+        return hello
+
+    def send(self, message):
+        if not self.closed:
+            try:
+                self.sock.sendall(encode(message))
+            except OSError:
+                self.closed = True
+
+    def poll(self):
+        """지금까지 도착한 메시지 목록을 반환합니다. 기다리지 않습니다."""
+        while not self.closed:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            except OSError:
+                data = b''
+            if not data:
+                self.closed = True
+                break
+            self._buffer += data
+        *lines, self._buffer = self._buffer.split(b'\n')
+        return [json.loads(line) for line in lines if line]
+
+    def close(self):
+        self.closed = True
+        self.sock.close()
+
+
+class OnlineMatch:
+    """서버 메시지로 갱신되는 클라이언트 쪽 대국 상태"""
+
+    def __init__(self, geometry):
+        self.geometry = geometry
+        self.board = RollingBoard(1, geometry)
+        self.status = 'idle'   # idle, waiting, playing, ended, disconnected
+        self.side = 0          # 내가 맡은 플레이어 (1: X, -1: O)
+        self.result = None     # (승자, 이유) - 대국이 끝났을 때
+
+    def handle(self, message):
+        kind = message['type']
+        if kind == 'waiting':
+            self.status = 'waiting'
+        elif kind == 'start':
+            self.status = 'playing'
+            self.side = message['you']
+            self.board = RollingBoard(message['player'], self.geometry)
+            self.result = None
+        elif kind == 'state':
+            self.board = RollingBoard.from_moves(message['x'], message['o'], message['player'], self.geometry)
+            self.board.restore_winner()
+        elif kind == 'end':
+            self.status = 'ended'
+            self.result = (message['winner'], message['reason'])
+        elif kind == 'error':
+            print(f"server: {message['message']}", file=sys.stderr)
+
+    @property
+    def my_turn(self):
+        return self.status == 'playing' and self.board.player == self.side
+
+    def status_message(self):
+        """상단에 표시할 상태 메시지를 만듭니다."""
+        marker = 'X' if self.side == 1 else 'O'
+        if self.status == 'disconnected':
+            return '서버 연결 끊김'
+        if self.status == 'idle':
+            return '클릭하면 대국 찾기'
+        if self.status == 'waiting':
+            return '상대를 기다리는 중...'
+        if self.status == 'ended':
+            winner, reason = self.result
+            outcome = '무승부' if winner == 0 else ('승리!' if winner == self.side else '패배')
+            return f"{marker} {outcome}{END_REASONS.get(reason, '')}"
+        if self.my_turn:
+            return f"내 차례 {marker} (말 {self.board.piece_count(self.side)}/{self.geometry.max_pieces}개)"
+        return f"상대 차례 ({'O' if self.side == 1 else 'X'})"
+
+
+def main(host, port):
+    """서버에 접속해 창을 열고 대국 루프를 실행하는 함수"""
+    client = MatchClient(host, port)
+    hello = client.hello
+    geometry = board_geometry(hello['rows'], hello['cols'], hello['win_length'], hello['max_pieces'])
+    match = OnlineMatch(geometry)
+    client.send({'op': 'join'})
+
+    # --- 화면 설정 (기준 셀 크기는 로컬 게임과 같고 보드 크기는 서버 설정을 따름, 창 크기는 바꿀 수 있음) ---
+    pygame.init()
+    screen = open_window((CELL_SIZE * geometry.cols, HEADER_HEIGHT + CELL_SIZE * geometry.rows))
+    pygame.display.set_caption(f'Pygame 순환 틱택토 - {host}:{port}')
+    scheduler = FrameScheduler(FPS)
+    renderer = BoardRenderer(screen, geometry, *screen_layout(screen.get_size(), geometry))
+    resizer = ResizeDebouncer(BG_COLOR)
+
+    # --- 메인 루프 ---
+    running = True
+    while running:
+        events = scheduler.wait()
+        for message in client.poll():
+            match.handle(message)
+        if client.closed and match.status != 'disconnected':
+            match.status = 'disconnected'
+
+        for event in events:
+            if resizer.handle_event(event):
+                continue
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN and match.status in ('idle', 'ended'):
+                client.send({'op': 'join'})
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if match.status in ('idle', 'ended'):
+                    # 승리 라인으로 끝났으면 '다시 시작' 버튼이, 아니면 화면 어디를 눌러도 새 대국을 찾음
+                    if not match.board.winner or renderer.button_rect.collidepoint(event.pos):
+                        client.send({'op': 'join'})
+                elif match.my_turn:
+                    cell = renderer.cell_at(event.pos)
+                    if cell is not None and match.board.cell_owner(cell) == 0:
+                        client.send({'op': 'move', 'cell': cell})
+
+        size = resizer.poll()
+        if size is not None:
+            screen = apply_window_size(size)
+            renderer.resize(screen, *screen_layout(screen.get_size(), geometry))
+        if not resizer.pending:
+            dirty_rects = renderer.render(match.board, match.status_message())
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        scheduler.wake_in(renderer.next_change(match.board))
+        scheduler.wake_in(resizer.remaining())
+        if not client.closed:
+            scheduler.wake_in(NETWORK_POLL_INTERVAL)
+
+    client.send({'op': 'leave'})
+    client.close()
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pygame client for match_server")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    main(args.host, args.port)
+    sys.exit()
@@ -0,0 +1,233 @@
+"""match_server 부하 생성기: 루프백으로 수천 개의 클라이언트가 동시에 대국을 둡니다.
+
+클라이언트마다 대기열에 들어가 대국이 잡히면 자기 차례에 잠깐 생각한 뒤(--think) 빈 칸에
+무작위로 두고, 대국이 끝나면 다시 대기열에 들어갑니다. 착수를 보낸 뒤 그 수가 반영된 state 를
+받을 때까지의 시간을 수 하나의 지연 시간으로 잽니다. 별도의 감시 연결이 서버 상태를 주기적으로
+조회해 동시 대국 수의 최댓값을 기록합니다.
+
+사용법: python match_load.py --clients 20000 --duration 30 --processes 4 [--spawn-server]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 공용 모듈(common) 경로
+
+from match_server import DEFAULT_HOST, DEFAULT_PORT, encode, raise_open_file_limit
+from common.profiler import percentile
+
+CONNECT_CONCURRENCY = 256   # 동시에 진행할 연결 시도 수 (한꺼번에 연결하면 listen 대기열이 넘침)
+MAX_SAMPLES = 100_000       # 프로세스마다 보관할 지연 시간 표본 수 (저수지 표본 추출)
+STOP_GRACE = 2.0            # deadline 뒤에 진행 중인 대국이 끝나기를 기다리는 시간 (초, 생각 시간은 따로 더함)
+
+
+class LoadStats:
+    """클라이언트들이 함께 쓰는 집계 (한 프로세스 안에서는 이벤트 루프 하나이므로 잠금이 필요 없음)"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.latencies = []
+        self.latency_count = 0
+        self.moves = 0
+        self.games = 0
+        self.errors = 0
+        self.failed_connects = 0
+
+    def add_latency(self, seconds):
+        self.latency_count += 1
+        if len(self.latencies) < MAX_SAMPLES:
+            self.latencies.append(seconds)
+        else:
+            i = self.rng.randrange(self.latency_count)
+            if i < MAX_SAMPLES:
+                self.latencies[i] = seconds
+
+
+async def _client(host, port, deadline, think, stats, connect_gate, rng):
+    """대기열 참가 -> 대국 -> 다시 참가를 deadline 까지 반복하는 클라이언트 하나.
+
+    deadline 뒤에도 대기열에 남았거나 상대가 이미 떠나 응답이 오지 않으면 STOP_GRACE 만큼만 더 기다린 뒤
+    leave 를 보내고 끝냅니다.
+    """
+    async with connect_gate:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            stats.failed_connects += 1
+            return
+    cell_count = 0
+    side = 0
+    sent_at = None
+    stop_at = deadline + STOP_GRACE + 2 * think
+    try:
+        writer.write(encode({'op': 'join'}))
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), max(0.0, stop_at - time.perf_counter()))
+            except asyncio.TimeoutError:
+                writer.write(encode({'op': 'leave'}))
+                break
+            if not line:
+                break
+            message = json.loads(line)
+            kind = message['type']
+            if kind == 'hello':
+                cell_count = message['rows'] * message['cols']
+                continue
+            if kind == 'start':
+                side = message['you']
+                player, occupied = message['player'], ()
+            elif kind == 'state':
+                if sent_at is not None and message['player'] != side:
+                    stats.add_latency(time.perf_counter() - sent_at)
+                    sent_at = None
+                    stats.moves += 1
+                if message['winner']:
+                    continue  # 곧 end 가 옴
+                player, occupied = message['player'], (*message['x'], *message['o'])
+            elif kind == 'end':
+                stats.games += 1
+                sent_at = None
+                if time.perf_counter() >= deadline:
+                    break
+                writer.write(encode({'op': 'join'}))
+                continue
+            elif kind == 'error':
+                stats.errors += 1
+                continue
+            else:
+                continue
+
+            if player == side:
+                if time.perf_counter() >= deadline:
+                    writer.write(encode({'op': 'leave'}))  # 끝나지 않은 대국은 포기하고 상대도 끝나게 함
+                    break
+                if think > 0:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))
+                empty = [cell for cell in range(cell_count) if cell not in occupied]
+                sent_at = time.perf_counter()
+                writer.write(encode({'op': 'move', 'cell': rng.choice(empty)}))
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _monitor(host, port, deadline, interval=0.5):
+    """서버 상태를 주기적으로 조회해 최대 동시 대국 수와 최대 연결 수를 반환합니다."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()  # hello
+    peak_matches = peak_connections = 0
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(encode({'op': 'stats'}))
+            stats = json.loads(await reader.readline())
+            peak_matches = max(peak_matches, stats['matches'])
+            peak_connections = max(peak_connections, stats['connections'])
+            await asyncio.sleep(interval)
+    finally:
+        writer.close()
+    return peak_matches, peak_connections
+
+
+async def _run_clients(host, port, clients, duration, think, seed, monitor):
+    stats = LoadStats(seed)
+    rng = random.Random(seed)
+    gate = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    deadline = time.perf_counter() + duration
+    tasks = [asyncio.create_task(_client(host, port, deadline, think, stats, gate, random.Random(rng.random())))
+             for _ in range(clients)]
+    monitor_task = asyncio.create_task(_monitor(host, port, deadline)) if monitor else None
+    await asyncio.gather(*tasks)
+    peaks = await monitor_task if monitor_task is not None else (0, 0)
+    return stats, peaks
+
+
+def _run_process(args):
+    """프로세스 하나가 맡은 클라이언트들을 실행하고 집계를 반환합니다."""
+    host, port, clients, duration, think, seed, monitor = args
+    raise_open_file_limit()
+    stats, peaks = asyncio.run(_run_clients(host, port, clients, duration, think, seed, monitor))
+    return {'latencies': stats.latencies, 'latency_count': stats.latency_count, 'moves': stats.moves,
+            'games': stats.games, 'errors': stats.errors, 'failed_connects': stats.failed_connects, 'peaks': peaks}
+
+
+def run_load(host, port, clients, duration, think, processes=1, seed=0):
+    """부하를 생성하고 요약 dict 를 반환합니다. 클라이언트는 processes 개 프로세스에 나눠 실행합니다."""
+    shares = [clients // processes + (i < clients % processes) for i in range(processes)]
+    tasks = [(host, port, share, duration, think, seed + i, i == 0) for i, share in enumerate(shares)]
+    started = time.perf_counter()
+    if processes == 1:
+        results = [_run_process(tasks[0])]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_run_process, tasks)
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(sample for result in results for sample in result['latencies'])
+    moves = sum(result['moves'] for result in results)
+    peak_matches, peak_connections = results[0]['peaks']
+    return {
+        'clients': clients,
+        'processes': processes,
+        'elapsed': elapsed,
+        'games': sum(result['games'] for result in results) // 2,  # 대국마다 두 클라이언트가 셈
+        'moves': moves,
+        'moves_per_sec': moves / elapsed,
+        'errors': sum(result['errors'] for result in results),
+        'failed_connects': sum(result['failed_connects'] for result in results),
+        'peak_matches': peak_matches,
+        'peak_connections': peak_connections,
+        'latency_ms': {f'p{q}': percentile(latencies, q) * 1000 for q in (50, 95, 99)},
+    }
+
+
+def _wait_for_server(host, port, timeout=10.0):
+    """서버가 연결을 받을 때까지 기다립니다."""
+    async def probe():
+        _, writer = await asyncio.open_connection(host, port)
+        writer.close()
+
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            asyncio.run(probe())
+            return
+        except OSError:
+            if time.perf_counter() >= deadline:
+                raise
+            time.sleep(0.1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Loopback load generator for match_server")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--clients', type=int, default=2000, help="simulated clients (two per match)")
+    parser.add_argument('--duration', type=float, default=20.0, help="seconds before clients stop rejoining")
+    parser.add_argument('--think', type=float, default=0.5, help="mean think time per move in seconds")
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--spawn-server', action='store_true', help="start match_server.py as a subprocess")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn_server:
+        server_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'match_server.py')
+        server = subprocess.Popen([sys.executable, server_path, '--host', args.host, '--port', str(args.port)],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        _wait_for_server(args.host, args.port)
+        summary = run_load(args.host, args.port, args.clients, args.duration, args.think,
+                           args.processes, args.seed)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(json.dumps(summary, indent=2))
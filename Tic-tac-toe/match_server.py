@@ -0,0 +1,324 @@
+"""순환 틱택토 온라인 대전 서버 (asyncio, 줄 단위 JSON over TCP).
+
+프로세스 하나가 서로 독립된 대국 수천~수만 개를 동시에 진행합니다. 대국 상태는 RollingBoard
+(정수 몇 개로 된 비트보드) 하나와 두 연결뿐이고, 착수 검증은 게임과 같은 RollingBoard.play 규칙을
+그대로 씁니다. 차례인 플레이어가 --turn-timeout 초 안에 두지 않으면 그 플레이어의 패배(timeout)로
+끝내므로, 접속만 하고 두지 않는 클라이언트가 상대와 대국을 붙잡아 두지 못합니다.
+
+프로토콜 (한 줄에 JSON 객체 하나, UTF-8)
+    클라이언트 -> 서버
+        {"op": "join"}               대기열에 들어가 상대를 기다림
+        {"op": "move", "cell": 4}    내 차례에 칸에 말을 놓음
+        {"op": "leave"}              진행 중인 대국을 포기함
+        {"op": "stats"}              서버 상태 조회
+    서버 -> 클라이언트
+        {"type": "hello", "version", "rows", "cols", "win_length", "max_pieces"}
+        {"type": "waiting"}
+        {"type": "start", "match", "you", "player"}
+        {"type": "state", "match", "x", "o", "player", "last", "winner"}   (x, o 는 오래된 순서의 말 위치)
+        {"type": "end", "match", "winner", "reason"}   reason: line, forfeit, max_plies, timeout
+        {"type": "stats", "connections", "waiting", "matches", "finished", "moves"}
+        {"type": "error", "message"}
+
+사용법: python match_server.py --port 8765
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from rolling_engine import RollingBoard, DEFAULT_GEOMETRY, board_geometry
+
+PROTOCOL_VERSION = 1
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MAX_PLIES = 200          # 순환으로 끝나지 않는 대국을 무승부로 끝낼 수 (tournament 와 같은 값)
+DEFAULT_TURN_TIMEOUT = 30.0      # 차례인 플레이어가 이 시간(초) 안에 두지 않으면 패배
+TURN_SWEEP_INTERVAL = 1.0        # 시간이 지난 차례를 확인하는 간격 (초)
+MAX_LINE = 1024                  # 요청 한 줄의 최대 길이 (바이트)
+MAX_PENDING = 64 * 1024          # 읽지 않고 쌓인 응답이 이보다 많으면 느린 클라이언트로 보고 끊음
+BACKLOG = 4096
+
+
+def encode(message):
+    """메시지를 전송할 한 줄(bytes)로 바꿉니다."""
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+def raise_open_file_limit():
+    """연결마다 파일 디스크립터가 하나씩 필요하므로 열린 파일 수 제한을 허용 최대치로 올립니다."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        soft = hard
+    return soft
+
+
+class Connection(asyncio.Protocol):
+    """연결 하나와 그 연결이 참가한 대국.
+
+    연결마다 코루틴과 StreamReader 를 두지 않고 받은 바이트를 콜백에서 바로 줄로 나눠 처리하므로
+    연결 수만 개에서도 연결당 메모리와 착수당 전환 비용이 작습니다.
+    """
+    __slots__ = ('server', 'transport', 'match', 'side', '_buffer')
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.match = None   # 참가 중인 Match
+        self.side = 0       # 대국에서 맡은 플레이어 (1: X, -1: O)
+        self._buffer = b''
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connected(self)
+
+    def data_received(self, data):
+        buffer = self._buffer + data if self._buffer else data
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end < 0:
+                break
+            self.server.dispatch(self, buffer[start:end])
+            start = end + 1
+        self._buffer = buffer[start:]
+        if len(self._buffer) > MAX_LINE:
+            self.send(encode({'type': 'error', 'message': 'line too long'}))
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        self.server.disconnected(self)
+
+    @property
+    def closing(self):
+        return self.transport.is_closing()
+
+    def send(self, data):
+        """인코딩된 메시지를 보냅니다. 쌓인 응답이 너무 많으면 연결을 끊습니다."""
+        transport = self.transport
+        if transport.is_closing():
+            return
+        transport.write(data)
+        if transport.get_write_buffer_size() > MAX_PENDING:
+            transport.abort()
+
+
+class Match:
+    """대국 하나의 상태 (보드, 두 연결, 둔 수, 이번 차례의 마감 시각)"""
+    __slots__ = ('id', 'board', 'players', 'plies', 'turn_deadline')
+
+    def __init__(self, match_id, board, x_player, o_player):
+        self.id = match_id
+        self.board = board
+        self.players = (x_player, o_player)
+        self.plies = 0
+        self.turn_deadline = 0.0  # time.monotonic() 기준
+
+    def opponent(self, conn):
+        return self.players[1] if self.players[0] is conn else self.players[0]
+
+
+class MatchServer:
+    """대기열로 두 연결을 짝지어 대국을 만들고 착수를 검증해 양쪽에 알리는 서버"""
+
+    def __init__(self, geometry=DEFAULT_GEOMETRY, max_plies=DEFAULT_MAX_PLIES, seed=None,
+                 turn_timeout=DEFAULT_TURN_TIMEOUT):
+        """보드 설정, 무승부로 끝낼 최대 수, 선공을 정할 난수 시드, 한 차례의 제한 시간(초, None 이면 없음)을 받습니다."""
+        self.geometry = geometry
+        self.max_plies = max_plies
+        self.turn_timeout = turn_timeout
+        self.rng = random.Random(seed)
+        self.matches = {}       # 대국 번호 -> Match
+        self.waiting = {}       # 대기 중인 Connection (dict 를 삽입 순서 큐로 사용)
+        self._turns = {}        # 진행 중인 Match 를 차례 마감 시각 순서로 (제한 시간이 모두 같으므로 삽입 순서 = 마감 순서)
+        self.connections = 0
+        self.finished = 0
+        self.moves = 0
+        self._next_id = 1
+        self._hello = encode({'type': 'hello', 'version': PROTOCOL_VERSION, 'rows': geometry.rows,
+                              'cols': geometry.cols, 'win_length': geometry.win_length,
+                              'max_pieces': geometry.max_pieces})
+        self._handlers = {'join': self._join, 'move': self._move, 'leave': self._leave, 'stats': self._stats}
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """서버를 열고 asyncio.Server 를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self.turn_timeout is not None:
+            loop.call_later(TURN_SWEEP_INTERVAL, self._sweep_tick, loop)
+        return await loop.create_server(lambda: Connection(self), host, port, backlog=BACKLOG)
+
+    def stats(self):
+        return {'type': 'stats', 'connections': self.connections, 'waiting': len(self.waiting),
+                'matches': len(self.matches), 'finished': self.finished, 'moves': self.moves}
+
+    def expire_turns(self, now=None):
+        """차례 마감 시각이 지난 대국을 차례인 플레이어의 패배로 끝내고 끝낸 대국 수를 반환합니다."""
+        now = time.monotonic() if now is None else now
+        expired = 0
+        turns = self._turns
+        while turns:
+            match = next(iter(turns))
+            if match.turn_deadline > now:
+                break  # 뒤의 대국은 모두 마감이 더 늦음
+            self._finish(match, -match.board.player, 'timeout')
+            expired += 1
+        return expired
+
+    def _sweep_tick(self, loop):
+        self.expire_turns()
+        loop.call_later(TURN_SWEEP_INTERVAL, self._sweep_tick, loop)
+
+    def _start_turn(self, match):
+        """새 차례의 마감 시각을 정하고 마감 순서의 맨 뒤로 옮깁니다."""
+        if self.turn_timeout is None:
+            return
+        self._turns.pop(match, None)
+        match.turn_deadline = time.monotonic() + self.turn_timeout
+        self._turns[match] = None
+
+    # --- 연결 (Connection 이 부름) ---
+    def connected(self, conn):
+        self.connections += 1
+        conn.send(self._hello)
+
+    def dispatch(self, conn, line):
+        """요청 한 줄을 처리합니다."""
+        try:
+            request = json.loads(line)
+            handler = self._handlers[request['op']]
+        except (ValueError, TypeError, KeyError):
+            conn.send(encode({'type': 'error', 'message': 'bad request'}))
+            return
+        handler(conn, request)
+
+    def disconnected(self, conn):
+        self.connections -= 1
+        self.waiting.pop(conn, None)
+        if conn.match is not None:
+            self._finish(conn.match, -conn.side, 'forfeit')
+
+    # --- 요청 처리 ---
+    def _join(self, conn, request):
+        if conn.match is not None:
+            conn.send(encode({'type': 'error', 'message': 'already in a match'}))
+            return
+        if conn in self.waiting:
+            return
+        while self.waiting:
+            opponent = next(iter(self.waiting))
+            del self.waiting[opponent]
+            if not opponent.closing:
+                self._start_match(opponent, conn)
+                return
+        self.waiting[conn] = None
+        conn.send(encode({'type': 'waiting'}))
+
+    def _start_match(self, first, second):
+        """두 연결로 대국을 만듭니다. X/O 와 선공은 무작위로 정합니다."""
+        rng = self.rng
+        x_player, o_player = (first, second) if rng.random() < 0.5 else (second, first)
+        match = Match(self._next_id, RollingBoard(rng.choice((1, -1)), self.geometry), x_player, o_player)
+        self._next_id += 1
+        self.matches[match.id] = match
+        self._start_turn(match)
+        for conn, side in ((x_player, 1), (o_player, -1)):
+            conn.match = match
+            conn.side = side
+            conn.send(encode({'type': 'start', 'match': match.id, 'you': side, 'player': match.board.player}))
+
+    def _move(self, conn, request):
+        match = conn.match
+        if match is None:
+            conn.send(encode({'type': 'error', 'message': 'not in a match'}))
+            return
+        board = match.board
+        cell = request.get('cell')
+        if board.player != conn.side:
+            conn.send(encode({'type': 'error', 'message': 'not your turn'}))
+            return
+        if type(cell) is not int or not 0 <= cell < self.geometry.cell_count:
+            conn.send(encode({'type': 'error', 'message': 'invalid cell'}))
+            return
+        try:
+            board.play(cell)
+        except ValueError as e:  # 이미 말이 있는 칸
+            conn.send(encode({'type': 'error', 'message': str(e)}))
+            return
+        match.plies += 1
+        self.moves += 1
+
+        state = encode({'type': 'state', 'match': match.id, 'x': board.moves(1), 'o': board.moves(-1),
+                        'player': board.player, 'last': cell, 'winner': board.winner})
+        for player in match.players:
+            player.send(state)
+        if board.winner:
+            self._finish(match, board.winner, 'line')
+        elif match.plies >= self.max_plies:
+            self._finish(match, 0, 'max_plies')
+        else:
+            self._start_turn(match)
+
+    def _leave(self, conn, request):
+        self.waiting.pop(conn, None)
+        if conn.match is not None:
+            self._finish(conn.match, -conn.side, 'forfeit')
+
+    def _stats(self, conn, request):
+        conn.send(encode(self.stats()))
+
+    def _finish(self, match, winner, reason):
+        """대국을 끝내고 양쪽에 결과를 알립니다. 두 연결은 다시 join 할 수 있습니다."""
+        end = encode({'type': 'end', 'match': match.id, 'winner': winner, 'reason': reason})
+        for player in match.players:
+            player.match = None
+            player.send(end)
+        del self.matches[match.id]
+        self._turns.pop(match, None)
+        self.finished += 1
+
+
+async def serve(host, port, geometry, max_plies, report_every, turn_timeout=DEFAULT_TURN_TIMEOUT):
+    server = MatchServer(geometry, max_plies, turn_timeout=turn_timeout)
+    async with await server.start(host, port) as listener:
+        address = listener.sockets[0].getsockname()
+        print(f"listening on {address[0]}:{address[1]}", flush=True)
+        last_moves, last_time = 0, time.perf_counter()
+        while True:
+            await asyncio.sleep(report_every)
+            now = time.perf_counter()
+            stats = server.stats()
+            rate = (stats['moves'] - last_moves) / (now - last_time)
+            last_moves, last_time = stats['moves'], now
+            print(f"connections={stats['connections']} waiting={stats['waiting']} matches={stats['matches']} "
+                  f"finished={stats['finished']} moves={stats['moves']} ({rate:.0f}/s)", flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Asyncio match server for rolling Tic-Tac-Toe")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--rows', type=int, default=DEFAULT_GEOMETRY.rows)
+    parser.add_argument('--cols', type=int, default=DEFAULT_GEOMETRY.cols)
+    parser.add_argument('--win-length', type=int, default=DEFAULT_GEOMETRY.win_length)
+    parser.add_argument('--max-pieces', type=int, default=DEFAULT_GEOMETRY.max_pieces)
+    parser.add_argument('--max-plies', type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument('--turn-timeout', type=float, default=DEFAULT_TURN_TIMEOUT,
+                        help="seconds a player may take per move before forfeiting (0 disables)")
+    parser.add_argument('--report-every', type=float, default=5.0, help="print server stats every N seconds")
+    args = parser.parse_args()
+
+    limit = raise_open_file_limit()
+    if limit is not None:
+        print(f"open file limit: {limit}", flush=True)
+    geometry = board_geometry(args.rows, args.cols, args.win_length, args.max_pieces)
+    try:
+        asyncio.run(serve(args.host, args.port, geometry, args.max_plies, args.report_every,
+                          args.turn_timeout or None))
+    except KeyboardInterrupt:
+        pass
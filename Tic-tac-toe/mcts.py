@@ -0,0 +1,231 @@
+"""순환 틱택토용 몬테카를로 트리 탐색(MCTS).
+
+말이 사라지는 규칙 때문에 같은 국면이 여러 경로로(또는 순환하며) 다시 나타나므로, 탐색
+트리를 노드 객체 대신 Zobrist 해시로 찾는 전치표(transposition table)에 저장합니다.
+전치표는 최대 항목 수를 넘으면 가장 오래 쓰이지 않은 항목부터 지우고(LRU), 수가 바뀌어도
+비우지 않으므로 이전 턴에 탐색한 결과를 그대로 이어서 사용합니다.
+"""
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+
+# --- Zobrist 해시 ---
+_zobrist_tables = {}
+
+
+def _zobrist_table(geometry):
+    """보드 설정별 Zobrist 난수표 [플레이어][큐 위치][칸] 과 차례 키를 반환합니다."""
+    table = _zobrist_tables.get(geometry)
+    if table is None:
+        rng = random.Random(0x5EED)  # 실행할 때마다 같은 해시가 나오도록 고정 시드 사용
+        keys = tuple(
+            tuple(tuple(rng.getrandbits(64) for _ in range(geometry.cell_count))
+                  for _ in range(geometry.max_pieces))
+            for _ in range(2)
+        )
+        table = _zobrist_tables[geometry] = (keys, rng.getrandbits(64))
+    return table
+
+
+def zobrist_hash(board):
+    """말 위치, 말 순서(큐에서의 위치), 차례를 모두 반영한 64비트 해시를 반환합니다."""
+    keys, side_key = _zobrist_table(board.geometry)
+    h = side_key if board.player == -1 else 0
+    for i, side in enumerate((1, -1)):
+        side_keys = keys[i]
+        for age, cell in enumerate(board.moves(side)):
+            h ^= side_keys[age][cell]
+    return h
+
+
+class _Entry:
+    """전치표 항목: 이 국면으로 수를 둔 플레이어 기준 방문 수와 누적 점수, 자식 목록"""
+    __slots__ = ('visits', 'wins', 'children')
+
+    def __init__(self):
+        self.visits = 0
+        self.wins = 0.0
+        self.children = None  # 확장 후 ((칸, 자식 해시), ...)
+
+
+class MCTS:
+    """전치표를 재사용하는 UCT 탐색기"""
+
+    def __init__(self, max_entries=200_000, exploration=1.4, rollout_limit=40, max_depth=60, seed=None):
+        """전치표 최대 크기, 탐색 상수, 롤아웃 최대 수, 선택 단계 최대 깊이를 받아 초기화합니다."""
+        self.max_entries = max_entries
+        self.exploration = exploration
+        self.rollout_limit = rollout_limit
+        self.max_depth = max_depth
+        self.rng = random.Random(seed)
+        self.table = OrderedDict()
+
+    def clear(self):
+        """전치표를 비웁니다."""
+        self.table.clear()
+
+    def _entry(self, key):
+        """항목을 찾아 가장 최근에 쓴 것으로 표시하고, 없으면 만들고 필요하면 오래된 항목을 지웁니다."""
+        table = self.table
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = _Entry()
+            if len(table) > self.max_entries:
+                table.popitem(last=False)
+        else:
+            table.move_to_end(key)
+        return entry
+
+    def search(self, board, iterations=None, time_budget=None, stop_event=None):
+        """정해진 횟수 또는 시간 동안 탐색한 뒤 가장 많이 방문한 수를 반환합니다."""
+        moves = board.legal_moves()
+        if len(moves) == 1:
+            return moves[0]
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        root_key = zobrist_hash(board)
+        done = 0
+        while True:
+            self._iterate(board, root_key)
+            done += 1
+            if iterations is not None and done >= iterations:
+                break
+            if done & 15 == 0:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                if stop_event is not None and stop_event.is_set():
+                    break
+                time.sleep(0)  # 렌더링 스레드가 GIL 을 얻을 수 있도록 양보
+        return self.best_move(board, root_key)
+
+    def best_move(self, board, root_key=None):
+        """현재 전치표에서 가장 많이 방문한 자식으로 가는 수를 반환합니다."""
+        root = self._entry(root_key if root_key is not None else zobrist_hash(board))
+        if not root.children:
+            return self.rng.choice(board.legal_moves())
+        table = self.table
+        best_cell, best_visits = None, -1
+        for cell, child_key in root.children:
+            child = table.get(child_key)
+            visits = child.visits if child is not None else 0
+            if visits > best_visits:
+                best_cell, best_visits = cell, visits
+        return best_cell
+
+    def _iterate(self, board, root_key):
+        """선택-확장-롤아웃-역전파를 한 번 수행합니다."""
+        table = self.table
+        path = [self._entry(root_key)]
+        played = 0
+        node = path[0]
+
+        # 선택: 모든 자식을 한 번 이상 방문한 노드에서는 UCT 값이 가장 큰 자식으로 내려감
+        while node.children is not None and not board.winner and played < self.max_depth:
+            log_visits = math.log(node.visits + 1)
+            best_score, best_cell, best_key = -1.0, None, None
+            for cell, child_key in node.children:
+                child = table.get(child_key)
+                if child is None or child.visits == 0:
+                    best_cell, best_key = cell, child_key
+                    break
+                score = (child.wins / child.visits
+                         + self.exploration * math.sqrt(log_visits / child.visits))
+                if score > best_score:
+                    best_score, best_cell, best_key = score, cell, child_key
+            board.play(best_cell)
+            played += 1
+            child = self._entry(best_key)
+            path.append(child)
+            if child.visits == 0:
+                break
+            node = child
+
+        # 확장: 처음 도착한 노드는 자식 해시 목록을 만들어 둠
+        if node.children is None and not board.winner:
+            children = []
+            for cell in board.legal_moves():
+                board.play(cell)
+                children.append((cell, zobrist_hash(board)))
+                board.undo()
+            self.rng.shuffle(children)
+            node.children = tuple(children)
+
+        # 롤아웃: 마지막 노드로 수를 둔 플레이어 기준 결과 (1 승, 0.5 무, 0 패)
+        result = self._rollout(board)
+        for _ in range(played):
+            board.undo()
+
+        # 역전파: 부모로 갈수록 관점이 바뀜
+        for entry in reversed(path):
+            entry.visits += 1
+            entry.wins += result
+            result = 1.0 - result
+
+    def _rollout(self, board):
+        """무작위로 끝까지 두어 보고 직전에 둔 플레이어 기준 결과를 반환합니다."""
+        mover = -board.player
+        rng = self.rng
+        played = 0
+        while not board.winner and played < self.rollout_limit:
+            board.play(rng.choice(board.legal_moves()))
+            played += 1
+        winner = board.winner
+        for _ in range(played):
+            board.undo()
+        if winner == 0:
+            return 0.5
+        return 1.0 if winner == mover else 0.0
+
+
+class MCTSPlayer:
+    """게임 루프를 막지 않도록 백그라운드 스레드에서 시간 제한 탐색을 하는 컴퓨터 플레이어"""
+
+    def __init__(self, time_budget=1.0, on_done=None, **search_options):
+        """수마다 생각할 시간(초), 탐색이 끝나면 탐색 스레드에서 부를 함수, MCTS 설정을 받아 초기화합니다."""
+        self.time_budget = time_budget
+        self.on_done = on_done
+        self.search = MCTS(**search_options)
+        self._thread = None
+        self._stop = threading.Event()
+        self._finished = threading.Event()  # 결과가 정해졌는지 (on_done 을 부르기 전에 켬)
+        self._move = None
+
+    @property
+    def thinking(self):
+        """탐색 스레드가 실행 중이거나 결과를 아직 가져가지 않았는지 여부를 반환합니다."""
+        return self._thread is not None
+
+    def start(self, board):
+        """현재 보드의 복사본으로 백그라운드 탐색을 시작합니다."""
+        self.cancel()
+        self._stop.clear()
+        self._finished.clear()
+        self._move = None
+        position = board.copy()
+        self._thread = threading.Thread(target=self._run, args=(position,), daemon=True)
+        self._thread.start()
+
+    def _run(self, board):
+        try:
+            self._move = self.search.search(board, time_budget=self.time_budget, stop_event=self._stop)
+        finally:
+            self._finished.set()
+        if self.on_done is not None and not self._stop.is_set():
+            self.on_done()
+
+    def poll(self):
+        """탐색이 끝났으면 고른 수를 반환하고, 아직이면 None 을 반환합니다."""
+        if self._thread is None or not self._finished.is_set():
+            return None
+        self._thread.join()  # 결과는 정해졌고 on_done 호출만 남았으므로 곧 끝남
+        self._thread = None
+        return self._move
+
+    def cancel(self):
+        """진행 중인 탐색을 멈추고 결과를 버립니다."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._move = None
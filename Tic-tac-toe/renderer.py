@@ -0,0 +1,285 @@
+"""순환 틱택토 화면 그리기.
+
+격자와 X/O 말은 처음에 한 번만 그려서 Surface 로 보관하고, 매 프레임에는 바뀐 칸(놓인 말,
+사라진 말, 깜빡이는 가장 오래된 말, 힌트)과 바뀐 상단 문구의 영역만 다시 그려서
+pygame.display.update 에 넘길 사각형 목록으로 돌려줍니다. 창 크기가 바뀌면 resize 로 새 셀 크기에
+맞춰 캐시 Surface 를 다시 만듭니다. 창 크기에 맞는 셀 크기, 폰트, 버튼 영역은 screen_layout 이 정하며
+로컬 게임과 온라인 대전 클라이언트가 함께 씁니다.
+"""
+from contextlib import nullcontext
+
+import pygame
+
+from common.display import layout_scale
+
+# 색상 (깔끔한 테마로 변경)
+BG_COLOR = (28, 170, 156)
+LINE_COLOR = (23, 145, 135)
+WHITE = (255, 255, 255)
+X_COLOR = (84, 84, 84)
+O_COLOR = (242, 235, 211)
+BUTTON_COLOR = (220, 220, 220)
+BUTTON_TEXT_COLOR = (50, 50, 50)
+HINT_COLOR = (255, 215, 0)
+
+# 기준 셀 크기와 상단 영역 높이 (창 크기가 다르면 screen_layout 이 창에 맞춰 늘리거나 줄임)
+CELL_SIZE = 200
+HEADER_HEIGHT = 100
+
+FPS = 60  # 화면이 바뀌는 동안의 최대 프레임 수 (할 일이 없으면 입력이나 다음 깜빡임까지 잠듦)
+
+BLINK_INTERVAL = 400  # 가장 오래된 말이 깜빡이는 주기 (ms)
+TEXT_CACHE_SIZE = 32  # 상단 문구 Surface 를 보관할 최대 개수
+
+_NULL_PHASE = nullcontext()
+
+
+def load_fonts(scale=1.0):
+    """화면 배율에 맞는 크기로 폰트를 불러오는 함수 (시스템 폰트 검색이 느리므로 창을 연 뒤에 호출)"""
+    font = pygame.font.SysFont("malgun gothic", round(50 * scale), bold=True)
+    button_font = pygame.font.SysFont("malgun gothic", round(40 * scale))
+    small_font = pygame.font.SysFont("malgun gothic", round(30 * scale))
+    return font, button_font, small_font
+
+
+def screen_layout(size, geometry):
+    """창 크기에 맞는 BoardRenderer 배치 인자(셀 크기, 상단 영역 높이, 폰트 2개, '다시 시작' 버튼 영역)를 반환하는 함수"""
+    width, height = size
+    scale = layout_scale(size, (CELL_SIZE * geometry.cols, HEADER_HEIGHT + CELL_SIZE * geometry.rows))
+    header_height = round(HEADER_HEIGHT * scale)
+    cell_size = max(1, min(width // geometry.cols, (height - header_height) // geometry.rows))
+    font, button_font, _ = load_fonts(scale)
+    button_rect = pygame.Rect(width // 2 - round(125 * scale), height // 2 - round(25 * scale),
+                              round(250 * scale), round(60 * scale))
+    return cell_size, header_height, font, button_font, button_rect
+
+
+class BoardRenderer:
+    """미리 그려 둔 Surface 와 변경된 영역 추적으로 보드를 그리는 클래스"""
+
+    def __init__(self, screen, geometry, cell_size, header_height, font, button_font, button_rect, profiler=None):
+        """화면, 보드 설정, 배치 크기, 폰트, '다시 시작' 버튼 영역, 그리기 단계를 잴 프로파일러를 받아 캐시를 준비합니다."""
+        self.geometry = geometry
+        self.profiler = profiler
+        self._text_cache = {}
+        self.resize(screen, cell_size, header_height, font, button_font, button_rect)
+
+    def resize(self, screen, cell_size, header_height, font, button_font, button_rect):
+        """새 창 크기의 배치 크기와 폰트로 캐시 Surface 를 다시 만들고, 다음 render 에서 전체를 그리게 합니다."""
+        self.screen = screen
+        self.cell_size = cell_size
+        self.header_height = header_height
+        self.font = font
+        self.button_font = button_font
+        self.button_rect = button_rect
+
+        # 창 비율이 보드와 달라 남는 폭과 높이는 양쪽에 나눠 보드를 가운데에 둠
+        width, height = screen.get_size()
+        self.board_left = (width - cell_size * self.geometry.cols) // 2
+        self.board_top = header_height + (height - header_height - cell_size * self.geometry.rows) // 2
+
+        # 선 두께 및 말 여백 (3×3 보드의 셀 크기 200 기준 값을 셀 크기에 비례해 조절)
+        self.line_width = max(2, cell_size * 15 // 200)
+        self.marker_width = max(2, cell_size * 15 // 200)
+        self.win_line_width = max(2, cell_size * 10 // 200)
+        self.marker_padding = cell_size // 5
+
+        self.background = self._render_background()
+        self.x_sprite = self._render_x()
+        self.o_sprite = self._render_o()
+        self.hint_sprite = self._render_hint()
+        self.button_text = button_font.render('다시 시작', True, BUTTON_TEXT_COLOR)
+        self._text_cache.clear()
+        self.invalidate()
+
+    # --- 캐시 Surface 준비 ---
+    def _render_background(self):
+        """배경, 상단 영역, 격자선을 한 장의 Surface 로 그립니다."""
+        width, height = self.screen.get_size()
+        left, top = self.board_left, self.board_top
+        right, bottom = left + self.cell_size * self.geometry.cols, top + self.cell_size * self.geometry.rows
+        surface = pygame.Surface((width, height), 0, self.screen)
+        surface.fill(BG_COLOR)
+        surface.fill(LINE_COLOR, (0, 0, width, self.header_height))
+        for i in range(1, self.geometry.rows):
+            y = i * self.cell_size + top
+            pygame.draw.line(surface, LINE_COLOR, (left, y), (right, y), self.line_width)
+        for i in range(1, self.geometry.cols):
+            x = i * self.cell_size + left
+            pygame.draw.line(surface, LINE_COLOR, (x, top), (x, bottom), self.line_width)
+        return surface
+
+    def _render_x(self):
+        """셀 하나 크기의 투명 Surface 에 X 를 그립니다."""
+        size, pad = self.cell_size, self.marker_padding
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.line(surface, X_COLOR, (pad, pad), (size - pad, size - pad), self.marker_width)
+        pygame.draw.line(surface, X_COLOR, (pad, size - pad), (size - pad, pad), self.marker_width)
+        return surface.convert_alpha()
+
+    def _render_o(self):
+        """셀 하나 크기의 투명 Surface 에 O 를 그립니다."""
+        size = self.cell_size
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, O_COLOR, (size // 2, size // 2), size // 2 - self.marker_padding,
+                           self.marker_width)
+        return surface.convert_alpha()
+
+    def _render_hint(self):
+        """추천 칸에 겹쳐 그릴 테두리 Surface 를 만듭니다."""
+        size = self.cell_size
+        inset = size // 20
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(surface, HINT_COLOR, (inset, inset, size - 2 * inset, size - 2 * inset),
+                         max(2, size * 6 // 200), border_radius=max(2, size // 20))
+        return surface.convert_alpha()
+
+    def _render_text(self, message):
+        """상단 문구 Surface 를 캐시에서 찾거나 새로 만듭니다."""
+        text = self._text_cache.get(message)
+        if text is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            text = self._text_cache[message] = self.font.render(message, True, WHITE)
+        return text
+
+    # --- 전체 그리기 ---
+    def cell_rect(self, cell):
+        """칸 인덱스의 화면 영역을 반환합니다."""
+        row, col = divmod(cell, self.geometry.cols)
+        return pygame.Rect(col * self.cell_size + self.board_left, row * self.cell_size + self.board_top,
+                           self.cell_size, self.cell_size)
+
+    def cell_at(self, pos):
+        """화면 좌표에 있는 칸 인덱스를 반환합니다. 보드 밖이면 None 입니다."""
+        row = (pos[1] - self.board_top) // self.cell_size
+        col = (pos[0] - self.board_left) // self.cell_size
+        if 0 <= row < self.geometry.rows and 0 <= col < self.geometry.cols:
+            return row * self.geometry.cols + col
+        return None
+
+    def header_rect(self):
+        """상단 문구 영역을 반환합니다."""
+        return pygame.Rect(0, 0, self.screen.get_width(), self.header_height)
+
+    def draw_grid(self):
+        """격자무늬를 그리는 함수"""
+        self.screen.blit(self.background, (0, 0))
+
+    def draw_markers(self, engine, hidden_cell=None):
+        """보드 상태에 따라 'O'와 'X'를 그리고, 깜빡임으로 숨길 칸은 건너뜁니다."""
+        for cell in range(self.geometry.cell_count):
+            if cell != hidden_cell:
+                self._blit_marker(engine.cell_owner(cell), self.cell_rect(cell))
+
+    def draw_hint(self, hint_cell):
+        """추천 칸을 테두리로 표시하는 함수"""
+        self.screen.blit(self.hint_sprite, self.cell_rect(hint_cell))
+
+    def draw_win_line(self, engine):
+        """승리 라인을 그리는 함수"""
+        cols, cell_size = self.geometry.cols, self.cell_size
+        win_cells = engine.win_cells
+        win_color = X_COLOR if engine.winner == 1 else O_COLOR
+        first_row, first_col = divmod(win_cells[0], cols)
+        last_row, last_col = divmod(win_cells[-1], cols)
+
+        # 양 끝 칸의 중심에서 라인 방향으로 칸 가장자리 근처(셀 크기 200 기준 15px 안쪽)까지 늘려서 그림
+        extend = cell_size // 2 - cell_size * 15 // 200
+        d_row = (last_row > first_row) - (last_row < first_row)
+        d_col = (last_col > first_col) - (last_col < first_col)
+        left, top = self.board_left + cell_size // 2, self.board_top + cell_size // 2
+        start = (first_col * cell_size + left - d_col * extend, first_row * cell_size + top - d_row * extend)
+        end = (last_col * cell_size + left + d_col * extend, last_row * cell_size + top + d_row * extend)
+        pygame.draw.line(self.screen, win_color, start, end, self.win_line_width)
+
+    def draw_ui_elements(self, message, game_over):
+        """상태 메시지와 UI 요소를 그리는 함수"""
+        text = self._render_text(message)
+        self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, self.header_height // 2)))
+
+        if game_over:
+            pygame.draw.rect(self.screen, BUTTON_COLOR, self.button_rect, border_radius=10)
+            self.screen.blit(self.button_text, self.button_text.get_rect(center=self.button_rect.center))
+
+    def _blit_marker(self, owner, rect):
+        if owner == 1:
+            self.screen.blit(self.x_sprite, rect)
+        elif owner == -1:
+            self.screen.blit(self.o_sprite, rect)
+
+    def _phase(self, name):
+        """프로파일러가 있으면 그리기 단계 name 의 시간을 재는 컨텍스트를 반환합니다."""
+        return self.profiler.phase(name) if self.profiler is not None else _NULL_PHASE
+
+    # --- 변경된 영역만 그리기 ---
+    def next_change(self, engine):
+        """깜빡임으로 화면이 다음에 바뀔 때까지 남은 시간(ms)을 반환합니다. 깜빡일 말이 없으면 None 입니다."""
+        if engine.winner != 0 or engine.next_removal(engine.player) is None:
+            return None
+        return BLINK_INTERVAL - pygame.time.get_ticks() % BLINK_INTERVAL
+
+    def invalidate(self):
+        """다음 render 호출에서 화면 전체를 다시 그리도록 합니다."""
+        self._drawn = None
+
+    def render(self, engine, message, hint_cell=None, now=None):
+        """바뀐 부분만 다시 그리고 화면에 반영해야 할 사각형 목록을 반환합니다.
+
+        깜빡임 단계는 now(ms, 기본값 pygame.time.get_ticks())로 정하므로 고정하면 결과가 시각과 무관해집니다.
+        """
+        game_over = engine.winner != 0
+        hidden_cell = None
+        if now is None:
+            now = pygame.time.get_ticks()
+        if not game_over and (now // BLINK_INTERVAL) % 2 == 0:
+            hidden_cell = engine.next_removal(engine.player)
+        state = (engine.mask(1), engine.mask(-1), hidden_cell, hint_cell, message, game_over)
+
+        drawn = self._drawn
+        if drawn == state:
+            return []
+        self._drawn = state
+
+        # 처음 그리거나 게임이 끝난 뒤에는 승리 라인과 버튼까지 전체를 그림
+        if drawn is None or game_over or drawn[5]:
+            with self._phase('grid'):
+                self.draw_grid()
+            with self._phase('markers'):
+                self.draw_markers(engine, hidden_cell)
+                if hint_cell is not None:
+                    self.draw_hint(hint_cell)
+                if game_over:
+                    self.draw_win_line(engine)
+            with self._phase('text'):
+                self.draw_ui_elements(message, game_over)
+            return [self.screen.get_rect()]
+
+        dirty = []
+        old_x, old_o, old_hidden, old_hint, old_message, _ = drawn
+        changed = (state[0] ^ old_x) | (state[1] ^ old_o)
+        for old, new in ((old_hidden, hidden_cell), (old_hint, hint_cell)):
+            if old != new:
+                for cell in (old, new):
+                    if cell is not None:
+                        changed |= 1 << cell
+        with self._phase('markers'):
+            while changed:
+                low = changed & -changed
+                cell = low.bit_length() - 1
+                changed ^= low
+                rect = self.cell_rect(cell)
+                self.screen.blit(self.background, rect, rect)
+                if cell != hidden_cell:
+                    self._blit_marker(engine.cell_owner(cell), rect)
+                if cell == hint_cell:
+                    self.draw_hint(cell)
+                dirty.append(rect)
+
+        if message != old_message:
+            with self._phase('text'):
+                rect = self.header_rect()
+                self.screen.blit(self.background, rect, rect)
+                self.draw_ui_elements(message, False)
+            dirty.append(rect)
+        return dirty
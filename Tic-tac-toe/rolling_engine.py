@@ -0,0 +1,326 @@
+"""순환 틱택토(각 플레이어 최대 3개의 말, 가장 오래된 말이 사라짐) 규칙 엔진.
+
+보드 크기(N×N), 승리에 필요한 연속 개수(K), 플레이어별 말 개수는 바꿀 수 있으며 기본값은
+3×3, 3목, 말 3개입니다. pygame 을 사용하지 않으므로 시뮬레이션, 분석 도구에서 그대로
+가져다 쓸 수 있습니다.
+"""
+from functools import lru_cache
+
+
+class BoardGeometry:
+    """보드 크기와 승리 조건에 따라 미리 계산해 두는 표들을 담는 클래스"""
+
+    __slots__ = ('rows', 'cols', 'win_length', 'max_pieces', 'cell_count', 'full_mask',
+                 'lines', 'line_masks', 'cell_lines', 'mask_cells', 'slot_bits', 'slot_mask')
+
+    def __init__(self, rows, cols, win_length, max_pieces):
+        if win_length > max(rows, cols):
+            raise ValueError("win_length does not fit on the board")
+        if max_pieces < win_length:
+            raise ValueError("max_pieces must be at least win_length")
+        self.rows = rows
+        self.cols = cols
+        self.win_length = win_length
+        self.max_pieces = max_pieces
+        self.cell_count = rows * cols
+        self.full_mask = (1 << self.cell_count) - 1
+
+        # 셀 인덱스 = row * cols + col
+        # 승리 라인 순서: 가로, 세로, 대각선(↘), 대각선(↙) 방향의 길이 K 구간
+        lines = []
+        for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for row in range(rows):
+                for col in range(cols):
+                    end_row = row + d_row * (win_length - 1)
+                    end_col = col + d_col * (win_length - 1)
+                    if 0 <= end_row < rows and 0 <= end_col < cols:
+                        lines.append(tuple((row + d_row * i) * cols + col + d_col * i
+                                           for i in range(win_length)))
+        self.lines = tuple(lines)
+        self.line_masks = tuple(sum(1 << cell for cell in line) for line in self.lines)
+
+        # 각 셀을 지나는 승리 라인 번호. 말을 제거해서는 새 라인이 생기지 않으므로
+        # 방금 놓은 셀을 지나는 라인(방향마다 최대 K개)만 검사하면 됩니다.
+        cell_lines = [[] for _ in range(self.cell_count)]
+        for i, line in enumerate(self.lines):
+            for cell in line:
+                cell_lines[cell].append(i)
+        self.cell_lines = tuple(tuple(ids) for ids in cell_lines)
+
+        # 작은 보드는 마스크 -> 켜진 셀 인덱스 튜플 표로 legal_moves 를 할당 없이 반환
+        if self.cell_count <= 16:
+            self.mask_cells = tuple(
+                tuple(cell for cell in range(self.cell_count) if mask >> cell & 1)
+                for mask in range(1 << self.cell_count)
+            )
+        else:
+            self.mask_cells = None
+
+        # 말 순서 큐는 슬롯마다 (셀 + 1)을 담고, 가장 오래된 말이 최하위 슬롯에 옵니다.
+        self.slot_bits = max(4, self.cell_count.bit_length())
+        self.slot_mask = (1 << self.slot_bits) - 1
+
+
+def board_geometry(rows=3, cols=3, win_length=3, max_pieces=3):
+    """같은 설정의 보드들이 공유할 BoardGeometry 를 반환합니다. 같은 설정이면 항상 같은 객체입니다."""
+    return _cached_geometry(rows, cols, win_length, max_pieces)
+
+
+@lru_cache(maxsize=None)
+def _cached_geometry(rows, cols, win_length, max_pieces):
+    # lru_cache 는 위치 인자와 키워드 인자, 생략한 기본값을 서로 다른 키로 보므로 항상 위치 인자로 부름
+    return BoardGeometry(rows, cols, win_length, max_pieces)
+
+
+# --- 기본(3×3) 보드 상수 ---
+DEFAULT_GEOMETRY = board_geometry()
+BOARD_ROWS = DEFAULT_GEOMETRY.rows
+BOARD_COLS = DEFAULT_GEOMETRY.cols
+CELL_COUNT = DEFAULT_GEOMETRY.cell_count
+MAX_PIECES = DEFAULT_GEOMETRY.max_pieces
+FULL_MASK = DEFAULT_GEOMETRY.full_mask
+WIN_LINES = DEFAULT_GEOMETRY.lines
+LINE_MASKS = DEFAULT_GEOMETRY.line_masks
+CELL_LINES = DEFAULT_GEOMETRY.cell_lines
+MASK_CELLS = DEFAULT_GEOMETRY.mask_cells
+SLOT_BITS = DEFAULT_GEOMETRY.slot_bits
+SLOT_MASK = DEFAULT_GEOMETRY.slot_mask
+
+
+def _side_index(side):
+    """플레이어 값(1: X, -1: O)을 내부 배열 인덱스(0, 1)로 바꿉니다."""
+    return 0 if side == 1 else 1
+
+
+class RollingBoard:
+    """비트보드로 표현한 순환 틱택토 상태와 착수/무르기 로직을 담당하는 클래스"""
+
+    __slots__ = ('geometry', 'player', 'winner', 'win_line', '_masks', '_queues', '_counts', '_history')
+
+    def __init__(self, player=1, geometry=DEFAULT_GEOMETRY):
+        """빈 보드와 먼저 둘 플레이어(1: X, -1: O), 보드 설정으로 초기화합니다."""
+        self.geometry = geometry
+        self.player = player    # 이번에 둘 차례인 플레이어
+        self.winner = 0         # 0: 게임 중, 1 / -1: 승리한 플레이어
+        self.win_line = None    # 승리 라인 번호 (geometry.lines 인덱스)
+        self._masks = [0, 0]    # 플레이어별 말 위치 비트마스크
+        self._queues = [0, 0]   # 플레이어별 말 순서 큐 (오래된 순)
+        self._counts = [0, 0]   # 플레이어별 보드 위 말 개수
+        self._history = []      # 무르기용 (놓은 셀, 사라진 셀 또는 -1)
+
+    @classmethod
+    def from_moves(cls, x_moves, o_moves, player=1, geometry=DEFAULT_GEOMETRY):
+        """플레이어별 말 위치(오래된 순서)로부터 보드를 만듭니다. 승리 여부는 검사하지 않습니다."""
+        board = cls(player, geometry)
+        for i, cells in enumerate((x_moves, o_moves)):
+            queue = mask = 0
+            for slot, cell in enumerate(cells):
+                queue |= (cell + 1) << (geometry.slot_bits * slot)
+                mask |= 1 << cell
+            board._masks[i] = mask
+            board._queues[i] = queue
+            board._counts[i] = len(cells)
+        return board
+
+    @classmethod
+    def from_snapshot(cls, data, geometry=DEFAULT_GEOMETRY):
+        """snapshot() 으로 만든 bytes 에서 보드를 복원합니다. 직전 수로 끝난 게임이면 승자도 복원합니다."""
+        player = -1 if data[0] else 1
+        x_count = data[1]
+        x_moves = tuple(data[2:2 + x_count])
+        o_moves = tuple(data[3 + x_count:3 + x_count + data[2 + x_count]])
+        board = cls.from_moves(x_moves, o_moves, player, geometry)
+        board.restore_winner()
+        return board
+
+    def restore_winner(self):
+        """직전에 둔 플레이어(차례가 아닌 쪽)의 승리 라인이 있으면 승자와 승리 라인을 채웁니다."""
+        mover = -self.player
+        mover_mask = self.mask(mover)
+        for line, line_mask in enumerate(self.geometry.line_masks):
+            if mover_mask & line_mask == line_mask:
+                self.winner = mover
+                self.win_line = line
+                break
+        return self.winner
+
+    def snapshot(self):
+        """리플레이 키프레임용으로 차례와 플레이어별 말 순서를 담은 bytes 를 반환합니다."""
+        x_moves, o_moves = self.moves(1), self.moves(-1)
+        return bytes((self.player == -1, len(x_moves), *x_moves, len(o_moves), *o_moves))
+
+    def copy(self):
+        """현재 상태를 복사한 새 보드를 반환합니다."""
+        other = RollingBoard.__new__(RollingBoard)
+        other.geometry = self.geometry
+        other.player = self.player
+        other.winner = self.winner
+        other.win_line = self.win_line
+        other._masks = self._masks[:]
+        other._queues = self._queues[:]
+        other._counts = self._counts[:]
+        other._history = self._history[:]
+        return other
+
+    # --- 상태 조회 ---
+    @property
+    def game_over(self):
+        """승자가 결정되었는지 여부를 반환합니다."""
+        return self.winner != 0
+
+    @property
+    def win_cells(self):
+        """승리 라인을 이루는 칸들을 반환합니다. 승자가 없으면 None 입니다."""
+        if self.win_line is None:
+            return None
+        return self.geometry.lines[self.win_line]
+
+    def mask(self, side):
+        """플레이어의 말 위치 비트마스크를 반환합니다."""
+        return self._masks[_side_index(side)]
+
+    def occupied(self):
+        """말이 놓인 모든 칸의 비트마스크를 반환합니다."""
+        return self._masks[0] | self._masks[1]
+
+    def cell_owner(self, cell):
+        """칸의 주인(1, -1)을 반환하고, 빈 칸이면 0을 반환합니다."""
+        bit = 1 << cell
+        if self._masks[0] & bit:
+            return 1
+        if self._masks[1] & bit:
+            return -1
+        return 0
+
+    def piece_count(self, side):
+        """플레이어가 보드 위에 가진 말 개수를 반환합니다."""
+        return self._counts[_side_index(side)]
+
+    def moves(self, side):
+        """플레이어의 말 위치를 오래된 순서대로 반환합니다."""
+        geometry = self.geometry
+        queue = self._queues[_side_index(side)]
+        cells = []
+        while queue:
+            cells.append((queue & geometry.slot_mask) - 1)
+            queue >>= geometry.slot_bits
+        return tuple(cells)
+
+    def next_removal(self, side):
+        """다음 착수 때 사라질 말의 위치를 반환합니다. 말이 최대 개수보다 적으면 None 입니다."""
+        i = _side_index(side)
+        if self._counts[i] < self.geometry.max_pieces:
+            return None
+        return (self._queues[i] & self.geometry.slot_mask) - 1
+
+    def queue_code(self, side):
+        """플레이어의 말 순서 큐(슬롯 x 최대 말 개수)를 정수 그대로 반환합니다."""
+        return self._queues[_side_index(side)]
+
+    def key(self):
+        """두 플레이어의 말 순서와 차례를 하나의 정수로 묶은 상태 키를 반환합니다."""
+        width = self.geometry.slot_bits * self.geometry.max_pieces
+        return self._queues[0] | self._queues[1] << width | (self.player == -1) << (2 * width)
+
+    def legal_moves(self):
+        """둘 수 있는 빈 칸의 인덱스 튜플을 반환합니다. 게임이 끝났으면 빈 튜플입니다."""
+        if self.winner:
+            return ()
+        geometry = self.geometry
+        empty = geometry.full_mask & ~(self._masks[0] | self._masks[1])
+        if geometry.mask_cells is not None:
+            return geometry.mask_cells[empty]
+        cells = []
+        while empty:
+            low = empty & -empty
+            cells.append(low.bit_length() - 1)
+            empty ^= low
+        return tuple(cells)
+
+    # --- 착수 / 무르기 ---
+    def play(self, cell):
+        """현재 플레이어의 말을 놓고, 필요하면 가장 오래된 말을 제거한 뒤 승리를 확인합니다."""
+        if self.winner:
+            raise ValueError("game is already over")
+        bit = 1 << cell
+        if (self._masks[0] | self._masks[1]) & bit:
+            raise ValueError(f"cell {cell} is occupied")
+
+        geometry = self.geometry
+        slot_bits = geometry.slot_bits
+        i = _side_index(self.player)
+        mask = self._masks[i]
+        queue = self._queues[i]
+        count = self._counts[i]
+        removed = -1
+
+        if count == geometry.max_pieces:
+            removed = (queue & geometry.slot_mask) - 1
+            queue >>= slot_bits
+            mask &= ~(1 << removed)
+            count -= 1
+
+        queue |= (cell + 1) << (slot_bits * count)
+        mask |= bit
+        self._masks[i] = mask
+        self._queues[i] = queue
+        self._counts[i] = count + 1
+        self._history.append((cell, removed))
+
+        # 말을 제거해서는 새 라인이 생기지 않으므로 방금 놓은 칸을 지나는 라인만 검사 (O(K))
+        line_masks = geometry.line_masks
+        for line in geometry.cell_lines[cell]:
+            line_mask = line_masks[line]
+            if mask & line_mask == line_mask:
+                self.winner = self.player
+                self.win_line = line
+                break
+
+        self.player = -self.player
+        return removed
+
+    def undo(self):
+        """마지막 착수를 되돌립니다."""
+        cell, removed = self._history.pop()
+        self.player = -self.player
+        self.winner = 0
+        self.win_line = None
+
+        geometry = self.geometry
+        slot_bits = geometry.slot_bits
+        i = _side_index(self.player)
+        count = self._counts[i]
+        queue = self._queues[i] & ~(geometry.slot_mask << (slot_bits * (count - 1)))
+        mask = self._masks[i] & ~(1 << cell)
+
+        if removed >= 0:
+            queue = (queue << slot_bits) | (removed + 1)
+            mask |= 1 << removed
+        else:
+            self._counts[i] = count - 1
+
+        self._masks[i] = mask
+        self._queues[i] = queue
+
+
+# --- 리플레이 기록 ---
+def move_bits(geometry=DEFAULT_GEOMETRY):
+    """리플레이에 칸 인덱스 하나를 담는 비트 수를 반환합니다 (3×3 보드는 4비트)."""
+    return max(4, (geometry.cell_count - 1).bit_length())
+
+
+def replay_info(geometry=DEFAULT_GEOMETRY):
+    """리플레이 헤더에 저장할 보드 설정을 반환합니다."""
+    return {'game': 'rolling-tic-tac-toe', 'rows': geometry.rows, 'cols': geometry.cols,
+            'win_length': geometry.win_length, 'max_pieces': geometry.max_pieces}
+
+
+def replay_board(reader, k):
+    """리플레이에서 k수를 둔 뒤의 보드를 복원합니다."""
+    info = reader.info
+    geometry = board_geometry(info['rows'], info['cols'], info['win_length'], info['max_pieces'])
+    keyframe, moves = reader.seek(k)
+    board = RollingBoard.from_snapshot(keyframe, geometry)
+    for cell in moves:
+        board.play(cell)
+    return board
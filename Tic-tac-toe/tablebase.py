@@ -0,0 +1,253 @@
+"""순환 틱택토의 후퇴 분석(retrograde analysis) 솔버와 메모리 맵 테이블베이스.
+
+말이 사라지는 규칙 때문에 게임 그래프에 순환이 생겨 단순 미니맥스로는 끝나지 않습니다.
+도달 가능한 모든 (말 배치, 말 순서, 차례) 상태를 열거한 뒤, 끝난 상태에서부터 거꾸로
+승/패와 결과까지의 수(distance)를 채워 넣고, 끝내 결정되지 않은 상태는 무승부로 둡니다.
+
+사용법: python tablebase.py [출력 경로]
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import deque
+
+from rolling_engine import RollingBoard, CELL_COUNT, MAX_PIECES, SLOT_BITS, LINE_MASKS
+
+# --- 파일 형식 ---
+# 헤더: 매직(4바이트), 버전(u16), 예약(u16), 항목 수(u32)
+# 본문: 상태 인덱스마다 1바이트
+#   0        : 무승부 (또는 도달 불가능한 상태)
+#   2d + 1   : 차례인 플레이어가 d 수 안에 승리
+#   2d + 2   : 차례인 플레이어가 d 수 뒤에 패배 (d = 0 이면 이미 진 상태)
+MAGIC = b'RTTB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rolling_ttt.tb')
+
+WIN, DRAW, LOSS = 1, 0, -1
+
+
+def _build_queue_ranks():
+    """4비트 슬롯 큐 값(0~4095)과 서로 다른 칸 최대 3개의 순열 번호를 잇는 표를 만듭니다."""
+    ranks = array('h', [-1]) * (1 << (SLOT_BITS * MAX_PIECES))
+    sequences = [()]
+    for length in range(1, MAX_PIECES + 1):
+        sequences += [
+            seq + (cell,)
+            for seq in sequences if len(seq) == length - 1
+            for cell in range(CELL_COUNT) if cell not in seq
+        ]
+    for rank, seq in enumerate(sequences):
+        code = 0
+        for slot, cell in enumerate(seq):
+            code |= (cell + 1) << (SLOT_BITS * slot)
+        ranks[code] = rank
+    return ranks, sequences
+
+
+QUEUE_RANKS, QUEUE_SEQUENCES = _build_queue_ranks()
+QUEUE_COUNT = len(QUEUE_SEQUENCES)
+ENTRY_COUNT = QUEUE_COUNT * QUEUE_COUNT * 2
+
+
+def state_index(board):
+    """보드 상태를 테이블베이스 인덱스로 바꿉니다. O(1) 입니다."""
+    rank_x = QUEUE_RANKS[board.queue_code(1)]
+    rank_o = QUEUE_RANKS[board.queue_code(-1)]
+    return (rank_x * QUEUE_COUNT + rank_o) * 2 + (board.player == -1)
+
+
+def decode_value(value):
+    """저장된 1바이트 값을 (결과, 결과까지의 수) 로 바꿉니다."""
+    if value == 0:
+        return DRAW, 0
+    if value & 1:
+        return WIN, (value - 1) >> 1
+    return LOSS, (value - 2) >> 1
+
+
+def _board_from_index(index):
+    """테이블베이스 인덱스로부터 보드를 복원합니다. (솔버 전용)"""
+    rank_x, rank_o = divmod(index >> 1, QUEUE_COUNT)
+    return RollingBoard.from_moves(QUEUE_SEQUENCES[rank_x], QUEUE_SEQUENCES[rank_o],
+                                   -1 if index & 1 else 1)
+
+
+# --- 솔버 ---
+def solve():
+    """도달 가능한 모든 상태를 열거하고 후퇴 분석으로 결과를 채운 bytearray 를 반환합니다."""
+    values = bytearray(ENTRY_COUNT)
+    reachable = bytearray(ENTRY_COUNT)
+    remaining = array('b', [0]) * ENTRY_COUNT  # 아직 결정되지 않은 자식 수
+    predecessors = {}
+
+    # 1) 두 시작 상태(X 선공, O 선공)에서 도달 가능한 상태를 BFS 로 열거
+    frontier = deque()
+    for first in (1, -1):
+        start = state_index(RollingBoard(first))
+        reachable[start] = 1
+        frontier.append(start)
+
+    terminals = []
+    while frontier:
+        index = frontier.popleft()
+        board = _board_from_index(index)
+        # 상대가 이미 라인을 완성한 상태는 게임이 끝난 상태
+        opponent_mask = board.mask(-board.player)
+        if any(opponent_mask & line == line for line in LINE_MASKS):
+            terminals.append(index)
+            continue
+
+        moves = board.legal_moves()
+        remaining[index] = len(moves)
+        for cell in moves:
+            board.play(cell)
+            child = state_index(board)
+            board.undo()
+            predecessors.setdefault(child, []).append(index)
+            if not reachable[child]:
+                reachable[child] = 1
+                frontier.append(child)
+
+    # 2) 끝난 상태(패배, 0수)에서부터 거리 순서대로 거꾸로 전파
+    queue = deque()
+    for index in terminals:
+        values[index] = 2
+        queue.append(index)
+
+    while queue:
+        index = queue.popleft()
+        result, distance = decode_value(values[index])
+        for parent in predecessors.get(index, ()):
+            if values[parent]:
+                continue
+            if result == LOSS:
+                # 상대를 패배 상태로 보내는 수가 있으면 승리 (가장 먼저 찾은 것이 최단)
+                values[parent] = 2 * (distance + 1) + 1
+                queue.append(parent)
+            else:
+                # 모든 수가 상대의 승리로 이어지면 패배 (가장 늦게 확정된 것이 최장)
+                remaining[parent] -= 1
+                if remaining[parent] == 0:
+                    values[parent] = 2 * (distance + 1) + 2
+                    queue.append(parent)
+    return values
+
+
+def write_tablebase(path=DEFAULT_PATH, values=None):
+    """솔버 결과를 테이블베이스 파일로 저장합니다."""
+    if values is None:
+        values = solve()
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(values)))
+        f.write(values)
+    os.replace(tmp_path, path)
+    return path
+
+
+# --- 조회 ---
+class Tablebase:
+    """메모리 맵으로 연 테이블베이스에서 상태의 결과와 최선의 수를 조회하는 클래스"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """테이블베이스 파일을 읽기 전용 메모리 맵으로 엽니다."""
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or count != ENTRY_COUNT:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compatible tablebase")
+        self._offset = HEADER.size
+
+    def close(self):
+        """메모리 맵을 닫습니다."""
+        self._mm.close()
+
+    def buffer(self):
+        """값 표를 복사 없이 읽을 (버퍼, 첫 값의 위치) 를 반환합니다. 값 하나가 1바이트이고 state_index 순서입니다.
+
+        NumPy 배열로 감싸 쓰는 동안에는 close() 할 수 없습니다.
+        """
+        return self._mm, self._offset
+
+    def probe(self, board):
+        """차례인 플레이어 기준의 (결과, 결과까지의 수) 를 반환합니다."""
+        return decode_value(self._mm[self._offset + state_index(board)])
+
+    def best_move(self, board):
+        """테이블베이스 기준 최선의 수를 반환합니다. 둘 수 있는 칸이 없으면 None 입니다."""
+        best_cell, best_score = None, None
+        for cell in board.legal_moves():
+            board.play(cell)
+            if board.winner:
+                board.undo()
+                return cell
+            result, distance = self.probe(board)
+            board.undo()
+            # 상대 기준 결과이므로 상대의 패배가 가장 좋고, 빨리 이길수록 / 늦게 질수록 좋음
+            if result == LOSS:
+                score = (2, -distance)
+            elif result == DRAW:
+                score = (1, 0)
+            else:
+                score = (0, distance)
+            if best_score is None or score > best_score:
+                best_cell, best_score = cell, score
+        return best_cell
+
+
+def load_tablebase(path=DEFAULT_PATH, build_if_missing=False):
+    """테이블베이스를 엽니다. 파일이 없으면 새로 만들거나(build_if_missing) None 을 반환합니다."""
+    if not os.path.exists(path):
+        if not build_if_missing:
+            return None
+        write_tablebase(path)
+    return Tablebase(path)
+
+
+class TablebaseLoader:
+    """게임 루프를 막지 않도록 처음 필요할 때 테이블베이스를 열고, 파일이 없으면 백그라운드 스레드에서 만드는 클래스"""
+
+    def __init__(self, path=DEFAULT_PATH, on_done=None):
+        """테이블베이스 경로와, 백그라운드에서 다 만들었을 때 그 스레드에서 부를 함수를 받습니다."""
+        self.path = path
+        self.on_done = on_done
+        self.table = None
+        self._thread = None
+
+    @property
+    def loading(self):
+        """테이블베이스를 만드는 중인지 여부를 반환합니다."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get(self):
+        """열린 테이블베이스를 반환합니다. 파일이 없으면 처음 한 번 만들기를 시작하고, 다 만들 때까지 None 입니다."""
+        if self.table is None and self._thread is None:
+            if os.path.exists(self.path):
+                self.table = Tablebase(self.path)  # 메모리 맵으로 열기만 하므로 바로 끝남
+            else:
+                self._thread = threading.Thread(target=self._build, daemon=True)
+                self._thread.start()
+        return self.table
+
+    def _build(self):
+        try:
+            self.table = load_tablebase(self.path, build_if_missing=True)
+        finally:
+            if self.on_done is not None:
+                self.on_done()
+
+
+if __name__ == '__main__':
+    out_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    table = solve()
+    write_tablebase(out_path, table)
+    counts = {WIN: 0, DRAW: 0, LOSS: 0}
+    for value in table:
+        counts[decode_value(value)[0]] += 1
+    print(f"{out_path}: {len(table)} entries, win={counts[WIN]} loss={counts[LOSS]} draw/unreachable={counts[DRAW]}")
@@ -0,0 +1,184 @@
+"""순환 틱택토 에이전트 라운드 로빈 토너먼트.
+
+경기는 프로세스 풀에서 묶음(chunk) 단위로 실행되고, 결과는 끝나는 대로 승/무/패 표와
+Elo 점수에 누적됩니다. 경기 목록은 필요할 때마다 만들어지고 한 번에 들고 있는 묶음 수도
+제한되므로, 경기 수가 아무리 많아도 메모리 사용량은 일정합니다.
+
+사용법: python tournament.py --agents random greedy minimax:3 mcts:200 --rounds 1000
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import time
+from collections import deque
+
+from agents import make_agent
+from rolling_engine import RollingBoard
+
+ELO_K = 16
+INITIAL_ELO = 1500.0
+
+
+def match_seed(seed, index):
+    """토너먼트 시드와 경기 번호로 경기별 시드를 만듭니다. 프로세스와 무관하게 항상 같습니다."""
+    return (seed * 0x9E3779B1 + index * 0x85EBCA77) & 0xFFFFFFFFFFFF
+
+
+def play_match(agent_x, agent_o, seed, max_plies=200):
+    """두 에이전트의 한 경기를 진행하고 (승자, 수 개수) 를 반환합니다. 승자 0 은 무승부입니다."""
+    rng = random.Random(seed)
+    board = RollingBoard(rng.choice([1, -1]))
+    agent_x.reset()
+    agent_o.reset()
+    for ply in range(max_plies):
+        agent = agent_x if board.player == 1 else agent_o
+        board.play(agent.select_move(board, rng))
+        if board.winner:
+            return board.winner, ply + 1
+    return 0, max_plies
+
+
+# --- 작업 프로세스 ---
+_worker_agents = {}  # (참가 번호, 사양) -> 에이전트
+
+
+def _run_chunk(task):
+    """작업 프로세스에서 경기 묶음을 실행하고 (X 번호, O 번호, 승자, 수 개수) 목록을 반환합니다."""
+    specs, matches, seed, max_plies = task
+    results = []
+    for index, x, o in matches:
+        # 에이전트는 참가 번호마다 프로세스에서 한 번만 만들어 재사용. 사양이 같아도 번호가 다르면 따로 만들어
+        # 한 경기의 두 쪽이 탐색 표 같은 상태를 나눠 쓰지 않게 함
+        for i in (x, o):
+            if (i, specs[i]) not in _worker_agents:
+                _worker_agents[(i, specs[i])] = make_agent(specs[i])
+        winner, plies = play_match(_worker_agents[(x, specs[x])], _worker_agents[(o, specs[o])],
+                                   match_seed(seed, index), max_plies)
+        results.append((x, o, winner, plies))
+    return results
+
+
+def iter_matches(agent_count, rounds):
+    """(경기 번호, X 에이전트, O 에이전트) 를 라운드마다 모든 순서쌍에 대해 차례로 만듭니다."""
+    index = itertools.count()
+    for _ in range(rounds):
+        for x, o in itertools.permutations(range(agent_count), 2):
+            yield next(index), x, o
+
+
+# --- 집계 ---
+class Standings:
+    """경기 결과를 받는 대로 승/무/패 표와 Elo 점수에 누적하는 클래스"""
+
+    def __init__(self, specs):
+        """참가 에이전트 사양 목록으로 빈 표를 만듭니다."""
+        self.specs = list(specs)
+        count = len(self.specs)
+        self.wins = [0] * count
+        self.draws = [0] * count
+        self.losses = [0] * count
+        self.plies = 0
+        self.head_to_head = [[0.0] * count for _ in range(count)]  # [a][b]: a 가 b 에게 얻은 점수
+        self.elo = [INITIAL_ELO] * count
+
+    def add(self, x, o, winner, plies):
+        """한 경기 결과를 반영합니다."""
+        self.plies += plies
+        score_x = 1.0 if winner == 1 else 0.0 if winner == -1 else 0.5
+        if winner == 1:
+            self.wins[x] += 1
+            self.losses[o] += 1
+        elif winner == -1:
+            self.wins[o] += 1
+            self.losses[x] += 1
+        else:
+            self.draws[x] += 1
+            self.draws[o] += 1
+        self.head_to_head[x][o] += score_x
+        self.head_to_head[o][x] += 1.0 - score_x
+
+        expected_x = 1.0 / (1.0 + 10 ** ((self.elo[o] - self.elo[x]) / 400))
+        delta = ELO_K * (score_x - expected_x)
+        self.elo[x] += delta
+        self.elo[o] -= delta
+
+    def table(self):
+        """Elo 순으로 정렬한 결과 표와, 같은 순서의 상대 전적(행 에이전트가 열 에이전트에게 얻은 점수율) 표 문자열을 반환합니다."""
+        lines = [f"{'agent':<16}{'elo':>8}{'win':>10}{'draw':>10}{'loss':>10}{'score':>8}"]
+        order = sorted(range(len(self.specs)), key=lambda i: -self.elo[i])
+        for i in order:
+            played = self.wins[i] + self.draws[i] + self.losses[i]
+            score = (self.wins[i] + 0.5 * self.draws[i]) / played if played else 0.0
+            lines.append(f"{self.specs[i]:<16}{self.elo[i]:>8.1f}{self.wins[i]:>10}"
+                         f"{self.draws[i]:>10}{self.losses[i]:>10}{score:>8.3f}")
+
+        # 상대 전적: 열 번호는 행 번호와 같은 에이전트
+        lines.append('')
+        lines.append(f"{'head-to-head':<16}" + ''.join(f"{rank:>8}" for rank in range(1, len(order) + 1)))
+        for rank, a in enumerate(order, 1):
+            cells = []
+            for b in order:
+                played = self.head_to_head[a][b] + self.head_to_head[b][a]  # 한 경기의 점수 합은 1
+                cells.append(f"{self.head_to_head[a][b] / played:>8.3f}" if played else f"{'-':>8}")
+            lines.append(f"{f'{rank}. {self.specs[a]}':<16}" + ''.join(cells))
+        return '\n'.join(lines)
+
+
+# --- 실행 ---
+def run_tournament(specs, rounds, seed=0, processes=None, chunk_size=64, max_plies=200,
+                   on_progress=None):
+    """라운드 로빈 토너먼트를 실행하고 최종 Standings 를 반환합니다.
+
+    결과 순서가 시드에 대해 결정적이도록 묶음은 제출한 순서대로 받지만, 동시에 처리 중인
+    묶음 수는 프로세스 수의 몇 배로 제한합니다.
+    """
+    processes = processes or os.cpu_count() or 1
+    standings = Standings(specs)
+    matches = iter_matches(len(specs), rounds)
+    chunks = iter(lambda: list(itertools.islice(matches, chunk_size)), [])
+    tasks = ((tuple(specs), chunk, seed, max_plies) for chunk in chunks)
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = deque()
+        for task in itertools.islice(tasks, processes * 4):
+            pending.append(pool.apply_async(_run_chunk, (task,)))
+        done_chunks = 0
+        while pending:
+            for result in pending.popleft().get():
+                standings.add(*result)
+            for task in itertools.islice(tasks, 1):
+                pending.append(pool.apply_async(_run_chunk, (task,)))
+            done_chunks += 1
+            if on_progress is not None:
+                on_progress(standings, done_chunks)
+    return standings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Round-robin tournament for rolling Tic-Tac-Toe agents")
+    parser.add_argument('--agents', nargs='+', default=['random', 'greedy', 'minimax:3', 'mcts:200'])
+    parser.add_argument('--rounds', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=64)
+    parser.add_argument('--max-plies', type=int, default=200)
+    parser.add_argument('--report-every', type=int, default=200, help="print standings every N chunks")
+    args = parser.parse_args()
+
+    for spec in args.agents:
+        make_agent(spec)  # 잘못된 사양은 작업을 나누기 전에 걸러냄
+
+    def report(standings, done_chunks):
+        if done_chunks % args.report_every == 0:
+            print(f"--- {done_chunks * args.chunk_size} matches ---")
+            print(standings.table())
+
+    started = time.perf_counter()
+    final = run_tournament(args.agents, args.rounds, args.seed, args.processes,
+                           args.chunk_size, args.max_plies, report)
+    elapsed = time.perf_counter() - started
+    total = args.rounds * len(args.agents) * (len(args.agents) - 1)
+    print(f"=== {total} matches in {elapsed:.2f}s ({total / elapsed:.0f} matches/s) ===")
+    print(final.table())
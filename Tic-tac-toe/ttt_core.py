@@ -0,0 +1,83 @@
+"""순환 틱택토 한 판의 진행 상태(화면과 무관한 게임 로직).
+
+pygame 을 가져오지 않으므로 테스트, 시뮬레이터, 서버에서 창 없이 바로 가져다 쓸 수 있습니다.
+화면 그리기와 입력 처리는 Tic-Tac-Toe.py 가 맡습니다. 공용 모듈(common)을 가져오므로 저장소 최상위
+폴더가 모듈 검색 경로에 있어야 하며, 경로 설정은 이 모듈을 쓰는 실행 스크립트가 맡습니다.
+"""
+import random
+
+from common.replay import ReplayWriter, new_replay_path
+from rolling_engine import RollingBoard, DEFAULT_GEOMETRY, move_bits, replay_info
+
+
+class GameSession:
+    """보드, 힌트, 게임 기록을 묶어 한 판을 진행하는 클래스"""
+
+    def __init__(self, geometry=DEFAULT_GEOMETRY, replay_dir=None, rng=None):
+        """보드 설정과 기록을 저장할 폴더(None 이면 기록하지 않음)를 받아 첫 판을 시작합니다."""
+        self.geometry = geometry
+        self.replay_dir = replay_dir
+        self.rng = rng if rng is not None else random.Random()
+        self.engine = None
+        self.hint_cell = None  # 'H' 키로 요청한 추천 칸
+        self.replay = None
+        self.reset()
+
+    # --- 상태 조회 ---
+    @property
+    def player(self):
+        """이번에 둘 차례인 플레이어 (1: X, -1: O)"""
+        return self.engine.player
+
+    @property
+    def winner(self):
+        """0: 게임 중, 1 / -1: 승리한 플레이어"""
+        return self.engine.winner
+
+    @property
+    def game_over(self):
+        return self.engine.winner != 0
+
+    def status_message(self, computer=None):
+        """상단에 표시할 상태 메시지를 만듭니다. computer 는 컴퓨터가 맡은 플레이어(없으면 None)입니다."""
+        if self.game_over:
+            return f'플레이어 {"1 (X)" if self.winner == 1 else "2 (O)"} 승리!'
+        if computer is not None and self.player == computer:
+            return f"컴퓨터 {'X' if self.player == 1 else 'O'} 생각 중..."
+        current_player_marker = "X" if self.player == 1 else "O"
+        return (f"플레이어 {current_player_marker} 턴 "
+                f"(말 {self.engine.piece_count(self.player)}/{self.geometry.max_pieces}개)")
+
+    # --- 진행 ---
+    def reset(self):
+        """새 판을 시작합니다. 시작 플레이어는 무작위로 정합니다."""
+        self.engine = RollingBoard(self.rng.choice([1, -1]), self.geometry)
+        self.hint_cell = None
+        self.start_replay()
+
+    def apply_move(self, cell):
+        """현재 플레이어의 말을 놓습니다. 말이 최대 개수면 가장 오래된 말은 엔진이 제거합니다."""
+        self.engine.play(cell)
+        if self.replay is not None:
+            self.replay.record(cell, self.engine.snapshot)
+        self.hint_cell = None
+
+    def request_hint(self, table):
+        """테이블베이스로 최선의 수를 찾아 hint_cell 에 저장합니다."""
+        if table is not None and not self.game_over:
+            self.hint_cell = table.best_move(self.engine)
+        return self.hint_cell
+
+    # --- 게임 기록 ---
+    def start_replay(self):
+        """이전 판의 기록을 닫고 현재 보드부터 새 기록을 시작합니다."""
+        self.close()
+        if self.replay_dir is not None:
+            self.replay = ReplayWriter(new_replay_path(self.replay_dir, 'tic-tac-toe'), replay_info(self.geometry),
+                                       move_bits(self.geometry), self.engine.snapshot())
+
+    def close(self):
+        """현재 기록을 닫습니다. 남은 기록은 백그라운드에서 파일에 씁니다."""
+        if self.replay is not None:
+            self.replay.close()
+            self.replay = None
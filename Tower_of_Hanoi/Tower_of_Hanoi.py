@@ -1,23 +1,51 @@
+import os
 import pygame
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 공용 모듈(common) 경로
+
+from hanoi_core import HanoiCore, MIN_DISKS, MAX_DISKS, MAX_AUTO_DISKS, MIN_PEGS, MAX_PEGS
+from common.display import ResizeDebouncer, apply_window_size, layout_scale, open_window, vertical_gradient
+from common.loop import FrameScheduler
+from common.profiler import FrameProfiler
+from common.profiler_overlay import ProfilerOverlay
+from sprites import ImageSprite, SpriteAtlas
+from text_cache import TextCache
+
 # --- 초기 설정 ---
-pygame.init()
-
-SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
-# 폰트 미리 로드
-try:
-    FONT_NAME = 'malgungothic'
-    UI_FONT = pygame.font.SysFont(FONT_NAME, 30)
-    WIN_FONT = pygame.font.SysFont(FONT_NAME, 60)
-    BIG_FONT = pygame.font.SysFont(FONT_NAME, 80)
-    SMALL_UI_FONT = pygame.font.SysFont(FONT_NAME, 24)
-except pygame.error:
-    FONT_NAME = None
-    UI_FONT = pygame.font.Font(FONT_NAME, 30)
-    WIN_FONT = pygame.font.Font(FONT_NAME, 60)
-    BIG_FONT = pygame.font.Font(FONT_NAME, 80)
-    SMALL_UI_FONT = pygame.font.Font(FONT_NAME, 24)
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600  # 기준 화면 크기 (창 크기가 다르면 배치를 이 비율대로 늘리거나 줄임)
+FPS = 60  # 원반을 끌거나 자동 풀이가 진행되는 동안의 프레임 수 (그 밖에는 입력이 있을 때만 그림)
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'replays')
+
+# 폰트 (시스템 폰트 목록 검색이 느리므로 import 할 때가 아니라 Game 을 만들 때 load_fonts 로 불러옴)
+FONT_NAME = 'malgungothic'
+UI_FONT = WIN_FONT = BIG_FONT = SMALL_UI_FONT = None
+FONT_SIZES = (30, 60, 80, 24)  # 기준 화면에서의 UI_FONT, WIN_FONT, BIG_FONT, SMALL_UI_FONT 크기
+MAX_CACHED_FONTS = 32
+_fonts = {}  # 글자 크기 -> Font (창 크기를 되돌렸을 때 다시 불러오지 않도록 보관)
+
+def _font(size):
+    global FONT_NAME
+    font = _fonts.get(size)
+    if font is None:
+        if len(_fonts) >= MAX_CACHED_FONTS:
+            _fonts.clear()
+        try:
+            font = pygame.font.SysFont(FONT_NAME, size) if FONT_NAME else pygame.font.Font(None, size)
+        except pygame.error:
+            FONT_NAME = None
+            font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+def load_fonts(scale=1.0):
+    """화면 배율에 맞는 크기로 폰트를 불러옵니다. 같은 크기의 폰트는 처음 한 번만 불러옵니다."""
+    global UI_FONT, WIN_FONT, BIG_FONT, SMALL_UI_FONT
+    pygame.font.init()
+    UI_FONT, WIN_FONT, BIG_FONT, SMALL_UI_FONT = (_font(max(8, round(size * scale))) for size in FONT_SIZES)
+
+# 글자 렌더링 결과 캐시 (같은 문구를 매 프레임 다시 래스터화하지 않도록 재사용)
+TEXT_CACHE = TextCache(maxsize=64)
 
 # --- 색상 정의 ---
 BG_TOP, BG_BOTTOM = (220, 230, 240), (180, 200, 220)
@@ -26,12 +54,100 @@ PEG_COLOR, BASE_COLOR = (100, 149, 237), (80, 100, 150)
 BORDER_COLOR = (50, 50, 50)
 BUTTON_COLOR, BUTTON_HOVER_COLOR = (240, 240, 240), (200, 200, 200)
 SUCCESS_COLOR = (60, 179, 113)
+HINT_FROM_COLOR, HINT_TO_COLOR = (255, 215, 0), SUCCESS_COLOR
 DISK_COLORS = [
     (255, 99, 71), (255, 165, 0), (255, 215, 0), (152, 251, 152),
     (100, 149, 237), (138, 43, 226), (238, 130, 238), (255, 192, 203),
     (192, 192, 192), (128, 128, 128)
 ]
 
+# --- 게임 화면 배치 (기준 화면 크기에서의 값) ---
+PEG_Y, PEG_HEIGHT, BASE_HEIGHT, PEG_WIDTH = 270, 280, 25, 15
+DISK_HEIGHT, MIN_DISK_WIDTH, DISK_WIDTH_STEP = 25, 70, 22
+PEG_HIT_WIDTH = 120  # 기둥을 클릭한 것으로 보는 최대 가로 폭 (힌트 표시 폭과 같음)
+MAX_DISK_SPAN = 1.34  # 가장 큰 원반 너비의 기둥 간격 대비 최대 비율 (기둥 3개일 때 원래 크기)
+MAX_STACK_HEIGHT = PEG_HEIGHT - 10  # 원반이 많을 때 쌓을 수 있는 최대 높이 (기둥 끝이 조금 보이도록)
+MIN_AUTO_DISK_WIDTH = PEG_WIDTH + 6  # 원반이 많을 때 가장 작은 원반의 너비 (기둥보다 조금 넓게)
+AUTO_LIFT_Y = PEG_Y - 40  # 자동 풀이에서 옮기는 원반이 기둥 위로 들려 지나가는 높이
+
+# 스프라이트 레이어 (숫자가 클수록 위에 그려짐)
+LAYER_HINT, LAYER_PEG, LAYER_DISK, LAYER_DRAG, LAYER_UI = 0, 1, 2, 3, 4
+
+
+class ScreenLayout:
+    """창 크기에 맞춰 기준 화면의 배치를 늘리거나 줄인 좌표와 크기.
+
+    세로 위치, 높이, 글자는 가로세로 비율을 지키는 배율로 바꾸고, 기둥은 창 너비 전체에 고르게 놓습니다.
+    창이 기준 화면보다 세로로 길면 남는 높이를 위아래에 나눠 화면 내용을 가운데에 둡니다.
+    """
+
+    def __init__(self, size):
+        self.width, self.height = size
+        self.scale = layout_scale(size, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.top = max(0, (self.height - self.scaled(SCREEN_HEIGHT)) // 2)
+        self.peg_y = self.top + self.scaled(PEG_Y)
+        self.peg_height = self.scaled(PEG_HEIGHT)
+        self.peg_width = max(3, self.scaled(PEG_WIDTH))
+        self.base_height = self.scaled(BASE_HEIGHT)
+        self.disk_height = max(2, self.scaled(DISK_HEIGHT))
+        self.peg_hit_width = self.scaled(PEG_HIT_WIDTH)
+        self.max_stack_height = self.scaled(MAX_STACK_HEIGHT)
+        self.min_auto_disk_width = self.scaled(MIN_AUTO_DISK_WIDTH)
+        self.lift_y = self.top + self.scaled(AUTO_LIFT_Y)
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def scaled(self, value):
+        """기준 화면에서의 길이를 현재 배율로 바꿉니다."""
+        return round(value * self.scale)
+
+    def centered_rect(self, dx, dy, width, height):
+        """기준 화면에서 가운데로부터 (dx, dy) 떨어진 곳에 있는 width×height 영역을 현재 창에 맞춰 반환합니다."""
+        return pygame.Rect(self.width // 2 + self.scaled(dx), self.height // 2 + self.scaled(dy),
+                           self.scaled(width), self.scaled(height))
+
+
+def peg_layout(num_pegs, layout):
+    """기둥 개수에 맞춰 기둥 x 좌표 목록, 클릭 판정 폭, 원반 너비 배율을 반환합니다."""
+    spacing = layout.width // (num_pegs + 1)
+    positions = [layout.width * (i + 1) // (num_pegs + 1) for i in range(num_pegs)]
+    hit_width = min(layout.peg_hit_width, spacing - 4)
+    widest = MIN_DISK_WIDTH + (MAX_DISKS - 1) * DISK_WIDTH_STEP
+    return positions, hit_width, min(layout.scale, spacing * MAX_DISK_SPAN / widest)
+
+
+def disk_layout(num_disks, disk_scale, layout):
+    """원반 개수에 맞춰 원반 높이와 크기별 너비 목록(인덱스 = 원반 크기)을 반환합니다.
+
+    MAX_DISKS 개까지는 원래 크기를 그대로 쓰고, 그보다 많으면 기둥에 다 들어가도록 높이를 줄이고
+    너비는 가장 작은 원반부터 MAX_DISKS 번째 원반의 너비까지 고르게 나눕니다.
+    """
+    def width(size):
+        return int((MIN_DISK_WIDTH + (size - 1) * DISK_WIDTH_STEP) * disk_scale)
+
+    if num_disks <= MAX_DISKS:
+        return layout.disk_height, [0] + [width(size) for size in range(1, MAX_DISKS + 1)]
+    widest = width(MAX_DISKS)
+    narrowest = min(layout.min_auto_disk_width, widest)
+    widths = [0] + [narrowest + (widest - narrowest) * (size - 1) // (num_disks - 1)
+                    for size in range(1, num_disks + 1)]
+    return max(1, layout.max_stack_height // num_disks), widths
+
+
+def lift_path(start, end, fraction, lift_y):
+    """start 에서 lift_y 높이로 들어 올려 옆으로 옮긴 뒤 end 로 내려놓는 경로에서 fraction 위치를 반환합니다."""
+    (x0, y0), (x1, y1) = start, end
+    rise, across, fall = y0 - lift_y, abs(x1 - x0), y1 - lift_y
+    d = fraction * (rise + across + fall)
+    if d <= rise:
+        return x0, y0 - d
+    d -= rise
+    if d <= across:
+        return x0 + (d if x1 >= x0 else -d), lift_y
+    return x1, lift_y + min(d - across, fall)
+
 # --- 재사용 가능한 버튼 클래스 ---
 class Button:
     """UI 버튼의 생성, 그리기, 이벤트 처리를 담당하는 클래스"""
@@ -41,16 +157,26 @@ class Button:
         self.text = text
         self.font = font
         self.is_hovered = False
+        self._images = {}  # 호버 여부 -> 미리 그린 버튼 이미지
+
+    def image(self):
+        """현재 호버 상태의 버튼 이미지를 반환합니다. 상태별로 처음 한 번만 그립니다."""
+        image = self._images.get(self.is_hovered)
+        if image is None:
+            image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            local_rect = image.get_rect()
+            color = BUTTON_HOVER_COLOR if self.is_hovered else BUTTON_COLOR
+            pygame.draw.rect(image, color, local_rect, 0, 10)
+            pygame.draw.rect(image, BORDER_COLOR, local_rect, 2, 10)
+
+            text_surf = TEXT_CACHE.render(self.font, self.text, TEXT_COLOR)
+            image.blit(text_surf, text_surf.get_rect(center=local_rect.center))
+            self._images[self.is_hovered] = image
+        return image
 
     def draw(self, surface):
         """버튼을 화면에 그립니다."""
-        color = BUTTON_HOVER_COLOR if self.is_hovered else BUTTON_COLOR
-        pygame.draw.rect(surface, color, self.rect, 0, 10)
-        pygame.draw.rect(surface, BORDER_COLOR, self.rect, 2, 10)
-        
-        text_surf = self.font.render(self.text, True, TEXT_COLOR)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        surface.blit(self.image(), self.rect)
 
     def check_hover(self, mouse_pos):
         """마우스 커서가 버튼 위에 있는지 확인합니다."""
@@ -63,70 +189,261 @@ class Button:
         return False
 
 # --- 게임 관리 클래스 ---
-class Game:
-    """게임의 전체적인 상태와 로직을 관리하는 메인 클래스"""
+class Game(HanoiCore):
+    """게임 로직(HanoiCore)에 화면 그리기와 입력 처리를 더한 메인 클래스"""
     def __init__(self, surface):
         """게임 객체를 초기화하고 기본 설정들을 구성합니다."""
+        super().__init__(num_disks=4, num_pegs=3, replay_dir=REPLAY_DIR)
         self.screen = surface
-        self.clock = pygame.time.Clock()
-        self.game_state = 'start' # 게임 상태: start, playing, menu, won
-        
-        self.towers = []
-        self.num_disks = 4
-        self.selected_disk = None
-        self.source_peg_index = -1
-        self.move_count = 0
-        self.min_moves = 0
+        self.game_state = 'start' # 게임 상태: start, playing, menu, won, auto (자동 풀이)
+        # 프레임 구간별 시간 측정 (F3 으로 표시, GAME_PROFILE 환경 변수에 파일 경로를 주면 주기적으로 내보냄)
+        self.profiler = FrameProfiler.from_env()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, topleft=(8, 80), target_fps=FPS)
+        # 입력이 없고 움직이는 것도 없으면 잠들어 있는 루프 스케줄러
+        self.scheduler = FrameScheduler(FPS, self.profiler)
+        # 창 가장자리를 끄는 동안 들어오는 크기 변경을 모았다가 크기가 멈추면 한 번만 다시 배치함
+        self.resizer = ResizeDebouncer(BG_TOP)
 
+        self.atlases = {}  # (기둥 개수, 배치 원반 개수) -> (아틀라스, 기둥 x 좌표, 클릭 판정 폭, 원반 높이, 원반 너비 목록)
+        self.sprites = pygame.sprite.LayeredDirty()
+        self.disk_sprites = {}
+        self.last_drawn_state = None
+        self.last_drawn_view = None  # 마지막으로 그린 시작, 메뉴, 성공 화면의 모양 (같으면 다시 그리지 않음)
+        self.apply_layout(ScreenLayout(surface.get_size()))
+
+    def apply_layout(self, layout):
+        """창 크기에 맞춘 배치로 폰트, 버튼, 미리 그린 Surface 와 스프라이트를 다시 만듭니다."""
+        self.layout = layout
+        load_fonts(layout.scale)
+        self.profiler_overlay.topleft = (8, layout.scaled(80))
         self.create_buttons()
         self.pre_render_background()
         self.pre_render_overlay()
+        self.atlases.clear()  # 원반과 기둥 크기가 바뀌었으므로 이전 창 크기의 아틀라스는 쓰지 않음
+        if self.towers:
+            self.build_sprites()
+            if self.selected_disk is not None:
+                self.sprites.change_layer(self.disk_sprites[self.selected_disk], LAYER_DRAG)
+        else:
+            self.pre_render_atlas()
+        self.last_drawn_state = self.last_drawn_view = None
+
+    def resize(self, size):
+        """창 크기가 size 로 바뀐 뒤 배치를 다시 계산합니다."""
+        self.screen = apply_window_size(size)
+        self.apply_layout(ScreenLayout(self.screen.get_size()))
 
     def create_buttons(self):
         """게임에 사용될 모든 버튼 객체를 생성합니다."""
-        self.menu_button = Button((SCREEN_WIDTH - 150, 25, 120, 45), "메뉴", UI_FONT)
-        self.next_level_button = Button((SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100, 200, 55), "다음 단계", UI_FONT)
-        self.popup_restart_button = Button((SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 40, 200, 55), "다시하기", UI_FONT)
-        self.popup_prev_level_button = Button((SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 30, 200, 55), "이전 단계", UI_FONT)
-        self.popup_resume_button = Button((SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100, 200, 55), "계속하기", UI_FONT)
+        layout = self.layout
+        top, width, height = layout.scaled(25), layout.scaled(120), layout.scaled(45)
+        self.menu_button = Button((layout.width - layout.scaled(150), top, width, height), "메뉴", UI_FONT)
+        self.hint_button = Button((layout.width - layout.scaled(280), top, width, height), "힌트", UI_FONT)
+        self.next_level_button = Button(layout.centered_rect(-100, 100, 200, 55), "다음 단계", UI_FONT)
+        self.popup_restart_button = Button(layout.centered_rect(-100, -40, 200, 55), "다시하기", UI_FONT)
+        self.popup_prev_level_button = Button(layout.centered_rect(-100, 30, 200, 55), "이전 단계", UI_FONT)
+        self.popup_resume_button = Button(layout.centered_rect(-100, 100, 200, 55), "계속하기", UI_FONT)
 
     def pre_render_background(self):
-        """성능 최적화를 위해 배경 그라데이션을 미리 그려둡니다."""
-        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            color = [int(BG_TOP[i] + (BG_BOTTOM[i] - BG_TOP[i]) * y / SCREEN_HEIGHT) for i in range(3)]
-            pygame.draw.line(self.background, color, (0, y), (SCREEN_WIDTH, y))
+        """성능 최적화를 위해 배경 그라데이션을 미리 그려둡니다. 창 크기가 바뀔 때마다 다시 만듭니다."""
+        self.background = vertical_gradient(self.layout.size, BG_TOP, BG_BOTTOM)
 
     def pre_render_overlay(self):
-        """성능 최적화를 위해 반투명 오버레이를 미리 만들어둡니다."""
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.overlay.fill((0, 0, 0, 150))
-    
+        """성능 최적화를 위해 반투명 오버레이와 받침대를 포함한 게임 배경을 미리 만들어둡니다."""
+        layout = self.layout
+        self.overlay = pygame.Surface(layout.size)  # 새 Surface 는 검은색이므로 채우지 않고 전체 투명도만 줌
+        self.overlay.set_alpha(150)
+        self.play_background = self.background.copy()
+        margin = layout.scaled(50)
+        self.play_background.fill(BASE_COLOR, (margin, layout.peg_y + layout.peg_height,
+                                               layout.width - 2 * margin, layout.base_height))
+
+    def pre_render_atlas(self):
+        """현재 기둥, 원반 개수의 배치를 정하고, 원반(크기별)과 기둥 이미지를 아틀라스에 한 번만 그립니다."""
+        # MAX_DISKS 개까지는 같은 배치를 쓰고, 그보다 많으면 원반 개수마다 배치가 다름
+        layout_disks = max(self.num_disks, MAX_DISKS)
+        key = (self.num_pegs, layout_disks)
+        cached = self.atlases.get(key)
+        if cached is None:
+            if layout_disks > MAX_DISKS:
+                # 원반이 많은 배치는 가장 최근 것 하나만 보관
+                for old_key in [k for k in self.atlases if k[1] > MAX_DISKS]:
+                    del self.atlases[old_key]
+            cached = self.atlases[key] = self._render_atlas(layout_disks)
+        self.atlas, self.peg_positions, self.peg_hit_width, self.disk_height, self.disk_widths = cached
+
+    def _render_atlas(self, layout_disks):
+        layout = self.layout
+        peg_positions, peg_hit_width, disk_scale = peg_layout(self.num_pegs, layout)
+        disk_height, disk_widths = disk_layout(layout_disks, disk_scale, layout)
+        hint_height = layout.peg_height + layout.scaled(20)
+        sizes = {'peg': (layout.peg_width, layout.peg_height),
+                 'hint_from': (peg_hit_width, hint_height),
+                 'hint_to': (peg_hit_width, hint_height)}
+        for size in range(1, layout_disks + 1):
+            sizes[size] = (disk_widths[size], disk_height)
+        atlas = SpriteAtlas(sizes)
+
+        peg = atlas.canvas('peg')
+        pygame.draw.rect(peg, PEG_COLOR, peg.get_rect(), 0, layout.scaled(5))
+        pygame.draw.rect(peg, BORDER_COLOR, peg.get_rect(), 2, layout.scaled(5))
+        # 얇은 원반은 모서리와 테두리도 높이에 맞춰 줄임
+        radius, border = min(layout.scaled(8), disk_height // 2), 2 if disk_height >= 10 else 1
+        for size in range(1, layout_disks + 1):
+            disk = atlas.canvas(size)
+            color = DISK_COLORS[(size - 1) % len(DISK_COLORS)]
+            pygame.draw.rect(disk, color, disk.get_rect(), 0, radius)
+            pygame.draw.rect(disk, BORDER_COLOR, disk.get_rect(), border, radius)
+        for key, color in (('hint_from', HINT_FROM_COLOR), ('hint_to', HINT_TO_COLOR)):
+            hint = atlas.canvas(key)
+            hint.fill((*color, 70), hint.get_rect().inflate(-6, -6))
+            pygame.draw.rect(hint, color, hint.get_rect(), 3, layout.scaled(12))
+        return atlas, peg_positions, peg_hit_width, disk_height, disk_widths
+
+    def build_sprites(self):
+        """현재 원반, 기둥 개수에 맞춰 기둥, 원반, 이동 횟수, 버튼 스프라이트를 구성합니다."""
+        self.pre_render_atlas()
+        self.sprites.empty()
+        self.sprites.clear(self.screen, self.play_background)
+        layout = self.layout
+        for x in self.peg_positions:
+            peg_rect = pygame.Rect(x - layout.peg_width / 2, layout.peg_y, layout.peg_width, layout.peg_height)
+            self.sprites.add(ImageSprite(self.atlas.image('peg'), peg_rect.topleft), layer=LAYER_PEG)
+
+        self.disk_sprites = {}
+        for size in range(1, self.num_disks + 1):
+            sprite = self.disk_sprites[size] = ImageSprite(self.atlas.image(size))
+            self.sprites.add(sprite, layer=LAYER_DISK)
+
+        self.hint_sprites = (ImageSprite(self.atlas.image('hint_from')), ImageSprite(self.atlas.image('hint_to')))
+        self.hint_text_sprite = ImageSprite(self._moves_text())
+        for sprite in (*self.hint_sprites, self.hint_text_sprite):
+            sprite.visible = 0
+        self.sprites.add(*self.hint_sprites, layer=LAYER_HINT)
+
+        self.moves_sprite = ImageSprite(self._moves_text(), (layout.scaled(20), layout.scaled(25)))
+        self.menu_sprite = ImageSprite(self.menu_button.image(), self.menu_button.rect.topleft)
+        self.hint_button_sprite = ImageSprite(self.hint_button.image(), self.hint_button.rect.topleft)
+        self.hint_button_sprite.visible = int(self.hint_available and self.playback is None)
+        self.speed_sprite = ImageSprite(self._speed_text(), (layout.scaled(20), layout.scaled(65)))
+        self.speed_sprite.visible = int(self.playback is not None)
+        self.sprites.add(self.moves_sprite, self.hint_text_sprite, self.menu_sprite, self.hint_button_sprite,
+                         self.speed_sprite, layer=LAYER_UI)
+        self.layout_disks()
+
+    def layout_disks(self, skip=None):
+        """기둥에 쌓인 원반 스프라이트를 제자리에 놓습니다. skip 원반(자동 풀이에서 옮기는 중)은 건너뜁니다."""
+        for peg_idx, peg in enumerate(self.towers):
+            for disk_idx, disk_size in enumerate(peg):
+                if disk_size == skip:
+                    continue
+                sprite = self.disk_sprites[disk_size]
+                sprite.move_to(self._disk_topleft(peg_idx, disk_idx, disk_size))
+                if sprite.layer != LAYER_DISK:
+                    self.sprites.change_layer(sprite, LAYER_DISK)
+
+    def _disk_topleft(self, peg_idx, disk_idx, disk_size):
+        """peg_idx 기둥의 아래에서 disk_idx 번째 자리에 놓인 원반의 왼쪽 위 좌표를 반환합니다."""
+        return (self.peg_positions[peg_idx] - self.disk_widths[disk_size] // 2,
+                (self.layout.peg_y + self.layout.peg_height) - (disk_idx + 1) * self.disk_height)
+
+    def show_hint(self):
+        """현재 배치에서 가장 가까운 성공 상태로 가는 다음 수와 남은 최소 이동 횟수를 표시합니다."""
+        if self.selected_disk is not None or not self.hint_available:
+            return
+        move, moves_left = self.hint()
+        text = TEXT_CACHE.render_value('moves_left', SMALL_UI_FONT, f"최소 남은 이동: {moves_left}", TEXT_COLOR)
+        self.hint_text_sprite.set_image(text)
+        layout = self.layout
+        self.hint_text_sprite.show((layout.scaled(20), layout.scaled(65)))
+        if move is None:
+            return
+        for sprite, peg_idx in zip(self.hint_sprites, move):
+            sprite.show((self.peg_positions[peg_idx] - self.peg_hit_width // 2, layout.peg_y - layout.scaled(20)))
+
+    def clear_hint(self):
+        """표시 중인 힌트를 지웁니다."""
+        for sprite in (*self.hint_sprites, self.hint_text_sprite):
+            sprite.hide()
+
+    def _moves_text(self):
+        return TEXT_CACHE.render_value('move_count', UI_FONT, f"이동 횟수: {self.move_count:,}", TEXT_COLOR)
+
+    def _speed_text(self):
+        playback = self.playback
+        if playback is None:
+            text = ""
+        elif playback.finished:
+            text = f"완료! 전체 {playback.total:,} 수"
+        elif playback.paused:
+            text = f"일시 정지 (Space), 전체 {playback.total:,} 수"
+        else:
+            text = f"{playback.speed:,} 수/초 (▲/▼), 전체 {playback.total:,} 수"
+        return TEXT_CACHE.render_value('autosolve_speed', SMALL_UI_FONT, text, TEXT_COLOR)
+
+
     def reset(self, num_disks):
         """게임을 특정 원반 개수로 초기화하거나 재시작합니다."""
-        self.num_disks = num_disks
-        self.towers = [[], [], []]
-        self.towers[0] = list(range(self.num_disks, 0, -1))
-        self.selected_disk = None
-        self.source_peg_index = -1
-        self.move_count = 0
-        self.min_moves = 2**self.num_disks - 1
+        super().reset(num_disks)
         self.game_state = 'playing'
+        self.build_sprites()
+
+    def start_autosolve(self, num_disks, speed=1):
+        """num_disks 개 탑의 자동 풀이 재생을 시작합니다."""
+        super().start_autosolve(num_disks, speed)
+        self.game_state = 'auto'
+        self.build_sprites()
+
+    def update_autosolve(self, seconds):
+        """재생을 진행하고 원반 스프라이트를 현재 배치로 옮깁니다. 느린 속도에서는 진행 중인 수를 움직여 보여 줍니다."""
+        self.advance_autosolve(seconds)
+        moving = self.playback.moving(FPS)
+        if moving is None:
+            self.layout_disks()
+            return
+        disk_size, source, target, fraction = moving
+        self.layout_disks(skip=disk_size)
+        start = self._disk_topleft(source, len(self.towers[source]) - 1, disk_size)
+        end = self._disk_topleft(target, len(self.towers[target]), disk_size)
+        sprite = self.disk_sprites[disk_size]
+        sprite.move_to(tuple(map(int, lift_path(start, end, fraction, self.layout.lift_y))))
+        if sprite.layer != LAYER_DRAG:
+            self.sprites.change_layer(sprite, LAYER_DRAG)
 
     def run(self):
         """게임의 메인 루프를 실행합니다."""
+        profiler = self.profiler
+        scheduler = self.scheduler
         while True:
-            self.handle_events() # 사용자 입력 처리
-            self.draw()          # 화면 그리기
-            self.clock.tick(60)  # 초당 60프레임으로 제한
+            events = scheduler.wait() # 입력이나 다음 프레임까지 기다림
+            with profiler.phase('events'):
+                self.handle_events(events) # 사용자 입력 처리
+            size = self.resizer.poll()
+            if size is not None:
+                with profiler.phase('resize'):
+                    self.resize(size)  # 창 크기가 멈췄으면 배치와 미리 그린 Surface 를 다시 만듦
+            if self.game_state == 'auto':
+                with profiler.phase('playback'):
+                    self.update_autosolve(scheduler.frame_time)
+            self.draw()              # 화면 그리기
+            self.schedule_next_frame()
+            profiler.end_frame()
 
-    def handle_events(self):
+    def schedule_next_frame(self):
+        """원반을 끄는 중이거나 자동 풀이가 진행 중이면 바로 다음 프레임을, 아니면 다음 입력까지 기다리게 합니다."""
+        if self.selected_disk is not None or (self.game_state == 'auto' and self.playback.running):
+            self.scheduler.request_frame()
+        self.scheduler.wake_in(self.profiler_overlay.next_refresh())
+        self.scheduler.wake_in(self.resizer.remaining())
+
+    def handle_events(self, events):
         """모든 사용자 입력을 감지하고 상태에 맞게 처리합니다."""
         mouse_pos = pygame.mouse.get_pos()
         
         # 현재 게임 상태에 따라 버튼 호버 효과 처리
-        if self.game_state == 'playing':
+        if self.game_state in ('playing', 'auto'):
             self.menu_button.check_hover(mouse_pos)
+            self.hint_button.check_hover(mouse_pos)
         elif self.game_state == 'menu':
             self.popup_restart_button.check_hover(mouse_pos)
             self.popup_prev_level_button.check_hover(mouse_pos)
@@ -134,8 +451,18 @@ class Game:
         elif self.game_state == 'won':
             self.next_level_button.check_hover(mouse_pos)
 
-        for event in pygame.event.get():
+        for event in events:
+            if self.profiler_overlay.handle_event(event):
+                self.last_drawn_view = None  # 측정 표를 끄면 가렸던 화면을 다시 그려야 함
+                continue
+            if self.resizer.handle_event(event):
+                continue
+            if event.type == pygame.WINDOWEXPOSED:
+                # 매 프레임 그리지 않으므로 창이 다시 드러나면 전체를 다시 그림
+                self.last_drawn_state = self.last_drawn_view = None
             if event.type == pygame.QUIT:
+                self.close_replay()
+                self.profiler.close()
                 pygame.quit()
                 sys.exit()
             
@@ -148,16 +475,23 @@ class Game:
                 self._handle_menu_events(event)
             elif self.game_state == 'won':
                 self._handle_won_events(event)
+            elif self.game_state == 'auto':
+                self._handle_auto_events(event)
 
     def _handle_start_events(self, event):
-        """시작 화면에서의 입력을 처리합니다."""
+        """시작 화면에서의 입력을 처리합니다. 손으로 두기 어려운 MAX_DISKS 초과는 자동 풀이로만 시작합니다."""
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP: self.num_disks = min(10, self.num_disks + 1)
-            elif event.key == pygame.K_DOWN: self.num_disks = max(3, self.num_disks - 1)
-            elif event.key == pygame.K_RETURN: self.reset(self.num_disks)
+            if event.key == pygame.K_UP: self.num_disks = min(MAX_AUTO_DISKS, self.num_disks + 1)
+            elif event.key == pygame.K_DOWN: self.num_disks = max(MIN_DISKS, self.num_disks - 1)
+            elif event.key == pygame.K_RIGHT: self.num_pegs = min(MAX_PEGS, self.num_pegs + 1)
+            elif event.key == pygame.K_LEFT: self.num_pegs = max(MIN_PEGS, self.num_pegs - 1)
+            elif event.key == pygame.K_a: self.start_autosolve(self.num_disks)
+            elif event.key == pygame.K_RETURN:
+                if self.num_disks > MAX_DISKS: self.start_autosolve(self.num_disks)
+                else: self.reset(self.num_disks)
         elif event.type == pygame.MOUSEWHEEL:
-            if event.y > 0: self.num_disks = min(10, self.num_disks + 1)
-            elif event.y < 0: self.num_disks = max(3, self.num_disks - 1)
+            if event.y > 0: self.num_disks = min(MAX_AUTO_DISKS, self.num_disks + 1)
+            elif event.y < 0: self.num_disks = max(MIN_DISKS, self.num_disks - 1)
 
     def _handle_playing_events(self, event):
         """게임 플레이 중의 입력을 처리합니다."""
@@ -168,110 +502,145 @@ class Game:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game_state = 'menu'
 
+        if (self.hint_available and self.hint_button.handle_event(event)) or (event.type == pygame.KEYDOWN and event.key == pygame.K_h):
+            self.show_hint()
+            return
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             peg_idx = self._get_peg_from_pos(event.pos)
             if peg_idx is not None:
                 if self.selected_disk is None:
-                    if self.towers[peg_idx]:
-                        self.selected_disk = self.towers[peg_idx].pop()
-                        self.source_peg_index = peg_idx
+                    if self.pick_up(peg_idx) is not None:
+                        self.clear_hint()
+                        self.sprites.change_layer(self.disk_sprites[self.selected_disk], LAYER_DRAG)
                 else:
-                    target_peg = self.towers[peg_idx]
-                    is_diff_peg = (peg_idx != self.source_peg_index)
-                    is_valid_place = (not target_peg or self.selected_disk < target_peg[-1])
-                    
-                    if is_diff_peg and is_valid_place:
-                        target_peg.append(self.selected_disk)
-                        self.move_count += 1
-                        if len(self.towers[1]) == self.num_disks or len(self.towers[2]) == self.num_disks:
-                            self.game_state = 'won'
-                    else:
-                        self.towers[self.source_peg_index].append(self.selected_disk)
-                    self.selected_disk = None
+                    if self.drop(peg_idx) and self.is_solved():
+                        self.game_state = 'won'
+                    self.layout_disks()
 
     def _handle_menu_events(self, event):
         """메뉴 팝업이 활성화되었을 때의 입력을 처리합니다."""
         if self.popup_restart_button.handle_event(event):
             self.reset(self.num_disks)
         elif self.popup_prev_level_button.handle_event(event):
-            if self.num_disks > 3: self.reset(self.num_disks - 1)
+            if self.num_disks > MIN_DISKS: self.reset(self.num_disks - 1)
         elif self.popup_resume_button.handle_event(event):
             self.game_state = 'playing'
         
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game_state = 'playing'
 
+    def _handle_auto_events(self, event):
+        """자동 풀이 중의 입력을 처리합니다. ▲/▼ 로 속도를 바꾸고 Space 로 멈추며, 메뉴나 Esc 로 시작 화면에 돌아갑니다."""
+        if self.menu_button.handle_event(event) or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+            self.game_state = 'start'
+            return
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_UP:
+            self.playback.change_speed(1)
+        elif event.key == pygame.K_DOWN:
+            self.playback.change_speed(-1)
+        elif event.key == pygame.K_SPACE:
+            self.playback.paused = not self.playback.paused
+        elif event.key == pygame.K_HOME:
+            self.playback.seek(0)
+
     def _handle_won_events(self, event):
         """게임 승리 화면에서의 입력을 처리합니다."""
         if self.next_level_button.handle_event(event):
-            if self.num_disks < 10: self.reset(self.num_disks + 1)
+            if self.num_disks < MAX_DISKS: self.reset(self.num_disks + 1)
 
     def draw(self):
         """게임 상태에 따라 적절한 화면을 그립니다."""
+        profiler = self.profiler
+        if self.resizer.pending:
+            return  # 창 크기가 바뀌는 중에는 새 배치를 만들 때까지 그리지 않음
+        # 시작, 메뉴, 성공 화면은 모양이 바뀌었을 때만 다시 그림 (측정 표가 보이면 깨어날 때마다 다시 그림)
+        view = None if self.game_state in ('playing', 'auto') else self._static_view()
+        if view is not None and view == self.last_drawn_view and not self.profiler_overlay.visible:
+            return
+        # 측정 오버레이가 가렸던 영역을 먼저 되돌려 스프라이트가 아는 화면 상태와 맞춤
+        restored = self.profiler_overlay.restore(self.screen)
+        if self.game_state in ('playing', 'auto') and self.last_drawn_state == self.game_state:
+            # 플레이 중에는 움직이거나 바뀐 스프라이트 영역만 다시 그림
+            dirty = self._draw_gameplay_screen()
+            for rect in (restored, self.profiler_overlay.draw(self.screen)):
+                if rect is not None:
+                    dirty.append(rect)
+            with profiler.phase('display'):
+                pygame.display.update(dirty)
+            return
+
         if self.game_state == 'start':
-            self._draw_start_screen()
+            with profiler.phase('start'):
+                self._draw_start_screen()
         else:
+            self.sprites.repaint_rect(self.screen.get_rect())
             self._draw_gameplay_screen()
-            if self.game_state == 'menu':
-                self._draw_menu_popup()
-            elif self.game_state == 'won':
-                self._draw_win_screen()
-        
-        pygame.display.flip()
+            with profiler.phase('popup'):
+                if self.game_state == 'menu':
+                    self._draw_menu_popup()
+                elif self.game_state == 'won':
+                    self._draw_win_screen()
+        self.last_drawn_state = self.game_state
+        self.last_drawn_view = view
+        self.profiler_overlay.draw(self.screen)
+        with profiler.phase('display'):
+            pygame.display.flip()
+
+    def _static_view(self):
+        """시작, 메뉴, 성공 화면의 모양을 정하는 값(상태, 선택한 개수, 버튼 호버)을 반환합니다."""
+        if self.game_state == 'start':
+            return 'start', self.num_disks, self.num_pegs
+        if self.game_state == 'menu':
+            return ('menu', self.popup_restart_button.is_hovered, self.popup_prev_level_button.is_hovered,
+                    self.popup_resume_button.is_hovered)
+        return 'won', self.next_level_button.is_hovered
 
     def _draw_start_screen(self):
         """원반 개수를 선택하는 시작 화면을 그립니다."""
         self.screen.blit(self.background, (0, 0))
-        title = WIN_FONT.render("하노이의 탑", True, TEXT_COLOR)
-        prompt = UI_FONT.render("원반 개수를 선택하세요", True, TEXT_COLOR)
-        count = BIG_FONT.render(str(self.num_disks), True, PEG_COLOR)
-        instr = UI_FONT.render("▲/▼ 또는 마우스 휠로 조절, Enter 로 시작", True, TEXT_COLOR)
+        title = TEXT_CACHE.render(WIN_FONT, "하노이의 탑", TEXT_COLOR)
+        prompt = TEXT_CACHE.render(UI_FONT, "원반 개수를 선택하세요", TEXT_COLOR)
+        count = TEXT_CACHE.render(BIG_FONT, str(self.num_disks), PEG_COLOR)
+        instr = TEXT_CACHE.render(UI_FONT, "▲/▼ 또는 마우스 휠로 조절, Enter 로 시작", TEXT_COLOR)
+        auto = TEXT_CACHE.render(SMALL_UI_FONT, f"A 로 자동 풀이 (원반 {MAX_DISKS}개 초과는 자동 풀이만)", TEXT_COLOR)
+        pegs = TEXT_CACHE.render_value('peg_count', UI_FONT, f"기둥 {self.num_pegs}개 (◀/▶ 로 조절)", TEXT_COLOR)
         
-        self.screen.blit(title, title.get_rect(centerx=SCREEN_WIDTH/2, y=80))
-        self.screen.blit(prompt, prompt.get_rect(centerx=SCREEN_WIDTH/2, y=200))
-        self.screen.blit(count, count.get_rect(centerx=SCREEN_WIDTH/2, y=270))
-        self.screen.blit(instr, instr.get_rect(centerx=SCREEN_WIDTH/2, y=400))
+        layout = self.layout
+        for surf, y in ((title, 80), (prompt, 200), (count, 270), (instr, 400), (pegs, 460), (auto, 520)):
+            self.screen.blit(surf, surf.get_rect(centerx=layout.width / 2, y=layout.top + layout.scaled(y)))
         
     def _draw_gameplay_screen(self):
-        """기둥, 원반 등 메인 게임 화면을 그립니다."""
-        self.screen.blit(self.background, (0, 0))
-        peg_y, peg_height, base_height = 270, 280, 25
-        pygame.draw.rect(self.screen, BASE_COLOR, (50, peg_y + peg_height, SCREEN_WIDTH - 100, base_height))
-        peg_positions = [SCREEN_WIDTH // 4, SCREEN_WIDTH // 2, SCREEN_WIDTH * 3 // 4]
-        for x in peg_positions:
-            pygame.draw.rect(self.screen, PEG_COLOR, (x - 7.5, peg_y, 15, peg_height), 0, 5)
-            pygame.draw.rect(self.screen, BORDER_COLOR, (x - 7.5, peg_y, 15, peg_height), 2, 5)
-
-        disk_h, min_disk_w, disk_w_inc = 25, 70, 22
-        for peg_idx, peg in enumerate(self.towers):
-            for disk_idx, disk_size in enumerate(peg):
-                width = min_disk_w + (disk_size - 1) * disk_w_inc
-                x = peg_positions[peg_idx] - width // 2
-                y = (peg_y + peg_height) - (disk_idx + 1) * disk_h
-                color = DISK_COLORS[(disk_size - 1) % len(DISK_COLORS)]
-                pygame.draw.rect(self.screen, color, (x, y, width, disk_h), 0, 8)
-                pygame.draw.rect(self.screen, BORDER_COLOR, (x, y, width, disk_h), 2, 8)
-
+        """기둥, 원반 등 메인 게임 화면을 그리고 다시 그린 영역 목록을 반환합니다."""
+        profiler = self.profiler
         if self.selected_disk is not None:
             mouse_x, mouse_y = pygame.mouse.get_pos()
-            width = min_disk_w + (self.selected_disk - 1) * disk_w_inc
-            color = DISK_COLORS[(self.selected_disk - 1) % len(DISK_COLORS)]
-            pygame.draw.rect(self.screen, color, (mouse_x - width / 2, mouse_y - disk_h / 2 - 10, width, disk_h), 0, 8)
-            pygame.draw.rect(self.screen, BORDER_COLOR, (mouse_x - width / 2, mouse_y - disk_h / 2 - 10, width, disk_h), 2, 8)
+            width = self.disk_widths[self.selected_disk]
+            drag_rect = pygame.Rect(mouse_x - width / 2, mouse_y - self.disk_height / 2 - self.layout.scaled(10), width,
+                                    self.disk_height)
+            self.disk_sprites[self.selected_disk].move_to(drag_rect.topleft)
 
-        moves_text = UI_FONT.render(f"이동 횟수: {self.move_count}", True, TEXT_COLOR)
-        self.screen.blit(moves_text, (20, 25))
-        self.menu_button.draw(self.screen)
+        with profiler.phase('text'):
+            self.moves_sprite.set_image(self._moves_text())
+            if self.playback is not None:
+                self.speed_sprite.set_image(self._speed_text())
+            self.menu_sprite.set_image(self.menu_button.image())
+            self.hint_button_sprite.set_image(self.hint_button.image())
+        # 배경, 기둥, 원반, 글자 스프라이트를 한 번에 합성하므로 하나의 구간으로 잼
+        with profiler.phase('sprites'):
+            return self.sprites.draw(self.screen)
 
     def _draw_menu_popup(self):
         """일시 정지 메뉴 팝업을 그립니다."""
         self.screen.blit(self.overlay, (0, 0))
-        popup_rect = pygame.Rect(0, 0, 400, 400)
-        popup_rect.center = (SCREEN_WIDTH/2, SCREEN_HEIGHT/2)
-        pygame.draw.rect(self.screen, WHITE, popup_rect, 0, 15)
-        pygame.draw.rect(self.screen, BORDER_COLOR, popup_rect, 3, 15)
-        title = WIN_FONT.render("메뉴", True, TEXT_COLOR)
-        self.screen.blit(title, title.get_rect(centerx=popup_rect.centerx, y=popup_rect.top + 30))
+        layout = self.layout
+        popup_rect = layout.centered_rect(-200, -200, 400, 400)
+        pygame.draw.rect(self.screen, WHITE, popup_rect, 0, layout.scaled(15))
+        pygame.draw.rect(self.screen, BORDER_COLOR, popup_rect, 3, layout.scaled(15))
+        title = TEXT_CACHE.render(WIN_FONT, "메뉴", TEXT_COLOR)
+        self.screen.blit(title, title.get_rect(centerx=popup_rect.centerx, y=popup_rect.top + layout.scaled(30)))
         self.popup_restart_button.draw(self.screen)
         self.popup_prev_level_button.draw(self.screen)
         self.popup_resume_button.draw(self.screen)
@@ -279,24 +648,25 @@ class Game:
     def _draw_win_screen(self):
         """게임 성공 화면을 그립니다."""
         self.screen.blit(self.overlay, (0, 0))
-        win_text = WIN_FONT.render("SUCCESS!", True, SUCCESS_COLOR)
-        min_moves = SMALL_UI_FONT.render(f"최소 이동: {self.min_moves}", True, WHITE)
-        user_moves = SMALL_UI_FONT.render(f"나의 이동: {self.move_count}", True, WHITE)
+        win_text = TEXT_CACHE.render(WIN_FONT, "SUCCESS!", SUCCESS_COLOR)
+        min_moves = TEXT_CACHE.render_value('min_moves', SMALL_UI_FONT, f"최소 이동: {self.min_moves}", WHITE)
+        user_moves = TEXT_CACHE.render_value('user_moves', SMALL_UI_FONT, f"나의 이동: {self.move_count}", WHITE)
 
-        self.screen.blit(win_text, win_text.get_rect(centerx=SCREEN_WIDTH/2, y=SCREEN_HEIGHT/2 - 170))
-        self.screen.blit(min_moves, min_moves.get_rect(centerx=SCREEN_WIDTH/2, y=SCREEN_HEIGHT/2 - 60))
-        self.screen.blit(user_moves, user_moves.get_rect(centerx=SCREEN_WIDTH/2, y=SCREEN_HEIGHT/2 - 20))
+        layout = self.layout
+        for surf, dy in ((win_text, -170), (min_moves, -60), (user_moves, -20)):
+            self.screen.blit(surf, surf.get_rect(centerx=layout.width / 2, y=layout.height / 2 + layout.scaled(dy)))
         self.next_level_button.draw(self.screen)
 
     def _get_peg_from_pos(self, pos):
         """마우스 좌표로부터 클릭된 기둥의 인덱스를 반환합니다."""
-        for i, peg_x in enumerate([SCREEN_WIDTH // 4, SCREEN_WIDTH // 2, SCREEN_WIDTH * 3 // 4]):
-            if abs(pos[0] - peg_x) < 60: return i
+        for i, peg_x in enumerate(self.peg_positions):
+            if abs(pos[0] - peg_x) < self.peg_hit_width // 2: return i
         return None
 
 # --- 메인 실행 ---
 if __name__ == "__main__":
     """프로그램이 직접 실행될 때 호출되는 부분입니다."""
-    game_surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.init()
+    game_surface = open_window((SCREEN_WIDTH, SCREEN_HEIGHT))  # 화면 배율에 맞춘 크기로 열고, 크기를 바꿀 수 있음
     game = Game(game_surface) # Game 객체 생성
     game.run() # 게임 실행
@@ -0,0 +1,154 @@
+"""기둥이 3개 이상인 하노이의 탑을 위한 Frame–Stewart 풀이.
+
+기둥 p 개로 원반 n 개를 옮길 때, 가장 작은 k 개를 p 개 기둥을 모두 써서 중간 기둥으로 옮기고,
+남은 n - k 개를 중간 기둥을 뺀 p - 1 개 기둥으로 옮긴 뒤, k 개를 다시 목표 기둥으로 옮깁니다.
+
+    FS(n, p) = min over k of 2 * FS(k, p) + FS(n - k, p - 1),    FS(n, 3) = 2**n - 1
+
+기둥 수별로 (최소 이동 횟수, 가장 좋은 k) 표를 필요한 원반 수까지만 늘려 가며 저장해 두므로
+같은 기둥 수의 질의는 표를 한 번 찾는 것으로 끝납니다. 수는 목록을 만들지 않고 하나씩 생성하며,
+k번째 수와 k수 뒤의 배치는 앞의 수를 두지 않고 바로 구합니다.
+"""
+import hanoi_solver
+
+MIN_PEGS, MAX_PEGS = 3, 8
+
+# 기둥 수 -> [(최소 이동 횟수, 가장 좋은 k)] (인덱스 = 원반 수)
+_tables = {}
+
+
+def _table(num_disks, num_pegs):
+    """num_disks 까지 채워진 기둥 수 num_pegs 의 표를 반환합니다."""
+    table = _tables.setdefault(num_pegs, [(0, 0)])
+    if len(table) > num_disks:
+        return table
+    if num_pegs == 3:
+        for n in range(len(table), num_disks + 1):
+            table.append(((1 << n) - 1, n - 1))
+        return table
+
+    smaller = _table(num_disks, num_pegs - 1)
+    for n in range(len(table), num_disks + 1):
+        best = (smaller[n][0], 0)
+        for k in range(1, n):
+            moves = 2 * table[k][0] + smaller[n - k][0]
+            if moves < best[0]:
+                best = (moves, k)
+        table.append(best)
+    return table
+
+
+def _check(num_disks, num_pegs):
+    if num_pegs < MIN_PEGS:
+        raise ValueError(f"at least {MIN_PEGS} pegs are required")
+    if num_disks < 0:
+        raise ValueError("num_disks must not be negative")
+
+
+def min_moves(num_disks, num_pegs=3):
+    """Frame–Stewart 풀이의 이동 횟수(3, 4 기둥에서는 알려진 최솟값)를 반환합니다."""
+    _check(num_disks, num_pegs)
+    return _table(num_disks, num_pegs)[num_disks][0]
+
+
+def best_split(num_disks, num_pegs=3):
+    """먼저 중간 기둥으로 옮길 작은 원반 개수 k 를 반환합니다."""
+    _check(num_disks, num_pegs)
+    return _table(num_disks, num_pegs)[num_disks][1]
+
+
+def _spares(num_disks, num_pegs, source, target):
+    """인자를 확인하고 표를 채운 뒤 (목표 기둥, 나머지 기둥 튜플) 을 반환합니다."""
+    _check(num_disks, num_pegs)
+    if target is None:
+        target = num_pegs - 1
+    if source == target or not (0 <= source < num_pegs and 0 <= target < num_pegs):
+        raise ValueError("source and target must be different pegs")
+    _table(num_disks, num_pegs)
+    return target, tuple(peg for peg in range(num_pegs) if peg not in (source, target))
+
+
+def iter_moves(num_disks, num_pegs=3, source=0, target=None):
+    """Frame–Stewart 풀이의 수를 (원반 크기, 출발 기둥, 도착 기둥) 으로 하나씩 생성합니다."""
+    target, spares = _spares(num_disks, num_pegs, source, target)
+    return _solve(num_disks, 0, source, target, spares)
+
+
+def nth_move(num_disks, k, num_pegs=3, source=0, target=None):
+    """k번째 수(1부터 시작)를 (원반 크기, 출발 기둥, 도착 기둥) 으로 반환합니다.
+
+    앞의 수를 두지 않고 세 부분 문제 중 k 가 속한 쪽으로만 내려가므로 재귀 깊이만큼의 시간이 걸립니다.
+    """
+    target, spares = _spares(num_disks, num_pegs, source, target)
+    if not 1 <= k <= min_moves(num_disks, num_pegs):
+        raise ValueError(f"move {k} is out of range for {num_disks} disks")
+    count, offset = num_disks, 0
+    while count and len(spares) > 1:
+        split = _tables[len(spares) + 2][count][1]
+        first = _tables[len(spares) + 2][split][0]
+        second = _tables[len(spares) + 1][count - split][0]
+        middle, rest = spares[0], spares[1:]
+        if k <= first:
+            count, target, spares = split, middle, rest + (target,)
+        elif k <= first + second:
+            k -= first
+            count, offset, spares = count - split, offset + split, rest
+        else:
+            k -= first + second
+            count, source, spares = split, middle, rest + (source,)
+    order = (source, spares[0], target)
+    disk, from_peg, to_peg = hanoi_solver.nth_move(count, k, 0, 2)
+    return disk + offset, order[from_peg], order[to_peg]
+
+
+def disk_pegs_after(num_disks, k, num_pegs=3, source=0, target=None):
+    """k수 뒤 각 원반이 놓인 기둥을 원반 크기 순서(작은 것부터)의 리스트로 반환합니다.
+
+    nth_move 와 같이 k 가 속한 부분 문제로만 내려가며, 지나친 부분 문제의 원반은 한꺼번에 놓습니다.
+    """
+    target, spares = _spares(num_disks, num_pegs, source, target)
+    if not 0 <= k <= min_moves(num_disks, num_pegs):
+        raise ValueError(f"move {k} is out of range for {num_disks} disks")
+    pegs = [source] * num_disks
+    count, offset = num_disks, 0
+    while count and len(spares) > 1:
+        split = _tables[len(spares) + 2][count][1]
+        first = _tables[len(spares) + 2][split][0]
+        second = _tables[len(spares) + 1][count - split][0]
+        middle, rest = spares[0], spares[1:]
+        if k <= first:
+            # 작은 원반들을 중간 기둥으로 옮기는 중: 큰 원반들은 아직 출발 기둥에 있음
+            pegs[offset + split:offset + count] = [source] * (count - split)
+            count, target, spares = split, middle, rest + (target,)
+        elif k <= first + second:
+            # 큰 원반들을 옮기는 중: 작은 원반들은 중간 기둥에 모여 있음
+            pegs[offset:offset + split] = [middle] * split
+            k -= first
+            count, offset, spares = count - split, offset + split, rest
+        else:
+            # 작은 원반들을 목표 기둥으로 옮기는 중: 큰 원반들은 이미 목표 기둥에 있음
+            pegs[offset + split:offset + count] = [target] * (count - split)
+            k -= first + second
+            count, source, spares = split, middle, rest + (source,)
+    order = (source, spares[0], target)
+    for i, peg in enumerate(hanoi_solver.disk_pegs_after(count, k, 0, 2)):
+        pegs[offset + i] = order[peg]
+    return pegs
+
+
+def _solve(count, offset, source, target, spares):
+    """크기 offset+1 .. offset+count 원반들을 source 에서 target 으로 옮기는 수를 생성합니다."""
+    if count == 0:
+        return
+    if len(spares) == 1:
+        # 기둥 3개 부분 문제는 비트 연산 풀이로 재귀 없이 생성
+        order = (source, spares[0], target)
+        for disk, from_peg, to_peg in hanoi_solver.iter_moves(count, 0, 2):
+            yield disk + offset, order[from_peg], order[to_peg]
+        return
+
+    k = _tables[len(spares) + 2][count][1]
+    middle, rest = spares[0], spares[1:]
+    yield from _solve(k, offset, source, middle, rest + (target,))
+    yield from _solve(count - k, offset + k, source, target, rest)
+    yield from _solve(k, offset, middle, target, rest + (source,))
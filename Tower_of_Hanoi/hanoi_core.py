@@ -0,0 +1,121 @@
+"""하노이의 탑 진행 상태(화면과 무관한 게임 로직).
+
+pygame 을 가져오지 않으므로 테스트, 시뮬레이터, 서버에서 창 없이 바로 가져다 쓸 수 있습니다.
+Tower_of_Hanoi.py 의 Game 은 이 클래스를 상속해 화면 그리기와 입력 처리를 더합니다. 공용 모듈(common)을
+가져오므로 저장소 최상위 폴더가 모듈 검색 경로에 있어야 하며, 경로 설정은 이 모듈을 쓰는 실행 스크립트가 맡습니다.
+"""
+from common.replay import ReplayWriter, new_replay_path
+import frame_stewart
+import hanoi_state
+from hanoi_playback import Playback
+
+MIN_DISKS, MAX_DISKS = 3, 10    # 손으로 두는 원반 개수
+MAX_AUTO_DISKS = 64             # 자동 풀이로 보여 줄 수 있는 최대 원반 개수
+MIN_PEGS, MAX_PEGS = frame_stewart.MIN_PEGS, frame_stewart.MAX_PEGS
+
+
+class HanoiCore:
+    """기둥, 원반, 이동 횟수와 게임 기록을 관리하는 클래스"""
+
+    def __init__(self, num_disks=4, num_pegs=3, replay_dir=None):
+        """원반, 기둥 개수와 기록을 저장할 폴더(None 이면 기록하지 않음)를 받아 초기화합니다."""
+        self.towers = []
+        self.num_disks = num_disks
+        self.num_pegs = num_pegs
+        self.selected_disk = None
+        self.source_peg_index = -1
+        self.move_count = 0
+        self.min_moves = 0
+        self.replay_dir = replay_dir
+        self.replay = None  # 현재 세션의 기록
+        self.playback = None  # 자동 풀이 중이면 Playback
+
+    def reset(self, num_disks):
+        """게임을 특정 원반 개수로 초기화하거나 재시작합니다."""
+        self.num_disks = num_disks
+        self.towers = [[] for _ in range(self.num_pegs)]
+        self.towers[0] = list(range(self.num_disks, 0, -1))
+        self.selected_disk = None
+        self.source_peg_index = -1
+        self.move_count = 0
+        self.min_moves = frame_stewart.min_moves(self.num_disks, self.num_pegs)
+        self.playback = None
+        self.start_replay()
+
+    # --- 원반 옮기기 ---
+    def pick_up(self, peg_idx):
+        """기둥 맨 위의 원반을 집어 듭니다. 집은 원반 크기를 반환하고, 빈 기둥이면 None 을 반환합니다."""
+        if self.selected_disk is not None or not self.towers[peg_idx]:
+            return None
+        self.selected_disk = self.towers[peg_idx].pop()
+        self.source_peg_index = peg_idx
+        return self.selected_disk
+
+    def drop(self, peg_idx):
+        """집은 원반을 기둥에 내려놓습니다. 규칙에 맞지 않으면 원래 기둥으로 돌려놓고 False 를 반환합니다."""
+        target_peg = self.towers[peg_idx]
+        is_diff_peg = (peg_idx != self.source_peg_index)
+        is_valid_place = (not target_peg or self.selected_disk < target_peg[-1])
+
+        moved = is_diff_peg and is_valid_place
+        if moved:
+            target_peg.append(self.selected_disk)
+            self.move_count += 1
+            if self.replay is not None:
+                self.replay.record(hanoi_state.pack_move(self.source_peg_index, peg_idx, self.num_pegs),
+                                   lambda: hanoi_state.snapshot(self.towers))
+        else:
+            self.towers[self.source_peg_index].append(self.selected_disk)
+        self.selected_disk = None
+        return moved
+
+    def move(self, source, target):
+        """source 기둥의 맨 위 원반을 target 기둥으로 옮깁니다. 옮겼으면 True 를 반환합니다."""
+        return self.pick_up(source) is not None and self.drop(target)
+
+    def is_solved(self):
+        """처음 기둥이 아닌 기둥 하나에 모든 원반이 쌓였는지 확인합니다."""
+        return any(len(peg) == self.num_disks for peg in self.towers[1:])
+
+    # --- 힌트 ---
+    @property
+    def hint_available(self):
+        """임의 배치에서의 최단 경로는 기둥 3개일 때만 계산할 수 있으므로 그때만 힌트를 제공합니다."""
+        return self.num_pegs == 3
+
+    def hint(self):
+        """가장 가까운 성공 상태로 가는 다음 수와 남은 최소 이동 횟수를 반환합니다."""
+        return hanoi_state.hint(self.towers)
+
+    # --- 자동 풀이 ---
+    def start_autosolve(self, num_disks, speed=1):
+        """num_disks 개 탑의 최적해 재생을 시작합니다. 사람이 둔 수가 아니므로 게임 기록은 남기지 않습니다."""
+        self.close_replay()
+        self.num_disks = num_disks
+        self.selected_disk = None
+        self.source_peg_index = -1
+        self.playback = Playback(num_disks, self.num_pegs, speed)
+        self.min_moves = self.playback.total
+        self.advance_autosolve(0.0)
+
+    def advance_autosolve(self, seconds):
+        """자동 풀이를 seconds 초만큼 진행하고 towers 와 이동 횟수를 재생 위치에 맞춥니다."""
+        self.playback.advance(seconds)
+        self.towers = self.playback.towers()
+        self.move_count = self.playback.index
+
+    # --- 게임 기록 ---
+    def start_replay(self):
+        """이전 세션 기록을 닫고 현재 배치부터 새 세션 기록을 시작합니다."""
+        self.close_replay()
+        if self.replay_dir is not None:
+            self.replay = ReplayWriter(new_replay_path(self.replay_dir, 'hanoi'),
+                                       hanoi_state.replay_info(self.num_disks, self.num_pegs),
+                                       2 * hanoi_state.peg_bits(self.num_pegs),
+                                       hanoi_state.snapshot(self.towers))
+
+    def close_replay(self):
+        """현재 세션 기록을 닫습니다. 남은 기록은 백그라운드에서 파일에 씁니다."""
+        if self.replay is not None:
+            self.replay.close()
+            self.replay = None
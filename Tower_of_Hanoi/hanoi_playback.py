@@ -0,0 +1,83 @@
+"""하노이의 탑 자동 풀이 재생(화면과 무관한 로직).
+
+재생 속도는 초당 수(1 ~ 수백만)로 정하고, 프레임마다 흐른 시간만큼 수 번호를 앞으로 옮긴 뒤 그
+번호의 배치를 frame_stewart.disk_pegs_after 로 바로 구합니다. 그 사이의 수를 하나씩 두지 않으므로
+한 프레임의 계산량은 속도와 상관없이 원반 수에 비례합니다.
+
+한 수가 ANIMATION_FRAMES 프레임 이상 걸리는 느린 속도에서만 진행 중인 수를 움직임으로 보여 주고,
+그보다 빠르면 어차피 눈에 보이지 않으므로 프레임마다 배치만 바꿉니다.
+"""
+import frame_stewart
+
+SPEEDS = tuple(base * 10 ** exp for exp in range(7) for base in (1, 2, 5))  # 초당 수 (1 ~ 5,000,000)
+ANIMATION_FRAMES = 6   # 한 수를 움직임으로 보여 주려면 필요한 최소 프레임 수
+MAX_STEP = 0.25        # 한 번에 진행할 최대 시간 (초). 창을 끌거나 멈췄던 뒤에 한꺼번에 건너뛰지 않도록 함
+
+
+class Playback:
+    """최적해의 수 번호와 재생 속도를 관리하고 현재 배치를 계산하는 클래스"""
+
+    def __init__(self, num_disks, num_pegs=3, speed=1):
+        """원반, 기둥 개수와 초당 수를 받아 첫 수 앞에서 멈춰 있는 재생을 만듭니다."""
+        self.num_disks = num_disks
+        self.num_pegs = num_pegs
+        self.total = frame_stewart.min_moves(num_disks, num_pegs)
+        self.speed = speed
+        self.paused = False
+        self.index = 0        # 끝낸 수의 개수
+        self.fraction = 0.0   # 진행 중인 수(index + 1 번째)가 진행된 비율
+        self._pegs = None     # (index, 원반별 기둥) 캐시
+
+    @property
+    def finished(self):
+        return self.index >= self.total
+
+    @property
+    def running(self):
+        """멈추지 않았고 끝나지 않아 프레임마다 배치가 바뀔 수 있는지 여부"""
+        return not self.paused and not self.finished
+
+    # --- 진행 ---
+    def advance(self, seconds):
+        """seconds 초만큼 재생을 진행합니다. 정수 수 번호와 소수 진행률을 따로 두어 큰 번호에서도 정확합니다."""
+        if self.paused or self.finished:
+            return
+        position = self.fraction + min(seconds, MAX_STEP) * self.speed
+        whole = int(position)
+        self.fraction = position - whole
+        self.index += whole
+        if self.index >= self.total:
+            self.index, self.fraction = self.total, 0.0
+
+    def seek(self, index):
+        """index 수를 둔 직후로 옮깁니다."""
+        self.index = max(0, min(index, self.total))
+        self.fraction = 0.0
+
+    def change_speed(self, steps):
+        """SPEEDS 에서 steps 단계만큼 빠르거나 느린 속도로 바꿉니다."""
+        i = min(range(len(SPEEDS)), key=lambda j: abs(SPEEDS[j] - self.speed))
+        self.speed = SPEEDS[max(0, min(len(SPEEDS) - 1, i + steps))]
+        return self.speed
+
+    # --- 현재 배치 ---
+    def disk_pegs(self):
+        """index 수 뒤 각 원반이 놓인 기둥을 원반 크기 순서로 반환합니다. 같은 번호면 다시 계산하지 않습니다."""
+        if self._pegs is None or self._pegs[0] != self.index:
+            self._pegs = (self.index, frame_stewart.disk_pegs_after(self.num_disks, self.index, self.num_pegs))
+        return self._pegs[1]
+
+    def towers(self):
+        """index 수 뒤 배치를 게임의 towers 형식(기둥별로 아래 원반부터 크기 목록)으로 반환합니다."""
+        towers = [[] for _ in range(self.num_pegs)]
+        pegs = self.disk_pegs()
+        for size in range(self.num_disks, 0, -1):
+            towers[pegs[size - 1]].append(size)
+        return towers
+
+    def moving(self, fps):
+        """움직임으로 보여 줄 만큼 느리면 진행 중인 수와 진행률을 (원반, 출발, 도착, 비율) 로 반환합니다."""
+        if self.finished or self.speed * ANIMATION_FRAMES > fps:
+            return None
+        disk, source, target = frame_stewart.nth_move(self.num_disks, self.index + 1, self.num_pegs)
+        return disk, source, target, self.fraction
@@ -0,0 +1,97 @@
+"""하노이의 탑 최적해 계산.
+
+원반 n개의 최적해는 2**n - 1 수이며, m번째 수(1부터 시작)는 m 의 비트만으로 구할 수 있습니다.
+
+- 움직이는 원반은 m 의 가장 낮은 켜진 비트 위치 i 로 정해집니다 (i = 0 이 가장 작은 원반).
+- 원반 i 는 항상 같은 방향으로 한 칸씩 순환하며, 방향은 n - i 의 홀짝으로 정해집니다.
+- 처음 k 수 동안 원반 i 가 움직인 횟수는 (k + 2**i) >> (i + 1) 입니다.
+
+따라서 수 목록을 만들지 않고도 수를 차례로 생성하고, k번째 수와 k수 뒤의 배치를 O(n) 에
+바로 구할 수 있습니다. 기둥 번호는 0, 1, 2 이며 원반 크기는 게임과 같이 1(가장 작음)부터 n 입니다.
+"""
+
+
+def min_moves(num_disks):
+    """원반 num_disks 개를 옮기는 최소 이동 횟수를 반환합니다."""
+    return (1 << num_disks) - 1
+
+
+def _check_pegs(source, target):
+    if {source, target} - {0, 1, 2} or source == target:
+        raise ValueError("source and target must be different pegs in 0..2")
+    return 3 - source - target
+
+
+def _direction(num_disks, disk_index):
+    """원반 disk_index(0부터)가 source -> spare -> target 순서로 도는지(+1) 반대인지(-1) 반환합니다."""
+    return 1 if (num_disks - disk_index) % 2 == 0 else -1
+
+
+def iter_moves(num_disks, source=0, target=2):
+    """최적해의 수를 (원반 크기, 출발 기둥, 도착 기둥) 으로 하나씩 생성합니다. 메모리는 O(1) 입니다."""
+    spare = _check_pegs(source, target)
+    # (m & m-1) % 3, ((m | m-1) + 1) % 3 은 0번 기둥에서 출발해 n 이 홀수면 2번, 짝수면 1번 기둥에서
+    # 끝나는 해이므로, 실제 기둥 번호로 바꾸는 표를 홀짝에 따라 고릅니다.
+    pegs = (source, spare, target) if num_disks % 2 else (source, target, spare)
+    for m in range(1, 1 << num_disks):
+        yield ((m & -m).bit_length(),
+               pegs[(m & (m - 1)) % 3],
+               pegs[((m | (m - 1)) + 1) % 3])
+
+
+def nth_move(num_disks, k, source=0, target=2):
+    """k번째 수(1부터 시작)를 (원반 크기, 출발 기둥, 도착 기둥) 으로 반환합니다."""
+    spare = _check_pegs(source, target)
+    if not 1 <= k <= min_moves(num_disks):
+        raise ValueError(f"move {k} is out of range for {num_disks} disks")
+    disk_index = (k & -k).bit_length() - 1
+    done = k >> (disk_index + 1)  # 이 원반이 이전에 움직인 횟수
+    order = (source, spare, target)
+    direction = _direction(num_disks, disk_index)
+    return (disk_index + 1,
+            order[(direction * done) % 3],
+            order[(direction * (done + 1)) % 3])
+
+
+def disk_pegs_after(num_disks, k, source=0, target=2):
+    """k수 뒤 각 원반이 놓인 기둥을 원반 크기 순서(작은 것부터)의 튜플로 반환합니다."""
+    spare = _check_pegs(source, target)
+    if not 0 <= k <= min_moves(num_disks):
+        raise ValueError(f"move {k} is out of range for {num_disks} disks")
+    order = (source, spare, target)
+    return tuple(order[(_direction(num_disks, i) * ((k + (1 << i)) >> (i + 1))) % 3]
+                 for i in range(num_disks))
+
+
+def towers_after(num_disks, k, source=0, target=2):
+    """k수 뒤 배치를 게임의 towers 형식(기둥별로 아래 원반부터 크기 목록)으로 반환합니다."""
+    towers = [[], [], []]
+    pegs = disk_pegs_after(num_disks, k, source, target)
+    for size in range(num_disks, 0, -1):
+        towers[pegs[size - 1]].append(size)
+    return towers
+
+
+def verify_moves(num_disks, moves, source=0, target=2):
+    """(출발 기둥, 도착 기둥) 목록이 규칙을 지키며 모든 원반을 target 으로 옮기는지 확인합니다.
+
+    규칙을 어기거나 끝까지 옮기지 못하면 ValueError 를 일으키고, 성공하면 이동 횟수를 반환합니다.
+    각 기둥은 원반 크기 비트마스크로 나타내며 가장 낮은 켜진 비트가 맨 위 원반입니다.
+    """
+    _check_pegs(source, target)
+    pegs = [0, 0, 0]
+    pegs[source] = (1 << num_disks) - 1
+    count = 0
+    for count, (from_peg, to_peg) in enumerate(moves, 1):
+        if from_peg == to_peg or not 0 <= from_peg <= 2 or not 0 <= to_peg <= 2:
+            raise ValueError(f"move {count}: invalid pegs {from_peg} -> {to_peg}")
+        top = pegs[from_peg] & -pegs[from_peg]
+        if not top:
+            raise ValueError(f"move {count}: peg {from_peg} is empty")
+        if pegs[to_peg] & (top - 1):
+            raise ValueError(f"move {count}: cannot place disk on a smaller one")
+        pegs[from_peg] ^= top
+        pegs[to_peg] |= top
+    if pegs[target] != (1 << num_disks) - 1:
+        raise ValueError("tower was not moved to the target peg")
+    return count
@@ -0,0 +1,203 @@
+"""하노이의 탑 상태 인코딩과 임의 배치에서의 최단 경로.
+
+상태는 원반마다 놓인 기둥 번호(0~2) 한 자리씩을 3진수로 묶은 정수입니다. 가장 작은 원반이
+가장 낮은 자리(3**0)이며, 같은 기둥의 원반 순서는 크기로 정해지므로 이것만으로 배치가 결정됩니다.
+
+임의의 (규칙에 맞는) 배치에서 모든 원반을 한 기둥으로 모으는 최단 거리와 첫 수는 가장 큰
+원반부터 차례로 보며 O(n) 에 구할 수 있습니다. 분석용으로 n <= 15 인 모든 3**n 상태의 거리표를
+NumPy 로 너비 우선 탐색해서 만들고 .npy 파일로 저장한 뒤 메모리 맵으로 엽니다.
+"""
+import os
+import sys
+
+GOAL_PEGS = (1, 2)  # 게임은 1번 또는 2번 기둥에 모두 쌓으면 성공
+MAX_TABLE_DISKS = 15
+UNREACHED = 0xFFFF
+
+
+# --- 상태 인코딩 ---
+def disk_pegs(towers):
+    """towers(기둥별로 아래 원반부터 크기 목록)에서 원반 크기 순서대로 놓인 기둥을 반환합니다."""
+    pegs = [0] * sum(len(peg) for peg in towers)
+    for peg_idx, peg in enumerate(towers):
+        for disk_size in peg:
+            pegs[disk_size - 1] = peg_idx
+    return pegs
+
+
+def encode(towers):
+    """towers 를 3진수 상태 코드로 바꿉니다."""
+    code = 0
+    for peg in reversed(disk_pegs(towers)):
+        code = code * 3 + peg
+    return code
+
+
+def decode(code, num_disks):
+    """상태 코드를 towers 형식으로 되돌립니다."""
+    towers = [[], [], []]
+    digits = []
+    for _ in range(num_disks):
+        code, peg = divmod(code, 3)
+        digits.append(peg)
+    for size in range(num_disks, 0, -1):
+        towers[digits[size - 1]].append(size)
+    return towers
+
+
+# --- 리플레이 기록 ---
+def peg_bits(num_pegs):
+    """기둥 번호 하나를 담는 비트 수를 반환합니다 (기둥 3개면 2비트)."""
+    return max(1, (num_pegs - 1).bit_length())
+
+
+def pack_move(source, target, num_pegs):
+    """(출발 기둥, 도착 기둥) 을 기둥 번호마다 peg_bits 비트씩 묶은 정수로 바꿉니다."""
+    return source << peg_bits(num_pegs) | target
+
+
+def unpack_move(code, num_pegs):
+    """pack_move 로 묶은 수를 (출발 기둥, 도착 기둥) 으로 되돌립니다."""
+    bits = peg_bits(num_pegs)
+    return code >> bits, code & ((1 << bits) - 1)
+
+
+def replay_info(num_disks, num_pegs):
+    """리플레이 헤더에 저장할 게임 설정을 반환합니다."""
+    return {'game': 'hanoi', 'disks': num_disks, 'pegs': num_pegs}
+
+
+def snapshot(towers):
+    """리플레이 키프레임용으로 원반마다 놓인 기둥 번호를 한 바이트씩 담은 bytes 를 반환합니다."""
+    return bytes(disk_pegs(towers))
+
+
+def replay_towers(reader, k):
+    """리플레이에서 k수를 둔 뒤의 towers 를 복원합니다."""
+    num_pegs = reader.info['pegs']
+    keyframe, moves = reader.seek(k)
+    towers = [[] for _ in range(num_pegs)]
+    for size in range(len(keyframe), 0, -1):
+        towers[keyframe[size - 1]].append(size)
+    for code in moves:
+        source, target = unpack_move(code, num_pegs)
+        towers[target].append(towers[source].pop())
+    return towers
+
+
+# --- 최단 경로 ---
+def distance(towers, goal):
+    """모든 원반을 goal 기둥으로 옮기는 최소 이동 횟수를 반환합니다."""
+    pegs = disk_pegs(towers)
+    total = 0
+    for i in range(len(pegs) - 1, -1, -1):
+        # 원반 i 가 목표 기둥에 없으면 작은 원반들을 나머지 기둥에 모은 뒤(2**i - 1 수) 옮겨야 함
+        if pegs[i] != goal:
+            total += 1 << i
+            goal = 3 - pegs[i] - goal
+    return total
+
+
+def next_move(towers, goal):
+    """goal 기둥으로 모으는 최단 경로의 첫 수를 (출발 기둥, 도착 기둥) 으로 반환합니다. 이미 모였으면 None."""
+    pegs = disk_pegs(towers)
+    move = None
+    for i in range(len(pegs) - 1, -1, -1):
+        if pegs[i] != goal:
+            # 더 작은 원반들이 모두 제자리라면 이 원반을 옮기는 것이 첫 수
+            move = (pegs[i], goal)
+            goal = 3 - pegs[i] - goal
+    return move
+
+
+def best_goal(towers, goals=GOAL_PEGS):
+    """가장 가까운 목표 기둥과 그 거리를 반환합니다."""
+    return min(((goal, distance(towers, goal)) for goal in goals), key=lambda item: item[1])
+
+
+def hint(towers, goals=GOAL_PEGS):
+    """가장 가까운 목표로 가는 최선의 다음 수와 남은 최소 이동 횟수를 반환합니다."""
+    goal, moves_left = best_goal(towers, goals)
+    return next_move(towers, goal), moves_left
+
+
+# --- 전체 거리표 ---
+def default_table_path(num_disks):
+    """거리표를 저장할 기본 경로(모듈과 같은 폴더)를 반환합니다."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'hanoi_distance_{num_disks}.npy')
+
+
+def build_distance_table(num_disks, goals=GOAL_PEGS):
+    """모든 상태에서 goals 중 가장 가까운 목표까지의 거리를 uint16 배열로 반환합니다.
+
+    목표 상태들에서 시작해 한 층씩 너비 우선 탐색하며, 층마다 모든 상태의 이웃을 한꺼번에 계산합니다.
+    """
+    import numpy as np  # 분석용 기능에서만 NumPy 가 필요하므로 게임 실행에는 필요 없음
+
+    if not 1 <= num_disks <= MAX_TABLE_DISKS:
+        raise ValueError(f"distance tables support 1..{MAX_TABLE_DISKS} disks")
+    powers = 3 ** np.arange(num_disks, dtype=np.int64)
+    table = np.full(3 ** num_disks, UNREACHED, dtype=np.uint16)
+    frontier = np.array([goal * int(powers.sum()) for goal in goals], dtype=np.int64)
+    table[frontier] = 0
+    depth = 0
+    while frontier.size:
+        depth += 1
+        digits = (frontier[:, None] // powers) % 3
+        # 기둥별 맨 위 원반 = 그 기둥에 있는 가장 작은 원반 (비어 있으면 num_disks)
+        tops = np.full((frontier.size, 3), num_disks, dtype=np.int64)
+        for peg in range(3):
+            on_peg = digits == peg
+            tops[:, peg] = np.where(on_peg.any(axis=1), on_peg.argmax(axis=1), num_disks)
+
+        neighbours = []
+        for src in range(3):
+            for dst in range(3):
+                if src == dst:
+                    continue
+                ok = tops[:, src] < tops[:, dst]
+                disk = tops[ok, src]
+                neighbours.append(frontier[ok] + (dst - src) * powers[disk])
+        candidates = np.unique(np.concatenate(neighbours))
+        frontier = candidates[table[candidates] == UNREACHED]
+        table[frontier] = depth
+    return table
+
+
+def write_distance_table(num_disks, path=None, table=None):
+    """거리표를 .npy 파일로 저장하고 경로를 반환합니다."""
+    import numpy as np
+
+    if path is None:
+        path = default_table_path(num_disks)
+    if table is None:
+        table = build_distance_table(num_disks)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, table)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_distance_table(num_disks, path=None, build_if_missing=False):
+    """거리표를 읽기 전용 메모리 맵으로 엽니다. 파일이 없으면 새로 만들거나(build_if_missing) None 을 반환합니다."""
+    import numpy as np
+
+    if path is None:
+        path = default_table_path(num_disks)
+    if not os.path.exists(path):
+        if not build_if_missing:
+            return None
+        write_distance_table(num_disks, path)
+    table = np.load(path, mmap_mode='r')
+    if table.dtype != np.uint16 or table.shape != (3 ** num_disks,):
+        raise ValueError(f"{path} is not a distance table for {num_disks} disks")
+    return table
+
+
+if __name__ == '__main__':
+    disks = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    out_path = sys.argv[2] if len(sys.argv) > 2 else default_table_path(disks)
+    dist = build_distance_table(disks)
+    write_distance_table(disks, out_path, dist)
+    print(f"{out_path}: {dist.size} states, max distance {int(dist.max())}")
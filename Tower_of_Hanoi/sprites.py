@@ -0,0 +1,70 @@
+"""하노이의 탑 화면 요소용 스프라이트 도구.
+
+원반과 기둥처럼 모양이 바뀌지 않는 이미지는 한 장의 아틀라스 Surface 에 한 번만 그려 두고
+subsurface 로 꺼내 씁니다. 화면 요소는 pygame.sprite.LayeredDirty 그룹에 넣어, 움직이거나
+이미지가 바뀐 스프라이트가 지나간 영역만 다시 그립니다.
+"""
+import pygame
+
+
+class SpriteAtlas:
+    """여러 이미지를 세로로 쌓아 한 장의 Surface 에 담는 아틀라스"""
+
+    def __init__(self, sizes, padding=1):
+        """{키: (너비, 높이)} 를 받아 각 이미지가 들어갈 영역을 배치하고 빈 아틀라스를 만듭니다."""
+        self.regions = {}
+        width = height = 0
+        for key, (w, h) in sizes.items():
+            self.regions[key] = pygame.Rect(0, height, w, h)
+            width = max(width, w)
+            height += h + padding
+        self.surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+        self._images = {}
+
+    def canvas(self, key):
+        """key 영역에 그림을 그릴 수 있는 subsurface 를 반환합니다."""
+        return self.surface.subsurface(self.regions[key])
+
+    def image(self, key):
+        """key 영역의 이미지를 반환합니다. 같은 key 는 같은 Surface 객체를 돌려줍니다."""
+        image = self._images.get(key)
+        if image is None:
+            image = self._images[key] = self.surface.subsurface(self.regions[key])
+        return image
+
+
+class ImageSprite(pygame.sprite.DirtySprite):
+    """이미지와 위치가 바뀔 때만 다시 그려지는 스프라이트"""
+
+    def __init__(self, image, topleft=(0, 0)):
+        """이미지와 왼쪽 위 좌표로 스프라이트를 만듭니다."""
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(topleft=topleft)
+
+    def set_image(self, image):
+        """다른 Surface 가 들어오면 이미지를 바꾸고 다시 그리도록 표시합니다."""
+        if image is not self.image:
+            self.image = image
+            self.rect.size = image.get_size()
+            self.dirty = 1
+
+    def move_to(self, topleft):
+        """위치가 바뀌면 옮기고 다시 그리도록 표시합니다."""
+        if self.rect.topleft != topleft:
+            self.rect.topleft = topleft
+            self.dirty = 1
+
+    def show(self, topleft=None):
+        """숨긴 스프라이트를 (필요하면 위치를 옮겨) 다시 보이게 합니다."""
+        if topleft is not None:
+            self.move_to(topleft)
+        if not self.visible:
+            self.visible = 1
+            self.dirty = 1
+
+    def hide(self):
+        """스프라이트를 숨기고 원래 있던 자리를 다시 그리도록 표시합니다."""
+        if self.visible:
+            self.visible = 0
+            self.dirty = 1
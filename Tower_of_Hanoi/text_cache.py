@@ -0,0 +1,57 @@
+"""폰트로 렌더링한 글자 Surface 캐시.
+
+font.render 는 호출할 때마다 글자를 다시 래스터화하므로, 같은 (폰트, 문자열, 색, 안티앨리어스)
+조합은 한 번만 렌더링하고 Surface 를 재사용합니다. 캐시 크기는 정해진 개수로 제한하며
+가장 오래 쓰이지 않은 항목부터 지웁니다(LRU).
+"""
+from collections import OrderedDict
+
+
+class TextCache:
+    """(폰트, 문자열, 색, 안티앨리어스) 를 키로 렌더링 결과를 보관하는 LRU 캐시"""
+
+    def __init__(self, maxsize=128):
+        """캐시에 보관할 최대 Surface 개수를 받아 초기화합니다."""
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self._slots = {}  # 값이 바뀌는 문구(이동 횟수 등)의 이름 -> 현재 키
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """캐시된 Surface 를 반환하고, 없으면 렌더링해서 보관합니다."""
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def render_value(self, slot, font, text, color, antialias=True):
+        """값이 바뀌는 문구를 렌더링합니다. 같은 slot 의 이전 문구는 캐시에서 바로 지웁니다."""
+        key = (font, text, color, antialias)
+        old_key = self._slots.get(slot)
+        if old_key != key:
+            if old_key is not None:
+                self._surfaces.pop(old_key, None)
+            self._slots[slot] = key
+        return self.render(font, text, color, antialias)
+
+    def invalidate(self, slot=None):
+        """slot 의 캐시를 지웁니다. slot 을 주지 않으면 캐시 전체를 비웁니다."""
+        if slot is None:
+            self._surfaces.clear()
+            self._slots.clear()
+            return
+        key = self._slots.pop(slot, None)
+        if key is not None:
+            self._surfaces.pop(key, None)
+
+    def __len__(self):
+        return len(self._surfaces)
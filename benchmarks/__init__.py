@@ -0,0 +1,4 @@
+"""두 게임의 규칙, 솔버, 화면 그리기 성능을 재는 벤치마크 모음.
+
+사용법: python -m benchmarks [--filter 패턴] [--output 결과.json] [--baseline 기준.json]
+"""
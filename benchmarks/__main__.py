@@ -0,0 +1,117 @@
+"""벤치마크 실행 진입점.
+
+결과는 JSON 으로 --output 파일(기본: 표준 출력)에 쓰고, 사람이 읽을 요약은 표준 에러에 씁니다.
+--baseline 을 주면 기준 결과와 비교해 허용 비율보다 느려진 항목이 있을 때 종료 코드 1 로 끝납니다.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline benchmarks/baseline.json --threshold 0.3 --case-threshold 'hanoi.frame.*=0.5'
+    python -m benchmarks --filter 'hanoi.solver.*' --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import sys
+
+# pygame 을 가져오기 전에 정해야 창 없이 실행됨
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # 표준 출력의 JSON 앞에 인사말이 끼지 않도록
+
+from benchmarks import harness
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def _case_threshold(text):
+    pattern, sep, value = text.rpartition('=')
+    if not sep or not pattern:
+        raise argparse.ArgumentTypeError("expected PATTERN=RATIO")
+    try:
+        return pattern, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ratio: {value}") from None
+
+
+def all_benchmarks():
+    """두 게임의 벤치마크 목록을 반환합니다."""
+    harness.setup_paths()
+    from benchmarks import hanoi, tictactoe
+    return tictactoe.benchmarks() + hanoi.benchmarks()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Headless benchmarks for Tic-Tac-Toe and Tower of Hanoi")
+    parser.add_argument('--filter', nargs='+', metavar='PATTERN', help="only run benchmarks matching these globs")
+    parser.add_argument('--list', action='store_true', help="list benchmark names and exit")
+    parser.add_argument('--repeat', type=int, default=harness.DEFAULT_REPEAT, help="timed samples per round")
+    parser.add_argument('--rounds', type=int, default=harness.DEFAULT_ROUNDS,
+                        help="passes over the whole benchmark list (spreads each case over the run)")
+    parser.add_argument('--output', '-o', help="write JSON results here instead of stdout")
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help=f"compare against a stored baseline (default path: {DEFAULT_BASELINE})")
+    parser.add_argument('--threshold', type=float, default=harness.DEFAULT_THRESHOLD,
+                        help="allowed slowdown ratio before a benchmark counts as a regression")
+    parser.add_argument('--case-threshold', type=_case_threshold, action='append', default=[],
+                        metavar='PATTERN=RATIO', help="per-benchmark threshold override (may repeat)")
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help="store these results as the new baseline (merged into an existing file)")
+    args = parser.parse_args(argv)
+
+    benchmarks = harness.select(all_benchmarks(), args.filter)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+    if not benchmarks:
+        parser.error("no benchmarks match the filter")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    def progress(name, stats):
+        print(f"{name:<52} {harness.format_time(stats['median']):>10}  (x{stats['number']})", file=sys.stderr)
+
+    results = harness.run(benchmarks, args.repeat, progress, args.rounds)
+    output = harness.report(results)
+
+    regressions = []
+    if baseline is not None:
+        comparison = harness.compare(results, baseline, args.threshold, args.case_threshold)
+        output['baseline'] = {'path': args.baseline, 'created': baseline.get('created'),
+                              'environment': baseline.get('environment')}
+        output['comparison'] = comparison
+        regressions = [name for name, row in comparison.items() if row['status'] == 'regression']
+        for name, row in comparison.items():
+            if row['status'] != 'ok':
+                ratio = f"{row['ratio']:.2f}x" if row['ratio'] is not None else '-'
+                print(f"{row['status']:<12} {name} {ratio} (limit {1 + row['threshold']:.2f}x)", file=sys.stderr)
+
+    text = json.dumps(output, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.save_baseline:
+        saved = {'results': {}}
+        if os.path.exists(args.save_baseline):
+            with open(args.save_baseline, encoding='utf-8') as f:
+                saved = json.load(f)
+        # 일부만 다시 잰 경우에도 나머지 항목의 기준값은 그대로 둠
+        saved_results = {**saved.get('results', {}), **results}
+        saved = harness.report(dict(sorted(saved_results.items())))
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(saved, indent=2, ensure_ascii=False) + '\n')
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
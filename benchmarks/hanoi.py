@@ -0,0 +1,201 @@
+"""하노이의 탑 벤치마크: 솔버, 상태 분석(힌트, 거리 표), 화면 그리기."""
+import random
+from collections import deque
+
+from benchmarks.harness import Benchmark, open_display
+
+SOLVER_DISKS = (8, 12, 16)
+HINT_DISKS = (8, 16, 32)
+TABLE_DISKS = (6, 8, 10)
+STATE_COUNT = 256
+
+
+def _consume(iterable):
+    """이터레이터를 끝까지 소비합니다."""
+    deque(iterable, maxlen=0)
+
+
+def _random_towers(num_disks, count, seed=0):
+    """원반마다 기둥을 무작위로 고른 배치를 count 개 만듭니다."""
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        towers = [[], [], []]
+        for disk in range(num_disks, 0, -1):
+            towers[rng.randrange(3)].append(disk)
+        states.append(towers)
+    return states
+
+
+# --- 솔버 ---
+def make_iter_moves(num_disks):
+    import hanoi_solver
+    return lambda: _consume(hanoi_solver.iter_moves(num_disks))
+
+
+def make_nth_move(num_disks):
+    """2^n - 1 수 중 임의의 k 번째 수를 바로 계산하는 시간"""
+    import hanoi_solver
+    rng = random.Random(0)
+    ks = [rng.randrange(hanoi_solver.min_moves(num_disks)) for _ in range(STATE_COUNT)]
+    state = {'i': 0}
+
+    def op():
+        i = state['i']
+        state['i'] = (i + 1) % len(ks)
+        hanoi_solver.nth_move(num_disks, ks[i])
+    return op
+
+
+def make_frame_stewart_min_moves(num_disks, num_pegs):
+    """메모 표를 비운 상태에서 최소 이동 횟수를 구하는 시간"""
+    import frame_stewart
+
+    def op():
+        frame_stewart._tables.clear()
+        frame_stewart.min_moves(num_disks, num_pegs)
+    return op
+
+
+def make_frame_stewart_iter_moves(num_disks, num_pegs):
+    import frame_stewart
+    return lambda: _consume(frame_stewart.iter_moves(num_disks, num_pegs))
+
+
+def make_disk_pegs_after(num_disks, num_pegs):
+    """수를 두지 않고 임의의 k 수 뒤 배치를 바로 구하는 시간 (자동 풀이가 프레임마다 하는 계산)"""
+    import frame_stewart
+    rng = random.Random(0)
+    ks = [rng.randrange(frame_stewart.min_moves(num_disks, num_pegs) + 1) for _ in range(STATE_COUNT)]
+    state = {'i': 0}
+
+    def op():
+        i = state['i']
+        state['i'] = (i + 1) % len(ks)
+        frame_stewart.disk_pegs_after(num_disks, ks[i], num_pegs)
+    return op
+
+
+def make_hint(num_disks):
+    """임의 배치에서 가장 가까운 성공 상태로 가는 다음 수를 구하는 시간"""
+    import hanoi_state
+    states = _random_towers(num_disks, STATE_COUNT)
+    state = {'i': 0}
+
+    def op():
+        i = state['i']
+        state['i'] = (i + 1) % len(states)
+        hanoi_state.hint(states[i])
+    return op
+
+
+def make_distance_table(num_disks):
+    import hanoi_state
+    return lambda: hanoi_state.build_distance_table(num_disks)
+
+
+# --- 그리기 ---
+def _game(num_disks):
+    """기록을 남기지 않는 게임 객체를 만들어 num_disks 개로 시작합니다."""
+    import Tower_of_Hanoi as game_module
+    surface = open_display((game_module.SCREEN_WIDTH, game_module.SCREEN_HEIGHT))
+    game = game_module.Game(surface)
+    game.replay_dir = None
+    game.reset(num_disks)
+    return game
+
+
+def make_full_frame(num_disks):
+    """플레이 화면 전체를 다시 그리는 시간 (상태가 바뀐 첫 프레임)"""
+    game = _game(num_disks)
+    screen_rect = game.screen.get_rect()
+
+    def op():
+        game.sprites.repaint_rect(screen_rect)
+        game._draw_gameplay_screen()
+    return op
+
+
+def make_drag_frame(num_disks):
+    """원반 하나가 움직일 때 바뀐 영역만 다시 그리는 시간 (끌고 있는 원반과 같은 경로)"""
+    game = _game(num_disks)
+    # 더미 드라이버에서는 마우스 위치를 바꿀 수 없으므로, 집지 않은 맨 위 원반의 스프라이트를 직접 움직임
+    sprite = game.disk_sprites[game.towers[0][-1]]
+    positions = [(100 + 6 * i, 150 + (i % 7) * 5) for i in range(100)]
+    state = {'i': 0}
+
+    def op():
+        i = state['i']
+        state['i'] = (i + 1) % len(positions)
+        sprite.move_to(positions[i])
+        game._draw_gameplay_screen()
+    return op
+
+
+def make_autosolve_frame(num_disks, speed):
+    """자동 풀이 한 프레임 (재생 진행, 원반 배치, 바뀐 영역 그리기) 의 시간"""
+    import Tower_of_Hanoi as game_module
+    surface = open_display((game_module.SCREEN_WIDTH, game_module.SCREEN_HEIGHT))
+    game = game_module.Game(surface)
+    game.replay_dir = None
+    game.start_autosolve(num_disks, speed)
+
+    def op():
+        if game.playback.finished:
+            game.playback.seek(0)
+        game.update_autosolve(1 / game_module.FPS)
+        game._draw_gameplay_screen()
+    return op
+
+
+def make_pre_render_background():
+    game = _game(3)
+    return game.pre_render_background
+
+
+def make_resize(size):
+    """창 크기가 바뀐 뒤 배경, 오버레이, 아틀라스, 스프라이트를 다시 만드는 시간"""
+    import Tower_of_Hanoi as game_module
+    game = _game(game_module.MAX_DISKS)
+    layout = game_module.ScreenLayout(size)
+    return lambda: game.apply_layout(layout)
+
+
+def benchmarks():
+    """하노이의 탑 벤치마크 목록을 반환합니다. NumPy 가 없으면 거리 표 항목은 뺍니다."""
+    from hanoi_core import MIN_DISKS, MAX_DISKS, MAX_AUTO_DISKS
+    items = []
+    for n in SOLVER_DISKS:
+        items.append(Benchmark(f'hanoi.solver.iter_moves[disks={n}]', lambda n=n: make_iter_moves(n)))
+    items.append(Benchmark('hanoi.solver.nth_move[disks=64]', lambda: make_nth_move(64)))
+    for n, p in ((64, 4), (64, 8), (1000, 4)):
+        items.append(Benchmark(f'hanoi.frame_stewart.min_moves[disks={n},pegs={p}]',
+                               lambda n=n, p=p: make_frame_stewart_min_moves(n, p)))
+    for n in SOLVER_DISKS:
+        items.append(Benchmark(f'hanoi.frame_stewart.iter_moves[disks={n},pegs=4]',
+                               lambda n=n: make_frame_stewart_iter_moves(n, 4)))
+    for p in (3, 4):
+        items.append(Benchmark(f'hanoi.frame_stewart.disk_pegs_after[disks=64,pegs={p}]',
+                               lambda p=p: make_disk_pegs_after(64, p)))
+    for n in HINT_DISKS:
+        items.append(Benchmark(f'hanoi.state.hint[disks={n}]', lambda n=n: make_hint(n)))
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        for n in TABLE_DISKS:
+            items.append(Benchmark(f'hanoi.state.distance_table[disks={n}]', lambda n=n: make_distance_table(n)))
+
+    items.append(Benchmark('hanoi.pre_render_background', make_pre_render_background))
+    items.append(Benchmark('hanoi.resize[size=1920x1080]', lambda: make_resize((1920, 1080))))
+    # 게임에서 고를 수 있는 모든 원반 개수
+    for n in range(MIN_DISKS, MAX_DISKS + 1):
+        items.append(Benchmark(f'hanoi.frame.full[disks={n}]', lambda n=n: make_full_frame(n)))
+    for n in (MIN_DISKS, MAX_DISKS):
+        items.append(Benchmark(f'hanoi.frame.drag[disks={n}]', lambda n=n: make_drag_frame(n)))
+    # 자동 풀이는 원반 개수, 속도와 상관없이 프레임 시간이 일정해야 함
+    for n, speed in ((MAX_DISKS, 2), (MAX_AUTO_DISKS, 2), (MAX_AUTO_DISKS, 5_000_000)):
+        items.append(Benchmark(f'hanoi.frame.autosolve[disks={n},speed={speed}]',
+                               lambda n=n, speed=speed: make_autosolve_frame(n, speed)))
+    return items
@@ -0,0 +1,210 @@
+"""벤치마크 실행, 결과 JSON 만들기, 기준(baseline) 결과와 비교하기.
+
+벤치마크 하나는 이름과 준비 함수(make)로 이루어집니다. make() 는 준비를 마친 뒤 잴 함수를
+반환하며, 그 함수를 한 번 부르는 것을 연산 하나로 봅니다. 한 번 재는 시간이 MIN_SAMPLE_TIME
+이상이 되도록 반복 횟수를 늘린 뒤 repeat 번 재고, 연산 하나의 중앙값을 대표값으로 씁니다.
+
+가상 머신에서는 몇 초 동안 통째로 느려지거나 빨라지는 일이 흔하므로, 전체 목록을 rounds 번 되풀이해
+같은 벤치마크의 측정을 실행 시간 전체에 흩고 라운드별 중앙값의 중앙값을 대표값으로 씁니다.
+"""
+import fnmatch
+import gc
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GAME_DIRS = (os.path.join(ROOT, 'Tic-tac-toe'), os.path.join(ROOT, 'Tower_of_Hanoi'))
+
+FORMAT_VERSION = 1
+MIN_SAMPLE_TIME = 0.05    # 한 번 잴 때의 최소 시간 (초)
+DEFAULT_REPEAT = 5
+DEFAULT_ROUNDS = 3
+DEFAULT_THRESHOLD = 0.5   # 기준보다 50% 넘게 느려지면 성능 저하로 판단 (단일 vCPU 가상 머신에서 같은 코드를 다시 재도 1.4배까지 차이남)
+
+Benchmark = namedtuple('Benchmark', 'name make')
+
+
+def setup_paths():
+    """게임 폴더를 모듈 검색 경로에 넣습니다. (각 게임의 모듈은 폴더 안에서 서로를 바로 가져옴)"""
+    for path in GAME_DIRS:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def open_display(size):
+    """pygame 화면을 열고 화면 Surface 를 반환합니다. (SDL 더미 드라이버면 창은 보이지 않음)"""
+    import pygame
+    if not pygame.get_init():
+        pygame.init()
+    surface = pygame.display.get_surface()
+    if surface is None or surface.get_size() != tuple(size):
+        surface = pygame.display.set_mode(size)
+    return surface
+
+
+def select(benchmarks, patterns=None):
+    """이름이 패턴(fnmatch) 중 하나에 맞는 벤치마크만 고릅니다. 패턴이 없으면 모두 고릅니다."""
+    if not patterns:
+        return list(benchmarks)
+    return [b for b in benchmarks if any(fnmatch.fnmatchcase(b.name, p) for p in patterns)]
+
+
+def _calibrate(func):
+    """한 번 잴 때 MIN_SAMPLE_TIME 이상 걸리도록 반복 횟수를 정합니다."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_SAMPLE_TIME:
+            return number
+        # 너무 짧게 잰 값으로 크게 건너뛰지 않도록 최대 10배씩 늘림
+        number *= min(10, max(2, int(MIN_SAMPLE_TIME / max(elapsed, 1e-9) * 1.2)))
+
+
+def _sample(func, repeat, number):
+    """func 를 number 번 부르는 측정을 repeat 번 하고 연산 하나의 시간(초) 목록을 반환합니다. (timeit 처럼 GC 는 끔)"""
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def _summarize(rounds, number):
+    """라운드별 측정 목록으로 통계 dict 를 만듭니다. 대표값은 라운드별 중앙값의 중앙값입니다."""
+    samples = [sample for samples in rounds for sample in samples]
+    median = statistics.median(statistics.median(samples) for samples in rounds)
+    return {
+        'median': median,
+        'min': min(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'ops_per_sec': 1.0 / median if median > 0 else None,
+        'number': number,
+        'repeat': len(rounds[0]),
+        'rounds': len(rounds),
+    }
+
+
+def measure(func, repeat=DEFAULT_REPEAT, number=None):
+    """func 한 번의 실행 시간 통계(초)를 dict 로 반환합니다."""
+    func()  # 첫 호출에서 생기는 캐시 준비 비용은 빼고 잼
+    if number is None:
+        number = _calibrate(func)
+    return _summarize([_sample(func, repeat, number)], number)
+
+
+def run(benchmarks, repeat=DEFAULT_REPEAT, on_result=None, rounds=DEFAULT_ROUNDS):
+    """벤치마크 목록 전체를 rounds 번 되풀이해 재고 이름 -> 통계 dict 를 반환합니다.
+
+    라운드마다 make() 로 새로 준비하고, 반복 횟수는 첫 라운드에서 정한 값을 계속 씁니다.
+    on_result 는 마지막 라운드에서 벤치마크마다 합친 통계로 부릅니다.
+    """
+    numbers = {}
+    measured = {bench.name: [] for bench in benchmarks}
+    results = {}
+    for round_index in range(rounds):
+        for bench in benchmarks:
+            func = bench.make()
+            func()  # 첫 호출에서 생기는 캐시 준비 비용은 빼고 잼
+            if bench.name not in numbers:
+                numbers[bench.name] = _calibrate(func)
+            measured[bench.name].append(_sample(func, repeat, numbers[bench.name]))
+            del func
+            if round_index == rounds - 1:
+                stats = _summarize(measured[bench.name], numbers[bench.name])
+                results[bench.name] = stats
+                if on_result is not None:
+                    on_result(bench.name, stats)
+    return results
+
+
+def environment():
+    """결과를 비교할 때 참고할 실행 환경 정보를 반환합니다."""
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except ImportError:
+        pygame_version = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'pygame': pygame_version,
+        'numpy': numpy_version,
+        'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+    }
+
+
+def report(results):
+    """결과 JSON 으로 저장할 dict 를 만듭니다."""
+    return {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'environment': environment(),
+        'results': results,
+    }
+
+
+# --- 기준 결과와 비교 ---
+def threshold_for(name, threshold, overrides):
+    """벤치마크에 적용할 허용 비율을 반환합니다. overrides 는 (패턴, 비율) 목록이며 마지막으로 맞는 것이 이깁니다."""
+    for pattern, value in overrides:
+        if fnmatch.fnmatchcase(name, pattern):
+            threshold = value
+    return threshold
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, overrides=()):
+    """현재 결과를 기준 결과(report 형식)와 중앙값으로 비교합니다.
+
+    이름 -> {'baseline', 'current', 'ratio', 'threshold', 'status'} dict 를 반환하며, status 는
+    'regression', 'improvement', 'ok', 'new'(기준에 없음) 중 하나입니다.
+    """
+    base_results = baseline.get('results', {})
+    comparison = {}
+    for name, stats in results.items():
+        limit = threshold_for(name, threshold, overrides)
+        base = base_results.get(name)
+        if base is None:
+            comparison[name] = {'baseline': None, 'current': stats['median'], 'ratio': None,
+                                'threshold': limit, 'status': 'new'}
+            continue
+        ratio = stats['median'] / base['median'] if base['median'] > 0 else float('inf')
+        if ratio > 1.0 + limit:
+            status = 'regression'
+        elif ratio < 1.0 / (1.0 + limit):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        comparison[name] = {'baseline': base['median'], 'current': stats['median'], 'ratio': ratio,
+                            'threshold': limit, 'status': status}
+    return comparison
+
+
+def format_time(seconds):
+    """시간을 읽기 쉬운 단위(ns, us, ms, s)의 문자열로 바꿉니다."""
+    for unit, scale in (('ns', 1e-9), ('us', 1e-6), ('ms', 1e-3)):
+        if seconds < scale * 1000:
+            return f"{seconds / scale:.1f} {unit}"
+    return f"{seconds:.2f} s"
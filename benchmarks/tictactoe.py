@@ -0,0 +1,167 @@
+"""순환 틱택토 벤치마크: 착수 규칙, 탐색, 한 프레임 그리기."""
+import importlib
+import os
+import random
+
+from benchmarks.harness import Benchmark, open_display
+
+POSITION_COUNT = 256
+MCTS_ITERATIONS = 200
+
+
+def _random_positions(count, seed=0):
+    """무작위 대국에서 게임이 끝나지 않은 보드를 count 개 모읍니다."""
+    from rolling_engine import RollingBoard
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = RollingBoard(rng.choice([1, -1]))
+        for _ in range(rng.randrange(1, 12)):
+            board.play(rng.choice(board.legal_moves()))
+            if board.winner:
+                break
+        if not board.winner:
+            positions.append(board)
+    return positions
+
+
+def _cycle(items):
+    """호출할 때마다 items 의 다음 원소를 반환하는 함수를 만듭니다."""
+    state = {'i': 0}
+
+    def next_item():
+        i = state['i']
+        state['i'] = (i + 1) % len(items)
+        return items[i]
+    return next_item
+
+
+# --- 규칙 ---
+def make_play_undo():
+    """착수(가장 오래된 말 제거와 승리 확인 포함)와 무르기 한 쌍"""
+    cases = [(board, random.Random(i).choice(board.legal_moves()))
+             for i, board in enumerate(_random_positions(POSITION_COUNT))]
+    next_case = _cycle(cases)
+
+    def op():
+        board, cell = next_case()
+        board.play(cell)
+        board.undo()
+    return op
+
+
+def make_legal_moves():
+    next_board = _cycle(_random_positions(POSITION_COUNT))
+    return lambda: next_board().legal_moves()
+
+
+def make_random_game():
+    """빈 보드에서 무작위 수로 한 판(최대 60수)을 두는 시간"""
+    from rolling_engine import RollingBoard
+
+    def op():
+        rng = random.Random(0)
+        board = RollingBoard(1)
+        for _ in range(60):
+            board.play(rng.choice(board.legal_moves()))
+            if board.winner:
+                break
+    return op
+
+
+# --- 탐색 ---
+def make_mcts():
+    from mcts import MCTS
+    board = _random_positions(1, seed=1)[0]
+    search = MCTS(seed=0)
+
+    def op():
+        search.clear()
+        search.rng.seed(0)
+        search.search(board, iterations=MCTS_ITERATIONS)
+    return op
+
+
+def make_tablebase_probe():
+    from tablebase import load_tablebase
+    table = load_tablebase()
+    next_board = _cycle(_random_positions(POSITION_COUNT))
+    return lambda: table.best_move(next_board())
+
+
+# --- 그리기 ---
+def _session_and_renderer():
+    """게임과 같은 설정의 세션과, 화면 밖 Surface 에 그리는 렌더러를 만듭니다."""
+    import pygame
+    from renderer import BoardRenderer, load_fonts
+    from rolling_engine import board_geometry
+    from ttt_core import GameSession
+    game = importlib.import_module('Tic-Tac-Toe')
+    open_display((game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+    font, button_font, _ = load_fonts()
+    geometry = board_geometry(game.BOARD_ROWS, game.BOARD_COLS, game.WIN_LENGTH, game.MAX_PIECES)
+    button_rect = pygame.Rect(game.SCREEN_WIDTH // 2 - 125, game.SCREEN_HEIGHT // 2 - 25, 250, 60)
+    surface = pygame.Surface((game.SCREEN_WIDTH, game.SCREEN_HEIGHT)).convert()
+    renderer = BoardRenderer(surface, geometry, game.CELL_SIZE, game.HEADER_HEIGHT, font, button_font, button_rect)
+
+    session = GameSession(geometry, rng=random.Random(0))
+    for cell in (0, 4, 8, 2, 6):
+        session.apply_move(cell)
+    return session, renderer
+
+
+def make_full_frame():
+    """격자, 말, 상단 문구를 모두 다시 그리는 시간"""
+    session, renderer = _session_and_renderer()
+    message = session.status_message()
+
+    def op():
+        renderer.draw_grid()
+        renderer.draw_markers(session.engine)
+        renderer.draw_ui_elements(message, False)
+    return op
+
+
+def make_resize(size):
+    """창 크기가 바뀐 뒤 폰트, 격자, 말 Surface 를 새 셀 크기로 다시 만드는 시간"""
+    import pygame
+    from renderer import screen_layout
+    _, renderer = _session_and_renderer()
+    surface = pygame.Surface(size).convert()
+    return lambda: renderer.resize(surface, *screen_layout(size, renderer.geometry))
+
+
+def make_dirty_frame():
+    """한 수를 두고 무르기를 번갈아 하며 바뀐 영역만 다시 그리는 시간 (깜빡임은 말이 숨는 단계로 고정)"""
+    session, renderer = _session_and_renderer()
+    engine = session.engine
+    cell = engine.legal_moves()[0]
+    state = {'played': False}
+
+    def op():
+        if state['played']:
+            engine.undo()
+        else:
+            engine.play(cell)
+        state['played'] = not state['played']
+        renderer.render(engine, session.status_message(), now=0)
+    return op
+
+
+def benchmarks():
+    """틱택토 벤치마크 목록을 반환합니다. 테이블베이스 파일이 없으면 테이블베이스 항목은 뺍니다."""
+    from tablebase import DEFAULT_PATH
+    items = [
+        Benchmark('ttt.rules.play_undo', make_play_undo),
+        Benchmark('ttt.rules.legal_moves', make_legal_moves),
+        Benchmark('ttt.rules.random_game', make_random_game),
+        Benchmark(f'ttt.solver.mcts[iterations={MCTS_ITERATIONS}]', make_mcts),
+    ]
+    if os.path.exists(DEFAULT_PATH):
+        items.append(Benchmark('ttt.solver.tablebase_best_move', make_tablebase_probe))
+    items += [
+        Benchmark('ttt.frame.full', make_full_frame),
+        Benchmark('ttt.frame.dirty', make_dirty_frame),
+        Benchmark('ttt.resize[size=1920x1080]', lambda: make_resize((1920, 1080))),
+    ]
+    return items
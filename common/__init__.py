@@ -0,0 +1 @@
+"""두 게임(하노이의 탑, 순환 틱택토)이 함께 쓰는 모듈 모음."""
@@ -0,0 +1,134 @@
+"""크기를 바꿀 수 있는 게임 창과 배율 도구.
+
+게임은 기준 화면 크기(하노이 800×600, 틱택토 600×700)로 배치를 정해 두고, 실제 창 크기에 맞춘
+배율(layout_scale)로 좌표, 글자, 미리 그린 Surface 를 다시 만듭니다. 창 가장자리를 끄는 동안에는
+VIDEORESIZE 가 연달아 들어오므로 ResizeDebouncer 로 크기가 잠깐 멈출 때까지 모았다가 한 번만 다시
+만들고, 그동안에는 새 창을 단색으로만 채웁니다.
+
+    resizer = ResizeDebouncer(BG_COLOR)
+    for event in scheduler.wait():
+        if resizer.handle_event(event):
+            continue
+    size = resizer.poll()
+    if size is not None:
+        screen = apply_window_size(size)
+        ... 배치와 캐시 Surface 다시 만들기 ...
+    scheduler.wake_in(resizer.remaining())
+
+배경 그라데이션은 NumPy 가 있으면 surfarray 로 한 번에 채우고, 없으면 줄마다 채웁니다.
+"""
+import os
+import sys
+
+import pygame
+
+UI_SCALE_ENV = 'GAME_UI_SCALE'   # 화면 배율을 직접 정하는 환경 변수 (예: 1.5)
+RESIZE_DEBOUNCE = 150            # 창 크기가 이 시간(ms) 동안 그대로면 배치를 다시 만듦
+MIN_SCALE = 0.4                  # 창을 아주 작게 줄여도 글자와 원반이 사라지지 않도록 하는 최소 배율
+SCREEN_MARGIN = 0.9              # 처음 여는 창이 차지할 수 있는 최대 바탕 화면 비율
+
+
+def dpi_scale():
+    """화면 배율을 반환합니다. GAME_UI_SCALE 이 없으면 Windows 에서만 시스템 DPI(96 = 1.0)를 읽습니다.
+
+    Windows 에서는 창이 흐릿하게 늘어나지 않도록 프로세스를 DPI 인식으로 설정하므로 창을 열기 전에 불러야 합니다.
+    """
+    value = os.environ.get(UI_SCALE_ENV)
+    if value:
+        try:
+            return max(MIN_SCALE, float(value))
+        except ValueError:
+            pass
+    if sys.platform != 'win32':
+        return 1.0  # macOS 는 SDL 이 포인트 단위로 창을 열고, X11 은 믿을 만한 DPI 값이 없음
+    try:
+        import ctypes
+        ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        return ctypes.windll.user32.GetDpiForSystem() / 96
+    except (AttributeError, OSError):  # Windows 8.1 / 10 1607 이전
+        return 1.0
+
+
+def open_window(base_size):
+    """기준 크기에 화면 배율을 곱한 크기(바탕 화면보다 크면 줄임)로 크기를 바꿀 수 있는 창을 엽니다."""
+    scale = dpi_scale()
+    pygame.display.init()
+    width, height = base_size
+    desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+    scale = min(scale, SCREEN_MARGIN * desktop_width / width, SCREEN_MARGIN * desktop_height / height)
+    return pygame.display.set_mode((round(width * scale), round(height * scale)), pygame.RESIZABLE)
+
+
+def apply_window_size(size):
+    """화면 Surface 를 반환합니다. 드라이버가 창 크기에 맞춰 바꿔 주지 않았으면 (더미 드라이버 등) 직접 바꿉니다."""
+    screen = pygame.display.get_surface()
+    if screen.get_size() != tuple(size):
+        screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+    return screen
+
+
+def layout_scale(size, base_size):
+    """기준 화면 base_size 를 가로세로 비율 그대로 창 크기 size 안에 맞추는 배율을 반환합니다."""
+    return max(MIN_SCALE, min(size[0] / base_size[0], size[1] / base_size[1]))
+
+
+def vertical_gradient(size, top, bottom):
+    """위쪽 top 색에서 아래쪽 bottom 색으로 바뀌는 세로 그라데이션 Surface 를 만듭니다."""
+    width, height = size
+    screen = pygame.display.get_surface()
+    surface = pygame.Surface(size, 0, screen) if screen is not None else pygame.Surface(size)  # 화면과 같은 픽셀 형식
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is None:
+        for y in range(height):
+            surface.fill([int(top[i] + (bottom[i] - top[i]) * y / height) for i in range(3)], (0, y, width, 1))
+        return surface
+
+    # 줄마다의 색을 픽셀 값으로 바꾼 뒤 모든 열에 한 번에 복사 (열 방향으로는 복사 없이 늘린 배열을 넘김)
+    ramp = np.arange(height)[:, None] * (np.array(bottom) - np.array(top)) / height + np.array(top)
+    column = pygame.surfarray.map_array(surface, ramp.astype(np.uint8))
+    pygame.surfarray.blit_array(surface, np.broadcast_to(column, (width, height)))
+    return surface
+
+
+class ResizeDebouncer:
+    """연달아 들어오는 VIDEORESIZE 를 모았다가 크기가 멈추면 새 크기를 한 번만 알려 주는 클래스"""
+
+    def __init__(self, placeholder_color, delay=RESIZE_DEBOUNCE):
+        """크기가 바뀌는 동안 창을 채울 색과, 크기가 멈췄다고 볼 시간(ms)을 받습니다."""
+        self.placeholder_color = placeholder_color
+        self.delay = delay
+        self.size = None   # 배치에 아직 반영하지 않은 창 크기
+        self._due = 0      # size 를 반영할 시각 (pygame.time.get_ticks 기준 ms)
+
+    @property
+    def pending(self):
+        """반영하지 않은 크기 변경이 있는지 여부 (있으면 게임은 화면을 그리지 않음)"""
+        return self.size is not None
+
+    def handle_event(self, event):
+        """창 크기 변경이면 새 크기를 기억하고 창을 단색으로 채운 뒤 True 를 반환합니다."""
+        if event.type != pygame.VIDEORESIZE:
+            return False
+        self.size = event.size
+        self._due = pygame.time.get_ticks() + self.delay
+        screen = pygame.display.get_surface()
+        if screen is not None:
+            screen.fill(self.placeholder_color)
+            pygame.display.flip()
+        return True
+
+    def remaining(self):
+        """새 크기를 반영할 때까지 남은 시간(ms)을 반환합니다. 기다리는 변경이 없으면 None 입니다."""
+        if self.size is None:
+            return None
+        return max(0, self._due - pygame.time.get_ticks())
+
+    def poll(self):
+        """크기가 delay 동안 그대로였으면 새 크기를 반환하고 기다림을 끝냅니다. 아니면 None 입니다."""
+        if self.size is None or pygame.time.get_ticks() < self._due:
+            return None
+        size, self.size = self.size, None
+        return size
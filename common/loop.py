@@ -0,0 +1,84 @@
+"""두 게임이 함께 쓰는 메인 루프 스케줄러.
+
+할 일이 없을 때는 pygame.event.wait 로 입력이나 예약한 시각까지 잠들어 있다가, 깨어날 때마다 게임
+루프가 한 프레임을 처리합니다. 원반을 끌거나 애니메이션이 진행 중일 때만 목표 FPS 로 프레임을 돌립니다.
+예약과 요청은 한 프레임에만 유효하므로 게임 루프는 프레임마다 다음에 깨어날 이유를 다시 알려 줍니다.
+
+    scheduler = FrameScheduler(FPS, profiler)
+    while running:
+        for event in scheduler.wait():   # 다음 프레임까지 기다리고 그동안 들어온 이벤트를 받음
+            ...
+        ... 상태 갱신, 바뀐 부분만 그리기 ...
+        if dragging:
+            scheduler.request_frame()    # 연속으로 움직이는 동안은 목표 FPS 로 바로 다음 프레임
+        scheduler.wake_in(delay_ms)      # 다음에 화면이 바뀔 때까지 남은 시간 (깜빡임 등, None 이면 무시)
+
+다른 스레드(컴퓨터 플레이어의 탐색 등)는 notify() 로 잠든 루프를 깨울 수 있습니다.
+"""
+import time
+from contextlib import nullcontext
+
+import pygame
+
+from common.profiler import IDLE
+
+MAX_IDLE_WAIT = 1000                    # 예약이 없어도 이 시간(ms)마다 한 번은 깨어남 (알리지 않은 변화 대비)
+WAKE_EVENT = pygame.event.custom_type()  # notify() 가 보내는 이벤트 (wait 가 걸러 내므로 게임에는 전달되지 않음)
+
+_NULL_PHASE = nullcontext()
+
+
+class FrameScheduler:
+    """입력, 예약 시각, 연속 애니메이션에 맞춰 다음 프레임까지 기다리는 클래스"""
+
+    def __init__(self, fps=60, profiler=None, max_idle_wait=MAX_IDLE_WAIT):
+        """목표 FPS, 기다린 시간을 잴 프로파일러, 예약이 없을 때 최대로 잠들 시간(ms)을 받습니다."""
+        self.fps = fps
+        self.profiler = profiler
+        self.max_idle_wait = max_idle_wait
+        self.clock = pygame.time.Clock()
+        self.frame_time = 0.0    # 직전 프레임부터 이번 프레임까지 흐른 시간 (초)
+        self.wakeups = 0         # 처리한 프레임 수
+        self._frame_requested = True  # 첫 프레임은 바로 그림
+        self._wake_at = None     # 다음 예약 시각 (pygame.time.get_ticks 기준 ms)
+        self._last_frame = time.perf_counter()
+
+    # --- 다음 프레임 예약 ---
+    def request_frame(self):
+        """잠들지 않고 목표 FPS 간격으로 바로 다음 프레임을 돌립니다. 끌기나 애니메이션 중에 프레임마다 부릅니다."""
+        self._frame_requested = True
+
+    def wake_in(self, delay):
+        """delay ms 뒤에 깨어나도록 예약합니다. 여러 번 부르면 가장 이른 시각이 남고, None 이면 무시합니다."""
+        if delay is None:
+            return
+        wake_at = pygame.time.get_ticks() + max(0, int(delay))
+        if self._wake_at is None or wake_at < self._wake_at:
+            self._wake_at = wake_at
+
+    def notify(self):
+        """잠든 루프를 깨웁니다. 다른 스레드에서 불러도 됩니다."""
+        pygame.event.post(pygame.event.Event(WAKE_EVENT))
+
+    # --- 기다리기 ---
+    def wait(self):
+        """다음 프레임까지 기다린 뒤 그동안 들어온 이벤트 목록을 반환합니다."""
+        with self.profiler.phase(IDLE) if self.profiler is not None else _NULL_PHASE:
+            # 입력이 몰려도 목표 FPS 보다 자주 돌지 않음 (오래 잠들었다 깨어난 뒤에는 기다리지 않음)
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+            if not events and not self._frame_requested:
+                timeout = self.max_idle_wait
+                if self._wake_at is not None:
+                    timeout = min(timeout, self._wake_at - pygame.time.get_ticks())
+                if timeout > 0:
+                    event = pygame.event.wait(timeout)
+                    if event.type != pygame.NOEVENT:
+                        events = [event] + pygame.event.get()
+        self._frame_requested = False
+        self._wake_at = None
+        now = time.perf_counter()
+        self.frame_time = now - self._last_frame
+        self._last_frame = now
+        self.wakeups += 1
+        return [event for event in events if event.type != WAKE_EVENT]
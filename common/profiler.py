@@ -0,0 +1,208 @@
+"""게임 루프의 프레임 구간별 시간 측정.
+
+게임 루프는 구간(이벤트 처리, 그리기 단계, 화면 반영 등)을 `with profiler.phase('이름'):` 으로
+감싸고, 프레임이 끝날 때마다 end_frame() 을 부릅니다. 구간별로 프레임마다 걸린 시간을 고정 크기
+링 버퍼에 보관하므로 메모리는 늘지 않고, 백분위수(p50/p95/p99)는 요청할 때만 계산합니다.
+
+꺼져 있을 때 phase() 는 아무 일도 하지 않는 공용 컨텍스트를 돌려주므로 비용이 거의 없습니다.
+pygame 을 가져오지 않으므로 서버나 벤치마크에서도 쓸 수 있으며, 화면 표시는 profiler_overlay 가 맡습니다.
+
+내보내기 파일은 확장자로 형식을 정합니다.
+    .json : 내보낼 때마다 최근 구간 통계로 덮어씀
+    .csv  : 내보낼 때마다 시각과 함께 한 줄씩 덧붙여 시간에 따른 변화를 남김
+"""
+import csv
+import json
+import os
+import time
+from array import array
+from contextlib import nullcontext
+
+DEFAULT_CAPACITY = 600     # 구간별로 보관할 최근 프레임 수 (60 FPS 에서 10초)
+EXPORT_INTERVAL = 10.0     # 주기적으로 내보내는 간격 (초)
+PROFILE_ENV = 'GAME_PROFILE'  # 이 환경 변수에 파일 경로를 주면 처음부터 측정하고 그 파일로 내보냄
+FRAME = 'frame'            # 프레임 사이 전체 시간 (end_frame 호출 간격)
+IDLE = 'idle'              # 프레임 제한으로 기다린 시간 (게임 루프가 이 이름으로 잼)
+PERCENTILES = (50, 95, 99)
+CSV_FIELDS = ('time', 'phase', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms')
+
+_NULL_PHASE = nullcontext()
+
+
+class RingBuffer:
+    """최근 capacity 개의 값만 보관하는 고정 크기 버퍼"""
+
+    def __init__(self, capacity):
+        self._values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self.count = 0  # 보관 중인 값 개수 (최대 capacity)
+
+    def add(self, value):
+        values = self._values
+        values[self._next] = value
+        self._next = (self._next + 1) % len(values)
+        if self.count < len(values):
+            self.count += 1
+
+    def values(self):
+        """보관 중인 값을 오래된 순서로 반환합니다."""
+        if self.count < len(self._values):
+            return self._values[:self.count].tolist()
+        return (self._values[self._next:] + self._values[:self._next]).tolist()
+
+    def clear(self):
+        self._next = 0
+        self.count = 0
+
+
+def percentile(sorted_values, q):
+    """정렬된 값 목록의 q 백분위수를 반환합니다 (최근접 순위 방식)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-q * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class _Phase:
+    """구간 하나의 시간을 재서 현재 프레임 합계에 더하는 컨텍스트 (구간 이름마다 하나를 재사용)"""
+    __slots__ = ('totals', 'name', 'started')
+
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        totals = self.totals
+        totals[self.name] = totals.get(self.name, 0.0) + time.perf_counter() - self.started
+        return False
+
+
+class FrameProfiler:
+    """프레임마다 구간별 시간을 모아 링 버퍼에 보관하고 통계를 내보내는 클래스"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, enabled=False, export_path=None, export_interval=EXPORT_INTERVAL):
+        """보관할 프레임 수와 내보낼 파일(None 이면 내보내지 않음)을 받습니다. 내보낼 파일이 있으면 바로 켭니다."""
+        self.capacity = capacity
+        self.export_path = export_path
+        self.export_interval = export_interval
+        self.buffers = {}    # 구간 이름 -> RingBuffer (처음 나온 순서 유지)
+        self.frames = 0
+        self._totals = {}    # 현재 프레임의 구간별 합계 (초)
+        self._phases = {}
+        self._last_frame = None
+        self._last_export = time.perf_counter()
+        self._enabled = False
+        self.enabled = enabled or export_path is not None
+
+    @classmethod
+    def from_env(cls, **options):
+        """PROFILE_ENV 환경 변수에 내보낼 파일이 있으면 그 파일로 내보내는 프로파일러를 만듭니다."""
+        return cls(export_path=os.environ.get(PROFILE_ENV) or None, **options)
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        value = bool(value)
+        if value != self._enabled:
+            # 꺼져 있던 시간이 프레임 시간으로 잡히지 않도록 다음 프레임부터 다시 잼
+            self._totals.clear()
+            self._last_frame = None
+            self._enabled = value
+
+    # --- 측정 ---
+    def phase(self, name):
+        """with 문으로 감싼 구간의 시간을 현재 프레임의 name 구간에 더하는 컨텍스트를 반환합니다."""
+        if not self._enabled:
+            return _NULL_PHASE
+        timer = self._phases.get(name)
+        if timer is None:
+            timer = self._phases[name] = _Phase(self._totals, name)
+        return timer
+
+    def add(self, name, seconds):
+        """직접 잰 시간을 현재 프레임의 name 구간에 더합니다."""
+        if self._enabled:
+            self._totals[name] = self._totals.get(name, 0.0) + seconds
+
+    def end_frame(self):
+        """현재 프레임의 구간별 합계를 버퍼에 넣고, 때가 되면 파일로 내보냅니다."""
+        if not self._enabled:
+            return
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self._buffer(FRAME).add(now - self._last_frame)
+        self._last_frame = now
+        for name, seconds in self._totals.items():
+            self._buffer(name).add(seconds)
+        self._totals.clear()
+        self.frames += 1
+
+        if self.export_path is not None and now - self._last_export >= self.export_interval:
+            self._last_export = now
+            self.export()
+
+    def _buffer(self, name):
+        buffer = self.buffers.get(name)
+        if buffer is None:
+            buffer = self.buffers[name] = RingBuffer(self.capacity)
+        return buffer
+
+    def reset(self):
+        """보관한 측정값을 모두 지웁니다."""
+        for buffer in self.buffers.values():
+            buffer.clear()
+        self._totals.clear()
+        self._last_frame = None
+        self.frames = 0
+
+    # --- 통계 ---
+    def stats(self):
+        """구간 이름 -> {'count', 'mean', 'p50', 'p95', 'p99', 'max'} (밀리초) 를 반환합니다."""
+        result = {}
+        for name, buffer in self.buffers.items():
+            values = sorted(buffer.values())
+            if not values:
+                continue
+            row = {'count': len(values), 'mean': sum(values) / len(values) * 1000}
+            for q in PERCENTILES:
+                row[f'p{q}'] = percentile(values, q) * 1000
+            row['max'] = values[-1] * 1000
+            result[name] = row
+        return result
+
+    def export(self, path=None):
+        """현재 통계를 path(기본: export_path)에 내보냅니다. 확장자가 .csv 면 덧붙이고, 아니면 JSON 으로 덮어씁니다."""
+        path = path or self.export_path
+        if path is None:
+            raise ValueError("no export path")
+        stats = self.stats()
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S')
+        if path.lower().endswith('.csv'):
+            is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if is_new:
+                    writer.writerow(CSV_FIELDS)
+                for name, row in stats.items():
+                    writer.writerow([stamp, name, row['count']] +
+                                    [f"{row[key]:.3f}" for key in ('mean', 'p50', 'p95', 'p99', 'max')])
+        else:
+            data = {'time': stamp, 'frames': self.frames, 'capacity': self.capacity, 'phases': stats}
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록 바꿔치기
+        return path
+
+    def close(self):
+        """내보낼 파일이 있으면 마지막 통계를 내보냅니다."""
+        if self.export_path is not None and self.frames:
+            self.export()
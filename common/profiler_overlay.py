@@ -0,0 +1,121 @@
+"""FrameProfiler 통계를 화면 구석에 표시하는 오버레이 (F3 으로 켜고 끔).
+
+게임 렌더러는 바뀐 영역만 다시 그리므로, 오버레이는 그리기 전에 가릴 영역을 복사해 두었다가
+다음 프레임에 게임이 그리기 전에 restore() 로 되돌려 놓습니다. 순서는 다음과 같습니다.
+
+    dirty = [overlay.restore(screen)]   # 게임 화면을 오버레이가 없던 상태로 되돌림
+    ... 게임 그리기 ...
+    dirty.append(overlay.draw(screen))  # 가릴 영역을 보관하고 오버레이를 그림
+"""
+import time
+
+import pygame
+
+from common.profiler import FRAME, IDLE
+
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4          # 내보낼 파일이 있을 때 바로 내보내기
+REFRESH_INTERVAL = 0.5            # 표 내용을 다시 만드는 간격 (초)
+FONT_SIZE = 18
+PADDING = 6
+PANEL_COLOR = (0, 0, 0, 180)
+TEXT_COLOR = (235, 235, 235)
+WARN_COLOR = (255, 170, 60)        # p95 가 목표 프레임 시간을 넘는 구간 (기다린 시간 제외)
+
+
+class ProfilerOverlay:
+    """프로파일러의 구간별 p50/p95/p99 표를 반투명 패널로 그리는 클래스"""
+
+    def __init__(self, profiler, topleft=(8, 8), target_fps=60, font=None):
+        """표시할 프로파일러, 패널 위치, 경고 기준으로 쓸 목표 FPS 를 받습니다."""
+        self.profiler = profiler
+        self.topleft = topleft
+        self.frame_budget = 1000 / target_fps  # 밀리초
+        self.font = font
+        self.visible = False
+        self._panel = None
+        self._rendered_at = 0.0
+        self._under = None  # (가린 영역 Rect, 그 영역의 원래 화면)
+
+    def toggle(self):
+        """오버레이를 켜고 끕니다. 내보낼 파일이 없으면 측정도 오버레이가 보일 때만 합니다."""
+        self.visible = not self.visible
+        self.profiler.enabled = self.visible or self.profiler.export_path is not None
+        self._panel = None
+
+    def handle_event(self, event):
+        """오버레이 단축키면 처리하고 True 를 반환합니다."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == TOGGLE_KEY:
+            self.toggle()
+            return True
+        if event.key == EXPORT_KEY and self.profiler.export_path is not None:
+            self.profiler.export()
+            return True
+        return False
+
+    def next_refresh(self):
+        """표 내용을 다시 만들 때까지 남은 시간(ms)을 반환합니다. 보이지 않으면 None 입니다."""
+        if not self.visible:
+            return None
+        return max(0.0, REFRESH_INTERVAL - (time.perf_counter() - self._rendered_at)) * 1000
+
+    def restore(self, screen):
+        """지난 프레임에 오버레이가 가린 영역을 되돌리고 그 영역을 반환합니다. 가린 적이 없으면 None 입니다."""
+        if self._under is None:
+            return None
+        rect, under = self._under
+        screen.blit(under, rect)
+        self._under = None
+        return rect
+
+    def draw(self, screen):
+        """오버레이를 그리고 그린 영역을 반환합니다. 보이지 않으면 None 입니다."""
+        if not self.visible:
+            return None
+        with self.profiler.phase('overlay'):
+            now = time.perf_counter()
+            if self._panel is None or now - self._rendered_at >= REFRESH_INTERVAL:
+                self._panel = self._render_panel()
+                self._rendered_at = now
+            rect = self._panel.get_rect(topleft=self.topleft).clip(screen.get_rect())
+            self._under = (rect, screen.subsurface(rect).copy())
+            screen.blit(self._panel, rect)
+        return rect
+
+    def _render_panel(self):
+        if self.font is None:
+            self.font = pygame.font.Font(None, FONT_SIZE)
+        stats = self.profiler.stats()
+        frame = stats.get(FRAME)
+        fps = 1000 / frame['p50'] if frame and frame['p50'] > 0 else 0.0
+
+        lines = [self.font.render(f"{fps:.0f} fps, {self.profiler.frames} frames (ms)", True, TEXT_COLOR),
+                 self._render_row(('phase', 'p50', 'p95', 'p99'), TEXT_COLOR)]
+        for name, row in stats.items():
+            color = WARN_COLOR if name not in (FRAME, IDLE) and row['p95'] > self.frame_budget else TEXT_COLOR
+            cells = (name, *(f"{row[key]:.2f}" for key in ('p50', 'p95', 'p99')))
+            lines.append(self._render_row(cells, color))
+
+        width = max(line.get_width() for line in lines) + 2 * PADDING
+        height = sum(line.get_height() for line in lines) + 2 * PADDING
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(PANEL_COLOR)
+        y = PADDING
+        for line in lines:
+            panel.blit(line, (PADDING, y))
+            y += line.get_height()
+        return panel
+
+    def _render_row(self, cells, color):
+        """(이름, 값...) 한 줄을 그립니다. 기본 폰트는 고정폭이 아니므로 값은 열마다 오른쪽 정렬합니다."""
+        name_width = self.font.size('W' * 8)[0]
+        column_width = self.font.size('0000.00')[0]
+        row = pygame.Surface((name_width + column_width * (len(cells) - 1), self.font.get_linesize()),
+                             pygame.SRCALPHA)
+        row.blit(self.font.render(cells[0], True, color), (0, 0))
+        for i, cell in enumerate(cells[1:], 1):
+            text = self.font.render(cell, True, color)
+            row.blit(text, text.get_rect(topright=(name_width + i * column_width, 0)))
+        return row
@@ -0,0 +1,264 @@
+"""게임 기록(리플레이) 파일 쓰기와 읽기.
+
+게임 세션 하나가 파일 하나이며, 파일은 뒤에 덧붙이기만 합니다.
+
+    헤더:  MAGIC, 버전, 수 하나의 비트 수, 정보 JSON 길이, 정보 JSON (게임 종류와 설정)
+    블록:  시작 수 번호, 수 개수, 키프레임 길이, 키프레임, 비트로 묶은 수들
+
+키프레임은 블록의 시작 수까지 둔 뒤의 상태이므로, 임의의 수로 이동할 때는 그 수가 속한 블록
+하나만 읽으면 됩니다. 블록 위치는 옆의 .idx 파일에 (시작 수 번호, 파일 위치) 고정 길이 레코드로
+저장하고, 읽을 때 두 파일을 메모리 맵으로 열어 이진 탐색합니다(O(log n)). 게임 루프는 수를
+버퍼에 모으기만 하고 파일 쓰기는 백그라운드 스레드가 맡습니다.
+"""
+import atexit
+import bisect
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import weakref
+
+MAGIC = b'RPLY'
+VERSION = 1
+HEADER = struct.Struct('<4sHBxI')  # magic, version, 수 하나의 비트 수, 정보 JSON 길이
+BLOCK = struct.Struct('<QHH')      # 시작 수 번호, 수 개수, 키프레임 길이
+INDEX = struct.Struct('<QQ')       # 시작 수 번호, 블록의 파일 위치
+KEYFRAME_INTERVAL = 256            # 블록 하나에 담는 최대 수 (키프레임 간격)
+EXTENSION = '.rpl'
+
+_open_writers = weakref.WeakSet()  # 쓰기 스레드가 아직 살아 있을 수 있는 기록 (프로그램이 끝날 때 마저 씀)
+
+
+def index_path(path):
+    """리플레이 파일의 블록 색인 파일 경로를 반환합니다."""
+    return path + '.idx'
+
+
+def new_replay_path(directory, prefix):
+    """directory 안에 시각으로 이름을 붙인 새 리플레이 파일 경로를 만듭니다."""
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    return os.path.join(directory, f'{prefix}-{stamp}-{time.time_ns() % 10**9:09d}{EXTENSION}')
+
+
+def pack_moves(moves, bits):
+    """수 목록을 수마다 bits 비트씩(첫 수가 최하위 비트) 묶은 bytes 로 바꿉니다."""
+    packed = 0
+    for i, move in enumerate(moves):
+        packed |= move << (i * bits)
+    return packed.to_bytes((len(moves) * bits + 7) // 8, 'little')
+
+
+def unpack_moves(data, count, bits):
+    """pack_moves 로 묶은 bytes 에서 수 count 개를 꺼냅니다."""
+    packed = int.from_bytes(data, 'little')
+    mask = (1 << bits) - 1
+    return [(packed >> (i * bits)) & mask for i in range(count)]
+
+
+# --- 쓰기 ---
+class ReplayWriter:
+    """수를 버퍼에 모았다가 블록 단위로 백그라운드 스레드에서 파일에 쓰는 클래스"""
+
+    def __init__(self, path, info, move_bits, keyframe, keyframe_interval=KEYFRAME_INTERVAL):
+        """파일 경로, 게임 정보(dict), 수 하나의 비트 수, 첫 수를 두기 전 상태(bytes)를 받아 기록을 시작합니다."""
+        if not 1 <= keyframe_interval <= 0xFFFF:
+            raise ValueError("keyframe_interval must be in 1..65535")
+        self.path = path
+        self.move_bits = move_bits
+        self.keyframe_interval = keyframe_interval
+        self.move_count = 0
+        self._start = 0
+        self._keyframe = bytes(keyframe)
+        self._moves = []
+        self._blocks = 0
+        self._closed = False
+
+        info_bytes = json.dumps(info, ensure_ascii=False).encode()
+        header = HEADER.pack(MAGIC, VERSION, move_bits, len(info_bytes)) + info_bytes
+        self._queue = queue.SimpleQueue()
+        # 닫지 않은 기록이 종료를 막지 않도록 데몬 스레드로 두고, 남은 블록은 _close_all 이 종료 전에 씀
+        self._thread = threading.Thread(target=self._run, args=(header,), name='replay-writer', daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    def record(self, move, snapshot):
+        """수를 기록합니다. 블록이 가득 차면 snapshot() 으로 이 수를 둔 뒤의 상태를 받아 다음 키프레임으로 씁니다."""
+        if self._closed:
+            raise ValueError("replay is closed")
+        if not 0 <= move < 1 << self.move_bits:
+            raise ValueError(f"move {move} does not fit in {self.move_bits} bits")
+        self._moves.append(move)
+        self.move_count += 1
+        if len(self._moves) >= self.keyframe_interval:
+            self._seal()
+            self._keyframe = bytes(snapshot())
+
+    def _seal(self):
+        """모은 수를 블록으로 만들어 쓰기 스레드로 넘깁니다."""
+        block = (BLOCK.pack(self._start, len(self._moves), len(self._keyframe))
+                 + self._keyframe + pack_moves(self._moves, self.move_bits))
+        self._queue.put((self._start, block))
+        self._start = self.move_count
+        self._moves = []
+        self._blocks += 1
+
+    def close(self, wait=False):
+        """남은 수를 마지막 블록으로 넘기고 기록을 끝냅니다. wait 이면 파일에 다 쓸 때까지 기다립니다."""
+        if not self._closed:
+            if self._moves or not self._blocks:
+                self._seal()
+            self._queue.put(None)
+            self._closed = True
+        if wait:
+            self._thread.join()
+
+    def _run(self, header):
+        with open(self.path, 'wb') as data, open(index_path(self.path), 'wb') as index:
+            data.write(header)
+            offset = len(header)
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                start, block = item
+                data.write(block)
+                index.write(INDEX.pack(start, offset))
+                offset += len(block)
+                if self._queue.empty():
+                    # 색인이 가리키는 블록이 항상 먼저 디스크에 있도록 데이터부터 내보냄
+                    data.flush()
+                    index.flush()
+
+
+@atexit.register
+def _close_all():
+    """프로그램이 끝날 때 남은 기록을 모두 닫고 파일에 다 쓸 때까지 기다립니다."""
+    for writer in list(_open_writers):
+        writer.close(wait=True)
+
+
+# --- 읽기 ---
+class _IndexColumn:
+    """메모리 맵으로 연 색인 파일의 한 열을 bisect 로 탐색할 수 있는 시퀀스로 보여주는 클래스"""
+
+    def __init__(self, buffer, count, field):
+        self._buffer = buffer
+        self._count = count
+        self._field = field
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return INDEX.unpack_from(self._buffer, i * INDEX.size)[self._field]
+
+
+class ReplayReader:
+    """리플레이 파일을 메모리 맵으로 열고 임의의 수 위치로 이동하는 클래스"""
+
+    def __init__(self, path):
+        """리플레이 파일과 색인을 엽니다. 색인이 없거나 불완전하면 블록을 훑어 다시 만듭니다."""
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not a replay file")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.move_bits, info_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compatible replay file")
+        self.info = json.loads(self._mm[HEADER.size:HEADER.size + info_len])
+        self._first_block = HEADER.size + info_len
+        self._index_mm = None
+        self._load_index()
+
+    def _load_index(self):
+        path = index_path(self.path)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        count = size // INDEX.size
+        if count:
+            with open(path, 'rb') as f:
+                index_mm = mmap.mmap(f.fileno(), count * INDEX.size, access=mmap.ACCESS_READ)
+            offsets = _IndexColumn(index_mm, count, 1)
+            last = offsets[count - 1]
+            if last + BLOCK.size <= len(self._mm) and self._block_end(last) == len(self._mm):
+                self._index_mm = index_mm
+                self._starts = _IndexColumn(index_mm, count, 0)
+                self._offsets = offsets
+                return
+            index_mm.close()
+
+        # 색인이 데이터와 맞지 않으면(기록 중 종료 등) 블록 헤더를 차례로 읽어 메모리에 색인을 만듦
+        self._starts, self._offsets = [], []
+        offset = self._first_block
+        while offset + BLOCK.size <= len(self._mm):
+            end = self._block_end(offset)
+            if end > len(self._mm):
+                break
+            self._starts.append(BLOCK.unpack_from(self._mm, offset)[0])
+            self._offsets.append(offset)
+            offset = end
+
+    def _block_end(self, offset):
+        _, count, keyframe_len = BLOCK.unpack_from(self._mm, offset)
+        return offset + BLOCK.size + keyframe_len + (count * self.move_bits + 7) // 8
+
+    def _read_block(self, i):
+        """i번째 블록의 (시작 수 번호, 키프레임, 수 목록) 을 반환합니다."""
+        offset = self._offsets[i]
+        start, count, keyframe_len = BLOCK.unpack_from(self._mm, offset)
+        offset += BLOCK.size
+        keyframe = self._mm[offset:offset + keyframe_len]
+        offset += keyframe_len
+        moves = unpack_moves(self._mm[offset:offset + (count * self.move_bits + 7) // 8], count, self.move_bits)
+        return start, keyframe, moves
+
+    def __len__(self):
+        """기록된 전체 수의 개수를 반환합니다."""
+        if not self._offsets:
+            return 0
+        last = len(self._offsets) - 1
+        return self._starts[last] + BLOCK.unpack_from(self._mm, self._offsets[last])[1]
+
+    def seek(self, k):
+        """k수를 둔 뒤 상태를 만들 수 있도록 (키프레임, 키프레임 뒤부터 k번째까지의 수 목록) 을 반환합니다."""
+        if not self._offsets:
+            raise ValueError(f"{self.path} has no recorded blocks")
+        if not 0 <= k <= len(self):
+            raise IndexError(f"move {k} is out of range")
+        i = bisect.bisect_right(self._starts, k) - 1
+        start, keyframe, moves = self._read_block(i)
+        return keyframe, moves[:k - start]
+
+    def iter_moves(self, start=0, stop=None):
+        """start 번째 수 다음부터 stop 번째 수까지를 블록 단위로 읽으며 하나씩 생성합니다."""
+        stop = len(self) if stop is None else stop
+        if start >= stop:
+            return
+        i = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        while i < len(self._offsets):
+            block_start, _, moves = self._read_block(i)
+            for j, move in enumerate(moves, block_start):
+                if j >= stop:
+                    return
+                if j >= start:
+                    yield move
+            i += 1
+
+    def close(self):
+        """메모리 맵을 닫습니다."""
+        self._mm.close()
+        if self._index_mm is not None:
+            self._index_mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()